@@ -35,6 +35,7 @@ class Config:
     google_sheets_credentials_file: Path | None = None
     google_sheets_spreadsheet_id: str | None = None
     sheets_sync_interval: int = 24  # hours
+    enable_test_endpoints: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -100,4 +101,5 @@ def load_config() -> Config:
         google_sheets_credentials_file=sheets_creds_path,
         google_sheets_spreadsheet_id=os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID"),
         sheets_sync_interval=int(os.getenv("SHEETS_SYNC_INTERVAL", "24")),
+        enable_test_endpoints=os.getenv("ENABLE_TEST_ENDPOINTS", "false").lower() == "true",
     )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import aiosqlite
 from dataclasses import dataclass
 from datetime import datetime
@@ -43,7 +44,7 @@ class RipMode(Enum):
     OTHER = "other"  # Skip TMDb, use disc label, output to Other folder
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents a ripping/encoding job."""
 
@@ -74,7 +75,7 @@ class Job:
         return value
 
 
-@dataclass
+@dataclass(slots=True)
 class TVSeason:
     """Represents a TV season."""
 
@@ -86,7 +87,7 @@ class TVSeason:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """Represents a TV episode."""
 
@@ -99,7 +100,7 @@ class Episode:
     final_path: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     """Represents an item in the user's collection."""
 
@@ -112,7 +113,7 @@ class CollectionItem:
     added_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class WantedItem:
     """Represents an item in the user's wanted list."""
 
@@ -134,7 +135,7 @@ class WantedItem:
         return value
 
 
-@dataclass
+@dataclass(slots=True)
 class Setting:
     """Represents a configuration setting."""
 
@@ -143,7 +144,11 @@ class Setting:
 
 
 class Database:
-    """Async SQLite database for the DVD to Plex pipeline."""
+    """Async SQLite database for the DVD to Plex pipeline.
+
+    A single connection is opened by connect() and reused by every
+    operation until close(), so queries never pay a per-call open cost.
+    """
 
     def __init__(self, db_path: str | Path) -> None:
         """Initialize database with the given path.
@@ -153,14 +158,23 @@ class Database:
         """
         self.db_path = Path(db_path)
         self._connection: aiosqlite.Connection | None = None
+        # Held by every write from its first statement to its commit, so one
+        # caller's commit never sweeps in another caller's unfinished writes
+        self._write_lock = asyncio.Lock()
 
     async def connect(self) -> None:
-        """Open database connection and create tables if needed."""
+        """Open database connection and create tables if needed.
+
+        Does nothing if the connection is already open, so repeated calls
+        do not leak the previous connection.
+        """
+        if self._connection is not None:
+            return
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
+        await self._configure_connection()
         await self._create_tables()
         await self._run_migrations()
-        await self._create_indexes()
 
     async def close(self) -> None:
         """Close the database connection."""
@@ -191,75 +205,109 @@ class Database:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._connection
 
-    async def _create_tables(self) -> None:
-        """Create all database tables if they don't exist."""
+    async def _configure_connection(self) -> None:
+        """Apply connection pragmas.
+
+        WAL lets each commit append to the log instead of rewriting pages,
+        and synchronous=NORMAL is durable under WAL without an fsync per
+        commit. In-memory databases ignore the journal mode.
+        """
         await self.connection.executescript("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                drive_id TEXT NOT NULL,
-                disc_label TEXT NOT NULL,
-                content_type TEXT NOT NULL DEFAULT 'unknown',
-                status TEXT NOT NULL DEFAULT 'pending',
-                rip_mode TEXT NOT NULL DEFAULT 'movie',
-                identified_title TEXT,
-                identified_year INTEGER,
-                tmdb_id INTEGER,
-                confidence REAL,
-                poster_path TEXT,
-                rip_path TEXT,
-                encode_path TEXT,
-                final_path TEXT,
-                error_message TEXT,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS tv_seasons (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
-                show_title TEXT NOT NULL,
-                season_number INTEGER NOT NULL,
-                tmdb_show_id INTEGER,
-                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS episodes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                season_id INTEGER NOT NULL REFERENCES tv_seasons(id) ON DELETE CASCADE,
-                episode_number INTEGER NOT NULL,
-                title TEXT,
-                rip_path TEXT,
-                encode_path TEXT,
-                final_path TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS collection (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                year INTEGER,
-                content_type TEXT NOT NULL DEFAULT 'movie',
-                tmdb_id INTEGER,
-                file_path TEXT NOT NULL,
-                added_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS wanted (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                year INTEGER,
-                content_type TEXT NOT NULL DEFAULT 'movie',
-                tmdb_id INTEGER,
-                poster_path TEXT,
-                notes TEXT,
-                added_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            );
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
         """)
-        await self.connection.commit()
+
+    async def _create_tables(self) -> None:
+        """Create all database tables and indexes if they don't exist.
+
+        The script runs in one explicit transaction; executescript would
+        otherwise commit each statement on its own. BEGIN IMMEDIATE takes
+        the write lock up front, so another process opening the same file
+        cannot interleave its own schema changes. If any statement fails
+        the transaction is rolled back rather than left open on the shared
+        connection.
+        """
+        try:
+            await self.connection.executescript("""
+                BEGIN IMMEDIATE;
+
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    drive_id TEXT NOT NULL,
+                    disc_label TEXT NOT NULL,
+                    content_type TEXT NOT NULL DEFAULT 'unknown',
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    rip_mode TEXT NOT NULL DEFAULT 'movie',
+                    identified_title TEXT,
+                    identified_year INTEGER,
+                    tmdb_id INTEGER,
+                    confidence REAL,
+                    poster_path TEXT,
+                    rip_path TEXT,
+                    encode_path TEXT,
+                    final_path TEXT,
+                    error_message TEXT,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS tv_seasons (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+                    show_title TEXT NOT NULL,
+                    season_number INTEGER NOT NULL,
+                    tmdb_show_id INTEGER,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS episodes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    season_id INTEGER NOT NULL
+                        REFERENCES tv_seasons(id) ON DELETE CASCADE,
+                    episode_number INTEGER NOT NULL,
+                    title TEXT,
+                    rip_path TEXT,
+                    encode_path TEXT,
+                    final_path TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS collection (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    year INTEGER,
+                    content_type TEXT NOT NULL DEFAULT 'movie',
+                    tmdb_id INTEGER,
+                    file_path TEXT NOT NULL,
+                    added_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS wanted (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    year INTEGER,
+                    content_type TEXT NOT NULL DEFAULT 'movie',
+                    tmdb_id INTEGER,
+                    poster_path TEXT,
+                    notes TEXT,
+                    added_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+                CREATE INDEX IF NOT EXISTS idx_jobs_drive_id ON jobs(drive_id);
+                CREATE INDEX IF NOT EXISTS idx_jobs_drive_status
+                    ON jobs(drive_id, status);
+
+                COMMIT;
+            """)
+        except Exception:
+            await self.connection.rollback()
+            raise
 
     async def _run_migrations(self) -> None:
         """Run database migrations for schema changes."""
@@ -291,14 +339,6 @@ class Database:
             )
             await self.connection.commit()
 
-    async def _create_indexes(self) -> None:
-        """Create database indexes for common queries."""
-        await self.connection.executescript("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
-            CREATE INDEX IF NOT EXISTS idx_jobs_drive_id ON jobs(drive_id);
-        """)
-        await self.connection.commit()
-
     # Job operations
 
     async def create_job(
@@ -319,19 +359,28 @@ class Database:
         Returns:
             The created job.
         """
-        cursor = await self.connection.execute(
-            """
-            INSERT INTO jobs (drive_id, disc_label, content_type, status, rip_mode)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (drive_id, disc_label, content_type.value, JobStatus.PENDING.value, rip_mode.value),
-        )
-        await self.connection.commit()
-        job_id = cursor.lastrowid or 0
-        job = await self.get_job(job_id)
-        if job is None:
-            raise RuntimeError(f"Failed to create job {job_id}")
-        return job
+        async with self._write_lock:
+            # RETURNING hands back the stored row, defaults included, so the
+            # job does not need a second SELECT to rehydrate it
+            cursor = await self.connection.execute(
+                """
+                INSERT INTO jobs (drive_id, disc_label, content_type, status, rip_mode)
+                VALUES (?, ?, ?, ?, ?)
+                RETURNING *
+                """,
+                (
+                    drive_id,
+                    disc_label,
+                    content_type.value,
+                    JobStatus.PENDING.value,
+                    rip_mode.value,
+                ),
+            )
+            row = await cursor.fetchone()
+            await self.connection.commit()
+        if row is None:
+            raise RuntimeError(f"Failed to create job for drive {drive_id}")
+        return self._row_to_job(row)
 
     async def get_job(self, job_id: int) -> Job | None:
         """Get a job by ID.
@@ -465,19 +514,20 @@ class Database:
             rip_path: Optional path to ripped file.
             encode_path: Optional path to encoded file.
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET status = ?,
-                error_message = COALESCE(?, error_message),
-                rip_path = COALESCE(?, rip_path),
-                encode_path = COALESCE(?, encode_path),
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (status.value, error_message, rip_path, encode_path, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET status = ?,
+                    error_message = COALESCE(?, error_message),
+                    rip_path = COALESCE(?, rip_path),
+                    encode_path = COALESCE(?, encode_path),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (status.value, error_message, rip_path, encode_path, job_id),
+            )
+            await self.connection.commit()
 
     async def update_job_identification(
         self,
@@ -500,16 +550,26 @@ class Database:
             confidence: The confidence score (0.0 to 1.0).
             poster_path: The TMDb poster path (e.g., "/abc123.jpg").
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET content_type = ?, identified_title = ?, identified_year = ?,
-                tmdb_id = ?, confidence = ?, poster_path = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (content_type.value, title, year, tmdb_id, confidence, poster_path, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET content_type = ?, identified_title = ?, identified_year = ?,
+                    tmdb_id = ?, confidence = ?, poster_path = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (
+                    content_type.value,
+                    title,
+                    year,
+                    tmdb_id,
+                    confidence,
+                    poster_path,
+                    job_id,
+                ),
+            )
+            await self.connection.commit()
 
     async def update_job_rip_path(self, job_id: int, rip_path: str) -> None:
         """Update a job's rip path.
@@ -518,15 +578,16 @@ class Database:
             job_id: The job ID.
             rip_path: Path to the ripped file.
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET rip_path = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (rip_path, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET rip_path = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (rip_path, job_id),
+            )
+            await self.connection.commit()
 
     async def update_job_encode_path(self, job_id: int, encode_path: str) -> None:
         """Update a job's encode path.
@@ -535,15 +596,16 @@ class Database:
             job_id: The job ID.
             encode_path: Path to the encoded file.
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET encode_path = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (encode_path, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET encode_path = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (encode_path, job_id),
+            )
+            await self.connection.commit()
 
     async def update_job_final_path(self, job_id: int, final_path: str) -> None:
         """Update a job's final path in the Plex library.
@@ -552,15 +614,47 @@ class Database:
             job_id: The job ID.
             final_path: Path to the final file in Plex library.
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET final_path = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (final_path, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET final_path = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (final_path, job_id),
+            )
+            await self.connection.commit()
+
+    async def update_job_paths(
+        self,
+        job_id: int,
+        rip_path: str | None = None,
+        encode_path: str | None = None,
+        final_path: str | None = None,
+    ) -> None:
+        """Update several of a job's file paths in one statement.
+
+        Paths left as None keep their current value.
+
+        Args:
+            job_id: The job ID.
+            rip_path: Optional path to the ripped file.
+            encode_path: Optional path to the encoded file.
+            final_path: Optional path to the final file in Plex library.
+        """
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET rip_path = COALESCE(?, rip_path),
+                    encode_path = COALESCE(?, encode_path),
+                    final_path = COALESCE(?, final_path),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (rip_path, encode_path, final_path, job_id),
+            )
+            await self.connection.commit()
 
     async def update_job_rip_mode(self, job_id: int, rip_mode: RipMode) -> None:
         """Update a job's rip mode.
@@ -569,15 +663,16 @@ class Database:
             job_id: The job ID.
             rip_mode: The new rip mode.
         """
-        await self.connection.execute(
-            """
-            UPDATE jobs
-            SET rip_mode = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (rip_mode.value, job_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                UPDATE jobs
+                SET rip_mode = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (rip_mode.value, job_id),
+            )
+            await self.connection.commit()
 
     def _row_to_job(self, row: aiosqlite.Row) -> Job:
         """Convert a database row to a Job object."""
@@ -621,14 +716,15 @@ class Database:
         Returns:
             The ID of the created TV season.
         """
-        cursor = await self.connection.execute(
-            """
-            INSERT INTO tv_seasons (job_id, show_title, season_number, tmdb_show_id)
-            VALUES (?, ?, ?, ?)
-            """,
-            (job_id, show_title, season_number, tmdb_show_id),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                """
+                INSERT INTO tv_seasons (job_id, show_title, season_number, tmdb_show_id)
+                VALUES (?, ?, ?, ?)
+                """,
+                (job_id, show_title, season_number, tmdb_show_id),
+            )
+            await self.connection.commit()
         return cursor.lastrowid or 0
 
     async def get_tv_season(self, season_id: int) -> TVSeason | None:
@@ -699,15 +795,44 @@ class Database:
         Returns:
             The ID of the created episode.
         """
-        cursor = await self.connection.execute(
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                """
+                INSERT INTO episodes (season_id, episode_number, title)
+                VALUES (?, ?, ?)
+                """,
+                (season_id, episode_number, title),
+            )
+            await self.connection.commit()
+        return cursor.lastrowid or 0
+
+    async def create_many_episodes(
+        self,
+        season_id: int,
+        episodes: list[tuple[int, str | None]],
+    ) -> list[int]:
+        """Create several episode records for a season in a single transaction.
+
+        The episodes are inserted together or not at all: if any row fails,
+        none of them are kept.
+
+        Args:
+            season_id: The TV season ID.
+            episodes: Tuples of (episode_number, title).
+
+        Returns:
+            The IDs of the created episodes, in insertion order.
+        """
+        if not episodes:
+            return []
+
+        return await self._insert_many(
             """
             INSERT INTO episodes (season_id, episode_number, title)
             VALUES (?, ?, ?)
             """,
-            (season_id, episode_number, title),
+            [(season_id, number, title) for number, title in episodes],
         )
-        await self.connection.commit()
-        return cursor.lastrowid or 0
 
     async def get_episodes_by_season(self, season_id: int) -> list[Episode]:
         """Get all episodes for a TV season.
@@ -766,11 +891,12 @@ class Database:
 
         if updates:
             params.append(episode_id)
-            await self.connection.execute(
-                f"UPDATE episodes SET {', '.join(updates)} WHERE id = ?",
-                params,
-            )
-            await self.connection.commit()
+            async with self._write_lock:
+                await self.connection.execute(
+                    f"UPDATE episodes SET {', '.join(updates)} WHERE id = ?",
+                    params,
+                )
+                await self.connection.commit()
 
     # Collection operations
 
@@ -800,15 +926,79 @@ class Database:
         else:
             content_type_value = content_type.value
 
-        cursor = await self.connection.execute(
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                """
+                INSERT INTO collection (title, year, content_type, tmdb_id, file_path)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (title, year, content_type_value, tmdb_id, file_path),
+            )
+            await self.connection.commit()
+        return cursor.lastrowid or 0
+
+    async def add_many_to_collection(
+        self,
+        items: list[tuple[str | ContentType, str, int | None, int | None, str]],
+    ) -> list[int]:
+        """Add several items to the collection in a single transaction.
+
+        Args:
+            items: Tuples of (content_type, title, year, tmdb_id, file_path),
+                matching the arguments of add_to_collection.
+
+        Returns:
+            The IDs of the created collection items, in insertion order.
+        """
+        if not items:
+            return []
+
+        rows = [
+            (
+                title,
+                year,
+                content_type if isinstance(content_type, str) else content_type.value,
+                tmdb_id,
+                file_path,
+            )
+            for content_type, title, year, tmdb_id, file_path in items
+        ]
+        return await self._insert_many(
             """
             INSERT INTO collection (title, year, content_type, tmdb_id, file_path)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (title, year, content_type_value, tmdb_id, file_path),
+            rows,
         )
-        await self.connection.commit()
-        return cursor.lastrowid or 0
+
+    async def _insert_many(self, sql: str, rows: list[tuple[Any, ...]]) -> list[int]:
+        """Insert rows in one transaction that either commits all of them or none.
+
+        Args:
+            sql: A single-row INSERT statement.
+            rows: Parameters for each row.
+
+        Returns:
+            The ID of each inserted row, in the order given.
+        """
+        async with self._write_lock:
+            # A write that failed before its commit can leave sqlite3's
+            # implicit transaction open; nothing else can be pending in it
+            # while the lock is held, so the batch simply continues it.
+            if not self.connection.in_transaction:
+                await self.connection.execute("BEGIN")
+            try:
+                await self.connection.executemany(sql, rows)
+                cursor = await self.connection.execute("SELECT last_insert_rowid()")
+                row = await cursor.fetchone()
+                await self.connection.commit()
+            except Exception:
+                await self.connection.rollback()
+                raise
+        # No other write can run while the lock is held, so the batch's rows
+        # took the consecutive IDs ending at the last one inserted
+        last_id = row[0] if row else 0
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
     async def get_collection(self) -> list[dict[str, Any]]:
         """Get all items in the collection.
@@ -833,6 +1023,16 @@ class Database:
             for row in rows
         ]
 
+    async def count_collection(self) -> int:
+        """Count the items in the collection.
+
+        Returns:
+            Number of collection items.
+        """
+        cursor = await self.connection.execute("SELECT COUNT(*) FROM collection")
+        row = await cursor.fetchone()
+        return row[0] if row else 0
+
     async def remove_from_collection(self, item_id: int) -> bool:
         """Remove an item from the collection.
 
@@ -842,10 +1042,11 @@ class Database:
         Returns:
             True if the item was removed, False if not found.
         """
-        cursor = await self.connection.execute(
-            "DELETE FROM collection WHERE id = ?", (item_id,)
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                "DELETE FROM collection WHERE id = ?", (item_id,)
+            )
+            await self.connection.commit()
         return cursor.rowcount > 0
 
     async def get_collection_item(self, item_id: int) -> CollectionItem | None:
@@ -901,14 +1102,16 @@ class Database:
         content_type_value = (
             content_type.value if isinstance(content_type, ContentType) else content_type
         )
-        cursor = await self.connection.execute(
-            """
-            INSERT INTO wanted (title, year, content_type, tmdb_id, poster_path, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (title, year, content_type_value, tmdb_id, poster_path, notes),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                """
+                INSERT INTO wanted
+                    (title, year, content_type, tmdb_id, poster_path, notes)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (title, year, content_type_value, tmdb_id, poster_path, notes),
+            )
+            await self.connection.commit()
         return cursor.lastrowid or 0
 
     async def get_wanted(self) -> list[WantedItem]:
@@ -970,10 +1173,11 @@ class Database:
         Returns:
             True if the item was removed, False if not found.
         """
-        cursor = await self.connection.execute(
-            "DELETE FROM wanted WHERE id = ?", (item_id,)
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            cursor = await self.connection.execute(
+                "DELETE FROM wanted WHERE id = ?", (item_id,)
+            )
+            await self.connection.commit()
         return cursor.rowcount > 0
 
     # Settings operations
@@ -1001,14 +1205,15 @@ class Database:
             key: The setting key.
             value: The setting value.
         """
-        await self.connection.execute(
-            """
-            INSERT INTO settings (key, value) VALUES (?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = excluded.value
-            """,
-            (key, value),
-        )
-        await self.connection.commit()
+        async with self._write_lock:
+            await self.connection.execute(
+                """
+                INSERT INTO settings (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (key, value),
+            )
+            await self.connection.commit()
 
     async def get_all_settings(self) -> dict[str, str]:
         """Get all settings as a dictionary.
@@ -99,9 +99,12 @@ class Application:
 
     async def _ensure_directories(self) -> None:
         """Create workspace directories if they don't exist."""
-        self.config.workspace_dir.mkdir(parents=True, exist_ok=True)
-        self.config.staging_dir.mkdir(parents=True, exist_ok=True)
-        self.config.encoding_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (
+            self.config.workspace_dir,
+            self.config.staging_dir,
+            self.config.encoding_dir,
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
 
     async def initialize(self) -> None:
         """Initialize the application (directories, database)."""
@@ -90,6 +90,10 @@ class EncodeQueue:
                     self._current_job = job.id
                     await self._process_job(job.id)
                     self._current_job = None
+                    # More ripped jobs may be waiting; yield and check again
+                    # instead of idling a full poll interval between encodes.
+                    await asyncio.sleep(0)
+                    continue
 
                 await asyncio.sleep(self.config.drive_poll_interval)
 
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+from collections.abc import Callable, Coroutine
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
+from dvdtoplex.database import ContentType, JobStatus, RipMode
+from dvdtoplex.drives import get_drive_status
+from dvdtoplex.services.oversight import (
+    check_state_consistency,
+    fix_stuck_encoding_jobs,
+)
+from dvdtoplex.tmdb import TMDbClient
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Lookup table from API content_type strings to enum members
+_CT_MAP = {ct.value: ct for ct in ContentType}
+
 if TYPE_CHECKING:
     from dvdtoplex.config import Config
     from dvdtoplex.database import Database
@@ -75,6 +95,57 @@ def get_job_file_size(job_id: int, status: str, config: "Config") -> str | None:
     return format_file_size(total_size)
 
 
+def etag_json_response(request: Request, content: Any) -> Response:
+    """Build a JSON response with a content-hash ETag.
+
+    Returns an empty 304 response when the client's If-None-Match header
+    already matches, so unchanged data is not re-sent.
+
+    Args:
+        request: The incoming request.
+        content: JSON-serializable response content.
+
+    Returns:
+        A JSON response carrying an ETag header, or a 304 response.
+    """
+    response = JSONResponse(content=content)
+    digest = hashlib.blake2b(response.body, digest_size=16).hexdigest()
+    etag = f'W/"{digest}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+class ORJSONRequest(Request):
+    """Request that decodes JSON bodies with orjson."""
+
+    async def json(self) -> Any:
+        """Parse and cache the request body as JSON."""
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands handlers an ORJSONRequest.
+
+    FastAPI parses JSON request bodies through ``Request.json()``, so this
+    covers both pydantic body models and handlers reading the request directly.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default handler to swap in ORJSONRequest."""
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(
+                ORJSONRequest(request.scope, request.receive)
+            )
+
+        return route_handler
+
+
 class ActiveModeRequest(BaseModel):
     """Request body for active mode toggle."""
 
@@ -106,6 +177,23 @@ class WantedRequest(BaseModel):
     notes: str | None = None
 
 
+@functools.cache
+def _get_templates(templates_dir: Path) -> Jinja2Templates:
+    """Return the Jinja2 templates for a directory, shared across apps.
+
+    Jinja2 keeps compiled templates on the environment, so sharing one
+    instance means each template is compiled once per process rather
+    than once per create_app() call.
+
+    Args:
+        templates_dir: Directory containing the Jinja2 templates.
+
+    Returns:
+        Jinja2Templates instance for the directory.
+    """
+    return Jinja2Templates(directory=templates_dir)
+
+
 def create_app(
     database: Database | None = None,
     drive_watcher: DriveWatcher | None = None,
@@ -127,6 +215,10 @@ def create_app(
         version="0.1.0",
     )
 
+    # Decode JSON request bodies with orjson when it is installed
+    if orjson is not None:
+        app.router.route_class = ORJSONRoute
+
     # Get paths for static files and templates
     web_dir = Path(__file__).parent
     static_dir = web_dir / "static"
@@ -137,7 +229,7 @@ def create_app(
         app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
     # Configure Jinja2 templates
-    templates = Jinja2Templates(directory=templates_dir)
+    templates = _get_templates(templates_dir)
 
     # Store templates in app state for access in routes
     app.state.templates = templates
@@ -191,8 +283,6 @@ def create_app(
             recent_jobs = app.state.jobs[-20:]
 
         # Get real drive status if drive_watcher is available
-        from dvdtoplex.drives import get_drive_status
-
         drives = []
         # Drive config: (drutil_id, display_name)
         drive_config = [
@@ -301,8 +391,6 @@ def create_app(
         """
         # Fetch from database if available
         if app.state.database is not None:
-            from dvdtoplex.database import JobStatus
-
             db_jobs = await app.state.database.get_jobs_by_status(JobStatus.REVIEW)
             review_jobs = []
             for job in db_jobs:
@@ -423,8 +511,6 @@ def create_app(
         """
         # Use database if available
         if app.state.database is not None:
-            from dvdtoplex.database import JobStatus, RipMode
-
             job = await app.state.database.get_job(job_id)
             if job is None:
                 return JSONResponse(
@@ -502,8 +588,6 @@ def create_app(
         """
         # Use database if available
         if app.state.database is not None:
-            from dvdtoplex.database import ContentType, JobStatus
-
             job = await app.state.database.get_job(job_id)
             if job is None:
                 return JSONResponse(
@@ -595,8 +679,6 @@ def create_app(
 
         # Use database if available
         if app.state.database is not None:
-            from dvdtoplex.database import ContentType, JobStatus
-
             job = await app.state.database.get_job(job_id)
             if job is None:
                 return JSONResponse(
@@ -618,8 +700,6 @@ def create_app(
             poster_path = None
             if app.state.config and app.state.config.tmdb_api_token:
                 try:
-                    from dvdtoplex.tmdb import TMDbClient
-
                     async with TMDbClient(app.state.config.tmdb_api_token) as tmdb:
                         results = await tmdb.search_movie(body.title, body.year)
                         if results:
@@ -709,8 +789,6 @@ def create_app(
         """
         # Use database if available
         if app.state.database is not None:
-            from dvdtoplex.database import JobStatus
-
             logger.info(f"skip_job: Looking up job {job_id} in database")
             job = await app.state.database.get_job(job_id)
             if job is None:
@@ -779,8 +857,6 @@ def create_app(
             JSON response with success status.
         """
         if app.state.database is not None:
-            from dvdtoplex.database import JobStatus
-
             job = await app.state.database.get_job(job_id)
             if job is None:
                 return JSONResponse(
@@ -829,11 +905,14 @@ def create_app(
 
     # API endpoints for wanted list
     @app.get("/api/wanted")
-    async def get_wanted_list() -> JSONResponse:
+    async def get_wanted_list(request: Request) -> Response:
         """Get all items in the wanted list.
 
+        Args:
+            request: Request object, checked for If-None-Match.
+
         Returns:
-            JSON response with list of wanted items.
+            JSON response with list of wanted items, or 304 if unchanged.
         """
         # Use database if available
         if app.state.database is not None:
@@ -854,7 +933,7 @@ def create_app(
         else:
             items = app.state.wanted
 
-        return JSONResponse(content={"success": True, "items": items})
+        return etag_json_response(request, {"success": True, "items": items})
 
     @app.post("/api/wanted")
     async def add_wanted(body: WantedRequest) -> JSONResponse:
@@ -890,8 +969,6 @@ def create_app(
             # Enrich if missing year, tmdb_id, or poster_path
             if year is None or tmdb_id is None or poster_path is None:
                 try:
-                    from dvdtoplex.tmdb import TMDbClient
-
                     async with TMDbClient(app.state.config.tmdb_api_token) as tmdb:
                         if body.content_type == "movie":
                             results = await tmdb.search_movie(title, year)
@@ -926,8 +1003,6 @@ def create_app(
 
         # Use database if available
         if app.state.database is not None:
-            from dvdtoplex.database import ContentType
-
             # Check for duplicate tmdb_id in database
             if tmdb_id is not None:
                 existing = await app.state.database.get_wanted()
@@ -945,7 +1020,7 @@ def create_app(
                         )
 
             # Add to database
-            content_type = ContentType(body.content_type)
+            content_type = _CT_MAP[body.content_type]
             new_id = await app.state.database.add_to_wanted(
                 title=title,
                 year=year,
@@ -1059,8 +1134,6 @@ def create_app(
         if app.state.database is None:
             return JSONResponse(content={"issues": [], "count": 0})
 
-        from dvdtoplex.services.oversight import check_state_consistency
-
         issues = await check_state_consistency(app.state.database)
         return JSONResponse(content={"issues": issues, "count": len(issues)})
 
@@ -1072,52 +1145,54 @@ def create_app(
                 content={"detail": "Database not available"}, status_code=500
             )
 
-        from dvdtoplex.services.oversight import fix_stuck_encoding_jobs
-
         fixed_count = await fix_stuck_encoding_jobs(app.state.database)
         return JSONResponse(content={"success": True, "fixed_count": fixed_count})
 
-    # Test endpoints for browser verification (development only)
-    @app.post("/api/test/add-job")
-    async def add_test_job(request: Request) -> JSONResponse:
-        """Add a test job for browser verification.
-
-        Args:
-            request: Request object containing job data.
-
-        Returns:
-            JSON response with success status.
-        """
-        data = await request.json()
-        app.state.jobs.append(data)
-        return JSONResponse(content={"success": True})
-
-    @app.post("/api/test/add-collection")
-    async def add_test_collection(request: Request) -> JSONResponse:
-        """Add a test collection item for browser verification.
-
-        Args:
-            request: Request object containing collection item data.
-
-        Returns:
-            JSON response with success status.
-        """
-        data = await request.json()
-        app.state.collection.append(data)
-        return JSONResponse(content={"success": True})
-
-    @app.post("/api/test/add-wanted")
-    async def add_test_wanted(request: Request) -> JSONResponse:
-        """Add a test wanted item for browser verification.
-
-        Args:
-            request: Request object containing wanted item data.
-
-        Returns:
-            JSON response with success status.
-        """
-        data = await request.json()
-        app.state.wanted.append(data)
-        return JSONResponse(content={"success": True})
+    # Test endpoints for browser verification (development only). Only
+    # registered for the in-memory demo app or when explicitly enabled; the
+    # identity check fails closed for mock or duck-typed configs.
+    if config is None or config.enable_test_endpoints is True:
+
+        @app.post("/api/test/add-job")
+        async def add_test_job(request: Request) -> JSONResponse:
+            """Add a test job for browser verification.
+
+            Args:
+                request: Request object containing job data.
+
+            Returns:
+                JSON response with success status.
+            """
+            data = await request.json()
+            app.state.jobs.append(data)
+            return JSONResponse(content={"success": True})
+
+        @app.post("/api/test/add-collection")
+        async def add_test_collection(request: Request) -> JSONResponse:
+            """Add a test collection item for browser verification.
+
+            Args:
+                request: Request object containing collection item data.
+
+            Returns:
+                JSON response with success status.
+            """
+            data = await request.json()
+            app.state.collection.append(data)
+            return JSONResponse(content={"success": True})
+
+        @app.post("/api/test/add-wanted")
+        async def add_test_wanted(request: Request) -> JSONResponse:
+            """Add a test wanted item for browser verification.
+
+            Args:
+                request: Request object containing wanted item data.
+
+            Returns:
+                JSON response with success status.
+            """
+            data = await request.json()
+            app.state.wanted.append(data)
+            return JSONResponse(content={"success": True})
 
     return app
@@ -10,6 +10,11 @@ This module provides reusable test fixtures for:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import heapq
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +23,25 @@ from typing import Any, Optional
 import pytest
 import pytest_asyncio
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# ============================================================================
+# Event Loop
+# ============================================================================
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
 
 # ============================================================================
 # Configuration Fixtures
@@ -115,6 +139,21 @@ def minimal_config() -> Config:
     )
 
 
+# ============================================================================
+# SQLite Settings
+# ============================================================================
+
+
+# Run after connecting a throwaway file-backed test database: skip fsync and
+# keep the rollback journal in memory, since durability is irrelevant for a
+# database deleted at the end of the test.
+SQLITE_TEST_PRAGMAS = """
+PRAGMA synchronous = OFF;
+PRAGMA journal_mode = MEMORY;
+PRAGMA temp_store = MEMORY;
+"""
+
+
 # ============================================================================
 # Database Enums and Data Classes
 # ============================================================================
@@ -179,12 +218,16 @@ class MockDatabase:
     def __init__(self) -> None:
         self.jobs: dict[int, Job] = {}
         self.next_job_id: int = 1
+        # Job IDs per status (dicts used as ordered sets)
+        self._jobs_by_status: defaultdict[str, dict[int, None]] = defaultdict(dict)
         self.tv_seasons: dict[int, dict[str, Any]] = {}
         self.next_season_id: int = 1
         self.episodes: dict[int, dict[str, Any]] = {}
         self.next_episode_id: int = 1
         self.collection: list[dict[str, Any]] = []
         self.wanted: list[dict[str, Any]] = []
+        self.wanted_by_id: dict[int, dict[str, Any]] = {}
+        self.next_wanted_id: int = 1
         self.settings: dict[str, str] = {"active_mode": "true"}
 
     async def connect(self) -> None:
@@ -201,15 +244,17 @@ class MockDatabase:
         """Create a new job and return its ID."""
         job_id = self.next_job_id
         self.next_job_id += 1
+        now = datetime.now()
         self.jobs[job_id] = Job(
             id=job_id,
             drive_id=drive_id,
             disc_label=disc_label,
             status=JobStatus.PENDING,
             content_type=ContentType.UNKNOWN,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
+        self._jobs_by_status[JobStatus.PENDING][job_id] = None
         return job_id
 
     async def get_job(self, job_id: int) -> Optional[Job]:
@@ -218,7 +263,7 @@ class MockDatabase:
 
     async def get_jobs_by_status(self, status: str) -> list[Job]:
         """Get all jobs with a specific status."""
-        return [job for job in self.jobs.values() if job.status == status]
+        return [self.jobs[job_id] for job_id in self._jobs_by_status[status]]
 
     async def get_jobs_by_drive(self, drive_id: str) -> list[Job]:
         """Get all jobs for a specific drive."""
@@ -226,19 +271,19 @@ class MockDatabase:
 
     async def get_pending_job_for_drive(self, drive_id: str) -> Optional[Job]:
         """Get the first pending job for a specific drive."""
-        for job in self.jobs.values():
-            if job.status == JobStatus.PENDING and job.drive_id == drive_id:
+        for job_id in self._jobs_by_status[JobStatus.PENDING]:
+            job = self.jobs[job_id]
+            if job.drive_id == drive_id:
                 return job
         return None
 
     async def get_recent_jobs(self, limit: int = 10) -> list[Job]:
         """Get the most recent jobs."""
-        sorted_jobs = sorted(
+        return heapq.nlargest(
+            limit,
             self.jobs.values(),
             key=lambda j: (j.created_at or datetime.min, j.id),
-            reverse=True,
         )
-        return sorted_jobs[:limit]
 
     async def update_job_status(
         self,
@@ -248,6 +293,8 @@ class MockDatabase:
     ) -> None:
         """Update job status."""
         if job_id in self.jobs:
+            self._jobs_by_status[self.jobs[job_id].status].pop(job_id, None)
+            self._jobs_by_status[status][job_id] = None
             self.jobs[job_id].status = status
             self.jobs[job_id].updated_at = datetime.now()
             if error_message is not None:
@@ -409,18 +456,19 @@ class MockDatabase:
         notes: Optional[str] = None,
     ) -> int:
         """Add an item to the wanted list."""
-        item_id = len(self.wanted) + 1
-        self.wanted.append(
-            {
-                "id": item_id,
-                "title": title,
-                "year": year,
-                "content_type": content_type,
-                "tmdb_id": tmdb_id,
-                "notes": notes,
-                "added_at": datetime.now(),
-            }
-        )
+        item_id = self.next_wanted_id
+        self.next_wanted_id += 1
+        item = {
+            "id": item_id,
+            "title": title,
+            "year": year,
+            "content_type": content_type,
+            "tmdb_id": tmdb_id,
+            "notes": notes,
+            "added_at": datetime.now(),
+        }
+        self.wanted.append(item)
+        self.wanted_by_id[item_id] = item
         return item_id
 
     async def get_wanted(self) -> list[dict[str, Any]]:
@@ -429,18 +477,15 @@ class MockDatabase:
 
     async def get_wanted_item(self, item_id: int) -> Optional[dict[str, Any]]:
         """Get a wanted item by ID."""
-        for item in self.wanted:
-            if item["id"] == item_id:
-                return item
-        return None
+        return self.wanted_by_id.get(item_id)
 
     async def remove_from_wanted(self, item_id: int) -> bool:
         """Remove an item from the wanted list."""
-        for i, item in enumerate(self.wanted):
-            if item["id"] == item_id:
-                self.wanted.pop(i)
-                return True
-        return False
+        item = self.wanted_by_id.pop(item_id, None)
+        if item is None:
+            return False
+        self.wanted.remove(item)
+        return True
 
     # Settings operations
 
@@ -569,12 +614,8 @@ def sample_tv_season() -> SampleTVSeason:
 # ============================================================================
 
 
-@pytest_asyncio.fixture
-async def mock_database_with_jobs(mock_database: MockDatabase) -> MockDatabase:
-    """Create a mock database pre-populated with sample jobs.
-
-    Includes jobs in various states for testing state transitions.
-    """
+async def _populate_jobs(mock_database: MockDatabase) -> None:
+    """Populate a mock database with jobs in various states."""
     # Pending job
     await mock_database.create_job("disk0", "PENDING_DISC")
 
@@ -609,12 +650,9 @@ async def mock_database_with_jobs(mock_database: MockDatabase) -> MockDatabase:
     job_id = await mock_database.create_job("disk1", "BAD_DISC")
     await mock_database.update_job_status(job_id, JobStatus.FAILED, "Unreadable disc")
 
-    return mock_database
-
 
-@pytest_asyncio.fixture
-async def mock_database_with_collection(mock_database: MockDatabase) -> MockDatabase:
-    """Create a mock database pre-populated with collection items."""
+async def _populate_collection(mock_database: MockDatabase) -> None:
+    """Populate a mock database with collection items."""
     await mock_database.add_to_collection(
         "The Matrix", "/movies/matrix.mkv", 1999, ContentType.MOVIE, 603
     )
@@ -624,12 +662,10 @@ async def mock_database_with_collection(mock_database: MockDatabase) -> MockData
     await mock_database.add_to_collection(
         "Breaking Bad", "/tv/breaking_bad/s01.mkv", 2008, ContentType.TV_SEASON, 1396
     )
-    return mock_database
 
 
-@pytest_asyncio.fixture
-async def mock_database_with_wanted(mock_database: MockDatabase) -> MockDatabase:
-    """Create a mock database pre-populated with wanted items."""
+async def _populate_wanted(mock_database: MockDatabase) -> None:
+    """Populate a mock database with wanted items."""
     await mock_database.add_to_wanted(
         "Blade Runner 2049", 2017, ContentType.MOVIE, 335984, "Director's cut preferred"
     )
@@ -639,4 +675,61 @@ async def mock_database_with_wanted(mock_database: MockDatabase) -> MockDatabase
     await mock_database.add_to_wanted(
         "Game of Thrones", 2011, ContentType.TV_SEASON, 1399, "Looking for Season 1"
     )
-    return mock_database
+
+
+async def _build_template(
+    populate: Callable[[MockDatabase], Coroutine[Any, Any, None]],
+) -> MockDatabase:
+    """Build a pre-populated mock database to be copied by test fixtures."""
+    template = MockDatabase()
+    await populate(template)
+    return template
+
+
+# Pre-populated databases are built once per session; each test gets its
+# own deep copy so mutations never leak between tests.
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _mock_database_with_jobs_template() -> MockDatabase:
+    """Session-wide template for mock_database_with_jobs."""
+    return await _build_template(_populate_jobs)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _mock_database_with_collection_template() -> MockDatabase:
+    """Session-wide template for mock_database_with_collection."""
+    return await _build_template(_populate_collection)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _mock_database_with_wanted_template() -> MockDatabase:
+    """Session-wide template for mock_database_with_wanted."""
+    return await _build_template(_populate_wanted)
+
+
+@pytest.fixture
+def mock_database_with_jobs(
+    _mock_database_with_jobs_template: MockDatabase,
+) -> MockDatabase:
+    """Create a mock database pre-populated with sample jobs.
+
+    Includes jobs in various states for testing state transitions.
+    """
+    return copy.deepcopy(_mock_database_with_jobs_template)
+
+
+@pytest.fixture
+def mock_database_with_collection(
+    _mock_database_with_collection_template: MockDatabase,
+) -> MockDatabase:
+    """Create a mock database pre-populated with collection items."""
+    return copy.deepcopy(_mock_database_with_collection_template)
+
+
+@pytest.fixture
+def mock_database_with_wanted(
+    _mock_database_with_wanted_template: MockDatabase,
+) -> MockDatabase:
+    """Create a mock database pre-populated with wanted items."""
+    return copy.deepcopy(_mock_database_with_wanted_template)
@@ -7,16 +7,17 @@ pending -> ripping -> ripped -> encoding -> encoded -> identifying -> review/mov
 Provides test fixtures for config and database.
 """
 
-from __future__ import annotations
-
 import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, NamedTuple
 
 import pytest
+import pytest_asyncio
 
 
 # ============================================================================
@@ -47,7 +48,7 @@ class ContentType(str, Enum):
     TV_SEASON = "tv_season"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration dataclass for the pipeline."""
 
@@ -67,7 +68,7 @@ class Config:
     auto_approve_threshold: float = 0.85
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job dataclass representing a ripping/encoding job."""
 
@@ -76,19 +77,19 @@ class Job:
     disc_label: str
     content_type: ContentType = ContentType.UNKNOWN
     status: JobStatus = JobStatus.PENDING
-    identified_title: Optional[str] = None
-    identified_year: Optional[int] = None
-    tmdb_id: Optional[int] = None
-    confidence: Optional[float] = None
-    rip_path: Optional[str] = None
-    encode_path: Optional[str] = None
-    final_path: Optional[str] = None
-    error_message: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-
-@dataclass
+    identified_title: str | None = None
+    identified_year: int | None = None
+    tmdb_id: int | None = None
+    confidence: float | None = None
+    rip_path: str | None = None
+    encode_path: str | None = None
+    final_path: str | None = None
+    error_message: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+@dataclass(slots=True)
 class TitleInfo:
     """MakeMKV title information."""
 
@@ -98,7 +99,7 @@ class TitleInfo:
     filename: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MovieMatch:
     """TMDb movie match result."""
 
@@ -106,11 +107,20 @@ class MovieMatch:
     title: str
     year: int
     overview: str
-    poster_path: Optional[str]
+    poster_path: str | None
     popularity: float
 
 
-@dataclass
+class Notification(NamedTuple):
+    """Notification captured by MockNotifier."""
+
+    title: str
+    message: str
+    priority: int
+    url: str | None
+
+
+@dataclass(slots=True)
 class IdentificationResult:
     """Result from content identification."""
 
@@ -166,9 +176,33 @@ class MockDatabase:
     def __init__(self) -> None:
         self.jobs: dict[int, Job] = {}
         self.next_job_id: int = 1
+        # Secondary index of job IDs per status (dicts used as ordered sets)
+        self._by_status: dict[JobStatus, dict[int, None]] = {
+            status: {} for status in JobStatus
+        }
+        # Job IDs are pushed here as they enter a status, waking the service
+        # that consumes that status instead of having it poll
+        self._status_queues: defaultdict[JobStatus, asyncio.Queue[int]] = defaultdict(
+            asyncio.Queue
+        )
+        # Notified on every status change and collection addition so tests
+        # can wait for a state without polling
+        self._changed = asyncio.Condition()
         self.collection: list[dict[str, Any]] = []
         self.wanted: list[dict[str, Any]] = []
         self.settings: dict[str, str] = {"active_mode": "true"}
+        self._now_cache: datetime | None = None
+
+    def _now(self) -> datetime:
+        """Return the current time, read at most once per event-loop tick."""
+        if self._now_cache is None:
+            self._now_cache = datetime.now()
+            asyncio.get_running_loop().call_soon(self._clear_now_cache)
+        return self._now_cache
+
+    def _clear_now_cache(self) -> None:
+        """Drop the cached timestamp so the next tick reads the clock again."""
+        self._now_cache = None
 
     async def init(self) -> None:
         """Initialize the database (no-op for mock)."""
@@ -187,51 +221,109 @@ class MockDatabase:
             drive_id=drive_id,
             disc_label=disc_label,
             status=JobStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=self._now(),
+            updated_at=self._now(),
         )
+        self._by_status[JobStatus.PENDING][job_id] = None
+        self._status_queues[JobStatus.PENDING].put_nowait(job_id)
+        async with self._changed:
+            self._changed.notify_all()
         return job_id
 
-    async def get_job(self, job_id: int) -> Optional[Job]:
+    async def get_job(self, job_id: int) -> Job | None:
         """Get a job by ID."""
         return self.jobs.get(job_id)
 
     async def get_jobs_by_status(self, status: JobStatus) -> list[Job]:
         """Get all jobs with a specific status."""
-        return [job for job in self.jobs.values() if job.status == status]
+        return [self.jobs[job_id] for job_id in self._by_status[status]]
+
+    async def next_jobs_with_status(self, status: JobStatus) -> list[Job]:
+        """Wait for jobs to enter a status and return every one that is ready.
+
+        Jobs that have already moved on to another status are skipped.
+        """
+        queue = self._status_queues[status]
+        while True:
+            job_ids = [await queue.get()]
+            while not queue.empty():
+                job_ids.append(queue.get_nowait())
+            jobs = [
+                self.jobs[job_id]
+                for job_id in dict.fromkeys(job_ids)
+                if job_id in self.jobs and self.jobs[job_id].status == status
+            ]
+            if jobs:
+                return jobs
+
+    async def wait_for_status(
+        self, job_id: int, *statuses: JobStatus, timeout: float = 1.0
+    ) -> Job | None:
+        """Wait until a job reaches one of the given statuses.
+
+        Returns the job once it matches, or as it stands when the timeout
+        expires so the caller's assertions report the actual status.
+        """
+
+        def reached() -> bool:
+            job = self.jobs.get(job_id)
+            return job is not None and job.status in statuses
+
+        await self.wait_for(reached, timeout=timeout)
+        return self.jobs.get(job_id)
+
+    async def wait_for(
+        self, predicate: Callable[[], bool], timeout: float = 1.0
+    ) -> bool:
+        """Wait until predicate holds, re-checking after every state change.
+
+        Returns whether the predicate held before the timeout expired.
+        """
+        try:
+            async with asyncio.timeout(timeout), self._changed:
+                await self._changed.wait_for(predicate)
+        except TimeoutError:
+            return False
+        return True
 
     async def get_pending_jobs_for_drive(self, drive_id: str) -> list[Job]:
         """Get pending jobs for a specific drive."""
         return [
             job
-            for job in self.jobs.values()
-            if job.status == JobStatus.PENDING and job.drive_id == drive_id
+            for job in await self.get_jobs_by_status(JobStatus.PENDING)
+            if job.drive_id == drive_id
         ]
 
     async def update_job_status(
         self,
         job_id: int,
         status: JobStatus,
-        error_message: Optional[str] = None,
+        error_message: str | None = None,
     ) -> None:
         """Update job status."""
         if job_id in self.jobs:
+            old_status = self.jobs[job_id].status
+            self._by_status[old_status].pop(job_id, None)
+            self._by_status[status][job_id] = None
             self.jobs[job_id].status = status
-            self.jobs[job_id].updated_at = datetime.now()
+            self._status_queues[status].put_nowait(job_id)
+            self.jobs[job_id].updated_at = self._now()
             if error_message:
                 self.jobs[job_id].error_message = error_message
+            async with self._changed:
+                self._changed.notify_all()
 
     async def update_job_rip_path(self, job_id: int, rip_path: str) -> None:
         """Update job rip path."""
         if job_id in self.jobs:
             self.jobs[job_id].rip_path = rip_path
-            self.jobs[job_id].updated_at = datetime.now()
+            self.jobs[job_id].updated_at = self._now()
 
     async def update_job_encode_path(self, job_id: int, encode_path: str) -> None:
         """Update job encode path."""
         if job_id in self.jobs:
             self.jobs[job_id].encode_path = encode_path
-            self.jobs[job_id].updated_at = datetime.now()
+            self.jobs[job_id].updated_at = self._now()
 
     async def update_job_identification(
         self,
@@ -249,13 +341,13 @@ class MockDatabase:
             self.jobs[job_id].identified_year = year
             self.jobs[job_id].tmdb_id = tmdb_id
             self.jobs[job_id].confidence = confidence
-            self.jobs[job_id].updated_at = datetime.now()
+            self.jobs[job_id].updated_at = self._now()
 
     async def update_job_final_path(self, job_id: int, final_path: str) -> None:
         """Update job final path."""
         if job_id in self.jobs:
             self.jobs[job_id].final_path = final_path
-            self.jobs[job_id].updated_at = datetime.now()
+            self.jobs[job_id].updated_at = self._now()
 
     async def add_to_collection(
         self,
@@ -277,9 +369,11 @@ class MockDatabase:
                 "file_path": file_path,
             }
         )
+        async with self._changed:
+            self._changed.notify_all()
         return item_id
 
-    async def get_setting(self, key: str) -> Optional[str]:
+    async def get_setting(self, key: str) -> str | None:
         """Get a setting value."""
         return self.settings.get(key)
 
@@ -293,6 +387,40 @@ class MockDatabase:
 # ============================================================================
 
 
+def _write_mock_file(
+    path: Path, content: bytes | None, ensured_dirs: set[Path] | None = None
+) -> None:
+    """Create a mock output file, including its parent directory.
+
+    With content None the file is only touched, which is enough for tests
+    that check existence. If ensured_dirs is given, parent directories
+    already recorded there are assumed to exist and are not created again.
+    """
+    parent = path.parent
+    if ensured_dirs is None or parent not in ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        if ensured_dirs is not None:
+            ensured_dirs.add(parent)
+    if content is None:
+        path.touch()
+    else:
+        path.write_bytes(content)
+
+
+async def _fail_errored_jobs(
+    database: MockDatabase, jobs: list[Job], results: list[Any]
+) -> None:
+    """Mark each job whose processing raised as failed, as the real services do.
+
+    Cancellation and other BaseExceptions are re-raised so stop() still works.
+    """
+    for job, result in zip(jobs, results):
+        if isinstance(result, Exception):
+            await database.update_job_status(job.id, JobStatus.FAILED, str(result))
+        elif isinstance(result, BaseException):
+            raise result
+
+
 class MockDriveWatcher:
     """Mock drive watcher that can simulate disc insertion."""
 
@@ -300,7 +428,7 @@ class MockDriveWatcher:
         self.database = database
         self.config = config
         self.running = False
-        self._task: Optional[asyncio.Task[None]] = None
+        self._task: asyncio.Task[None] | None = None
         self.disc_insertions: list[tuple[str, str]] = []
 
     async def start(self) -> None:
@@ -323,14 +451,19 @@ class MockDriveWatcher:
 class MockRipQueue:
     """Mock rip queue that simulates the ripping process."""
 
+    # Set to True to write placeholder bytes instead of an empty file
+    WRITE_CONTENT = False
+
     def __init__(
-        self, database: MockDatabase, config: Config, on_rip_complete: Optional[Callable[[int], None]] = None
+        self, database: MockDatabase, config: Config, on_rip_complete: Callable[[int], None] | None = None
     ) -> None:
         self.database = database
         self.config = config
         self.running = False
         self.on_rip_complete = on_rip_complete
-        self._task: Optional[asyncio.Task[None]] = None
+        self._task: asyncio.Task[None] | None = None
+        self._rips_root = config.workspace_dir / "rips"
+        self._rips_root.mkdir(parents=True, exist_ok=True)
 
     async def start(self) -> None:
         """Start the rip queue processor."""
@@ -350,20 +483,24 @@ class MockRipQueue:
     async def _process_loop(self) -> None:
         """Process pending rip jobs."""
         while self.running:
-            pending_jobs = await self.database.get_jobs_by_status(JobStatus.PENDING)
-            for job in pending_jobs:
-                await self._process_job(job)
-            await asyncio.sleep(0.01)
+            jobs = await self.database.next_jobs_with_status(JobStatus.PENDING)
+            results = await asyncio.gather(
+                *(self._process_job(job) for job in jobs), return_exceptions=True
+            )
+            await _fail_errored_jobs(self.database, jobs, results)
 
     async def _process_job(self, job: Job) -> None:
         """Process a single rip job."""
         await self.database.update_job_status(job.id, JobStatus.RIPPING)
 
         # Simulate ripping
-        rip_dir = self.config.workspace_dir / "rips" / f"job_{job.id}"
-        rip_dir.mkdir(parents=True, exist_ok=True)
+        rip_dir = self._rips_root / f"job_{job.id}"
         rip_path = rip_dir / f"{job.disc_label}.mkv"
-        rip_path.write_bytes(b"mock mkv content")
+        await asyncio.to_thread(
+            _write_mock_file,
+            rip_path,
+            b"mock mkv content" if self.WRITE_CONTENT else None,
+        )
 
         await self.database.update_job_rip_path(job.id, str(rip_path))
         await self.database.update_job_status(job.id, JobStatus.RIPPED)
@@ -375,14 +512,19 @@ class MockRipQueue:
 class MockEncodeQueue:
     """Mock encode queue that simulates the encoding process."""
 
+    # Set to True to write placeholder bytes instead of an empty file
+    WRITE_CONTENT = False
+
     def __init__(
-        self, database: MockDatabase, config: Config, on_encode_complete: Optional[Callable[[int], None]] = None
+        self, database: MockDatabase, config: Config, on_encode_complete: Callable[[int], None] | None = None
     ) -> None:
         self.database = database
         self.config = config
         self.running = False
         self.on_encode_complete = on_encode_complete
-        self._task: Optional[asyncio.Task[None]] = None
+        self._task: asyncio.Task[None] | None = None
+        self._encodes_root = config.workspace_dir / "encodes"
+        self._encodes_root.mkdir(parents=True, exist_ok=True)
 
     async def start(self) -> None:
         """Start the encode queue processor."""
@@ -402,20 +544,24 @@ class MockEncodeQueue:
     async def _process_loop(self) -> None:
         """Process ripped jobs that need encoding."""
         while self.running:
-            ripped_jobs = await self.database.get_jobs_by_status(JobStatus.RIPPED)
-            for job in ripped_jobs:
-                await self._process_job(job)
-            await asyncio.sleep(0.01)
+            jobs = await self.database.next_jobs_with_status(JobStatus.RIPPED)
+            results = await asyncio.gather(
+                *(self._process_job(job) for job in jobs), return_exceptions=True
+            )
+            await _fail_errored_jobs(self.database, jobs, results)
 
     async def _process_job(self, job: Job) -> None:
         """Process a single encode job."""
         await self.database.update_job_status(job.id, JobStatus.ENCODING)
 
         # Simulate encoding
-        encode_dir = self.config.workspace_dir / "encodes" / f"job_{job.id}"
-        encode_dir.mkdir(parents=True, exist_ok=True)
+        encode_dir = self._encodes_root / f"job_{job.id}"
         encode_path = encode_dir / f"{job.disc_label}_encoded.mkv"
-        encode_path.write_bytes(b"mock encoded mkv content")
+        await asyncio.to_thread(
+            _write_mock_file,
+            encode_path,
+            b"mock encoded mkv content" if self.WRITE_CONTENT else None,
+        )
 
         await self.database.update_job_encode_path(job.id, str(encode_path))
         await self.database.update_job_status(job.id, JobStatus.ENCODED)
@@ -437,7 +583,7 @@ class MockIdentifierService:
         self.config = config
         self.running = False
         self.default_confidence = default_confidence
-        self._task: Optional[asyncio.Task[None]] = None
+        self._task: asyncio.Task[None] | None = None
         # Map disc labels to identification results
         self.identification_map: dict[str, IdentificationResult] = {}
 
@@ -465,10 +611,11 @@ class MockIdentifierService:
     async def _process_loop(self) -> None:
         """Process encoded jobs that need identification."""
         while self.running:
-            encoded_jobs = await self.database.get_jobs_by_status(JobStatus.ENCODED)
-            for job in encoded_jobs:
-                await self._process_job(job)
-            await asyncio.sleep(0.01)
+            jobs = await self.database.next_jobs_with_status(JobStatus.ENCODED)
+            results = await asyncio.gather(
+                *(self._process_job(job) for job in jobs), return_exceptions=True
+            )
+            await _fail_errored_jobs(self.database, jobs, results)
 
     async def _process_job(self, job: Job) -> None:
         """Process a single identification job."""
@@ -507,11 +654,17 @@ class MockIdentifierService:
 class MockFileMover:
     """Mock file mover that simulates moving files to Plex library."""
 
+    # Set to True to write placeholder bytes instead of an empty file
+    WRITE_CONTENT = False
+
     def __init__(self, database: MockDatabase, config: Config) -> None:
         self.database = database
         self.config = config
         self.running = False
-        self._task: Optional[asyncio.Task[None]] = None
+        self._task: asyncio.Task[None] | None = None
+        # Library directories created so far; TV seasons and re-rips land in
+        # the same directory and skip the mkdir
+        self._ensured_dirs: set[Path] = set()
 
     async def start(self) -> None:
         """Start the file mover service."""
@@ -531,10 +684,11 @@ class MockFileMover:
     async def _process_loop(self) -> None:
         """Process jobs that are ready to be moved."""
         while self.running:
-            moving_jobs = await self.database.get_jobs_by_status(JobStatus.MOVING)
-            for job in moving_jobs:
-                await self._process_job(job)
-            await asyncio.sleep(0.01)
+            jobs = await self.database.next_jobs_with_status(JobStatus.MOVING)
+            results = await asyncio.gather(
+                *(self._process_job(job) for job in jobs), return_exceptions=True
+            )
+            await _fail_errored_jobs(self.database, jobs, results)
 
     async def _process_job(self, job: Job) -> None:
         """Process a single file move job."""
@@ -555,11 +709,15 @@ class MockFileMover:
                 self.config.plex_tv_dir / job.identified_title / f"Season {job.identified_year}"
             )
 
-        dest_dir.mkdir(parents=True, exist_ok=True)
         final_path = dest_dir / f"{job.identified_title} ({job.identified_year}).mkv"
 
         # Simulate file move (just create the destination file)
-        final_path.write_bytes(b"final encoded content")
+        await asyncio.to_thread(
+            _write_mock_file,
+            final_path,
+            b"final encoded content" if self.WRITE_CONTENT else None,
+            self._ensured_dirs,
+        )
 
         await self.database.update_job_final_path(job.id, str(final_path))
         await self.database.add_to_collection(
@@ -577,24 +735,17 @@ class MockNotifier:
 
     def __init__(self, config: Config) -> None:
         self.config = config
-        self.notifications: list[dict[str, Any]] = []
+        self.notifications: list[Notification] = []
 
     async def send(
         self,
         title: str,
         message: str,
         priority: int = 0,
-        url: Optional[str] = None,
+        url: str | None = None,
     ) -> bool:
         """Send a notification (mock)."""
-        self.notifications.append(
-            {
-                "title": title,
-                "message": message,
-                "priority": priority,
-                "url": url,
-            }
-        )
+        self.notifications.append(Notification(title, message, priority, url))
         return True
 
     async def notify_disc_complete(self, disc_label: str, title: str) -> bool:
@@ -621,6 +772,42 @@ class MockNotifier:
         )
 
 
+class PipelineServices(NamedTuple):
+    """Mock services making up a running pipeline, in processing order."""
+
+    rip_queue: MockRipQueue
+    encode_queue: MockEncodeQueue
+    identifier: MockIdentifierService
+    file_mover: MockFileMover
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def pipeline(
+    request: pytest.FixtureRequest, test_config: Config, mock_database: MockDatabase
+) -> AsyncIterator[PipelineServices]:
+    """Start the rip, encode, identify and move services for one test.
+
+    The identifier's default confidence is 0.95 (auto-approve) unless the
+    test overrides it with an indirect parametrize value.
+    """
+    services = PipelineServices(
+        rip_queue=MockRipQueue(mock_database, test_config),
+        encode_queue=MockEncodeQueue(mock_database, test_config),
+        identifier=MockIdentifierService(
+            mock_database,
+            test_config,
+            default_confidence=getattr(request, "param", 0.95),
+        ),
+        file_mover=MockFileMover(mock_database, test_config),
+    )
+    await asyncio.gather(*(service.start() for service in services))
+    yield services
+    await asyncio.gather(
+        *(service.stop() for service in reversed(services)),
+        return_exceptions=True,
+    )
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -629,108 +816,66 @@ class MockNotifier:
 class TestJobStateTransitions:
     """Test job state transitions through the full pipeline lifecycle."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_full_pipeline_high_confidence(
-        self, test_config: Config, mock_database: MockDatabase
+        self,
+        test_config: Config,
+        mock_database: MockDatabase,
+        pipeline: PipelineServices,
     ) -> None:
         """Test complete pipeline with high confidence identification (auto-approve)."""
-        # Create services
         drive_watcher = MockDriveWatcher(mock_database, test_config)
-        rip_queue = MockRipQueue(mock_database, test_config)
-        encode_queue = MockEncodeQueue(mock_database, test_config)
-        identifier = MockIdentifierService(mock_database, test_config, default_confidence=0.95)
-        file_mover = MockFileMover(mock_database, test_config)
-
-        # Start services
-        await rip_queue.start()
-        await encode_queue.start()
-        await identifier.start()
-        await file_mover.start()
-
-        try:
-            # Simulate disc insertion
-            job_id = await drive_watcher.simulate_disc_insertion("disk0", "THE_MATRIX_1999")
 
-            # Wait for pipeline to complete
-            for _ in range(100):  # Timeout after 100 iterations
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.COMPLETE:
-                    break
-                await asyncio.sleep(0.01)
+        # Simulate disc insertion
+        job_id = await drive_watcher.simulate_disc_insertion("disk0", "THE_MATRIX_1999")
 
-            # Verify job completed successfully
-            job = await mock_database.get_job(job_id)
-            assert job is not None
-            assert job.status == JobStatus.COMPLETE
-            assert job.identified_title is not None
-            assert job.final_path is not None
-            assert len(mock_database.collection) == 1
+        # Wait for pipeline to complete
+        await mock_database.wait_for_status(job_id, JobStatus.COMPLETE)
 
-        finally:
-            # Stop services
-            await file_mover.stop()
-            await identifier.stop()
-            await encode_queue.stop()
-            await rip_queue.stop()
+        # Verify job completed successfully
+        job = await mock_database.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.COMPLETE
+        assert job.identified_title is not None
+        assert job.final_path is not None
+        assert len(mock_database.collection) == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("pipeline", [0.5], indirect=True)
     async def test_pipeline_low_confidence_review(
-        self, test_config: Config, mock_database: MockDatabase
+        self,
+        test_config: Config,
+        mock_database: MockDatabase,
+        pipeline: PipelineServices,
     ) -> None:
         """Test pipeline with low confidence identification (needs review)."""
-        # Create services with low confidence
         drive_watcher = MockDriveWatcher(mock_database, test_config)
-        rip_queue = MockRipQueue(mock_database, test_config)
-        encode_queue = MockEncodeQueue(mock_database, test_config)
-        identifier = MockIdentifierService(mock_database, test_config, default_confidence=0.5)
-        file_mover = MockFileMover(mock_database, test_config)
 
-        # Start services
-        await rip_queue.start()
-        await encode_queue.start()
-        await identifier.start()
-        await file_mover.start()
+        # Simulate disc insertion
+        job_id = await drive_watcher.simulate_disc_insertion("disk0", "UNKNOWN_DISC")
 
-        try:
-            # Simulate disc insertion
-            job_id = await drive_watcher.simulate_disc_insertion("disk0", "UNKNOWN_DISC")
+        # Wait for job to reach REVIEW status
+        await mock_database.wait_for_status(job_id, JobStatus.REVIEW)
 
-            # Wait for job to reach REVIEW status
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.REVIEW:
-                    break
-                await asyncio.sleep(0.01)
-
-            # Verify job is in review status
-            job = await mock_database.get_job(job_id)
-            assert job is not None
-            assert job.status == JobStatus.REVIEW
-            assert job.confidence is not None
-            assert job.confidence < test_config.auto_approve_threshold
-
-            # Simulate manual approval by setting status to MOVING
-            await mock_database.update_job_status(job_id, JobStatus.MOVING)
+        # Verify job is in review status
+        job = await mock_database.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.REVIEW
+        assert job.confidence is not None
+        assert job.confidence < test_config.auto_approve_threshold
 
-            # Wait for file mover to complete
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.COMPLETE:
-                    break
-                await asyncio.sleep(0.01)
+        # Simulate manual approval by setting status to MOVING
+        await mock_database.update_job_status(job_id, JobStatus.MOVING)
 
-            # Verify job completed
-            job = await mock_database.get_job(job_id)
-            assert job is not None
-            assert job.status == JobStatus.COMPLETE
+        # Wait for file mover to complete
+        await mock_database.wait_for_status(job_id, JobStatus.COMPLETE)
 
-        finally:
-            await file_mover.stop()
-            await identifier.stop()
-            await encode_queue.stop()
-            await rip_queue.stop()
+        # Verify job completed
+        job = await mock_database.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.COMPLETE
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_state_transition_pending_to_ripping(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -749,11 +894,9 @@ class TestJobStateTransitions:
             assert job.status == JobStatus.PENDING
 
             # Wait for ripping to start
-            for _ in range(50):
-                job = await mock_database.get_job(job_id)
-                if job and job.status in (JobStatus.RIPPING, JobStatus.RIPPED):
-                    break
-                await asyncio.sleep(0.01)
+            await mock_database.wait_for_status(
+                job_id, JobStatus.RIPPING, JobStatus.RIPPED, timeout=0.5
+            )
 
             # Verify state transition happened
             job = await mock_database.get_job(job_id)
@@ -763,7 +906,7 @@ class TestJobStateTransitions:
         finally:
             await rip_queue.stop()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_state_transition_ripped_to_encoding(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -771,19 +914,14 @@ class TestJobStateTransitions:
         rip_queue = MockRipQueue(mock_database, test_config)
         encode_queue = MockEncodeQueue(mock_database, test_config)
 
-        await rip_queue.start()
-        await encode_queue.start()
+        await asyncio.gather(rip_queue.start(), encode_queue.start())
 
         try:
             # Create a job directly
             job_id = await mock_database.create_job("disk0", "TEST_DISC")
 
             # Wait for ripping and encoding
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.ENCODED:
-                    break
-                await asyncio.sleep(0.01)
+            await mock_database.wait_for_status(job_id, JobStatus.ENCODED)
 
             job = await mock_database.get_job(job_id)
             assert job is not None
@@ -792,10 +930,13 @@ class TestJobStateTransitions:
             assert job.encode_path is not None
 
         finally:
-            await encode_queue.stop()
-            await rip_queue.stop()
+            await asyncio.gather(
+                encode_queue.stop(),
+                rip_queue.stop(),
+                return_exceptions=True,
+            )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_state_transition_encoded_to_identifying(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -804,19 +945,17 @@ class TestJobStateTransitions:
         encode_queue = MockEncodeQueue(mock_database, test_config)
         identifier = MockIdentifierService(mock_database, test_config)
 
-        await rip_queue.start()
-        await encode_queue.start()
-        await identifier.start()
+        await asyncio.gather(
+            rip_queue.start(),
+            encode_queue.start(),
+            identifier.start(),
+        )
 
         try:
             job_id = await mock_database.create_job("disk0", "THE_GODFATHER")
 
             # Wait for identification
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status in (JobStatus.REVIEW, JobStatus.MOVING):
-                    break
-                await asyncio.sleep(0.01)
+            await mock_database.wait_for_status(job_id, JobStatus.REVIEW, JobStatus.MOVING)
 
             job = await mock_database.get_job(job_id)
             assert job is not None
@@ -825,11 +964,14 @@ class TestJobStateTransitions:
             assert job.tmdb_id is not None
 
         finally:
-            await identifier.stop()
-            await encode_queue.stop()
-            await rip_queue.stop()
+            await asyncio.gather(
+                identifier.stop(),
+                encode_queue.stop(),
+                rip_queue.stop(),
+                return_exceptions=True,
+            )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_parallel_drive_processing(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -841,21 +983,16 @@ class TestJobStateTransitions:
 
         try:
             # Insert discs in both drives simultaneously
-            job1_id = await drive_watcher.simulate_disc_insertion("disk0", "MOVIE_A")
-            job2_id = await drive_watcher.simulate_disc_insertion("disk1", "MOVIE_B")
+            job1_id, job2_id = await asyncio.gather(
+                drive_watcher.simulate_disc_insertion("disk0", "MOVIE_A"),
+                drive_watcher.simulate_disc_insertion("disk1", "MOVIE_B"),
+            )
 
             # Wait for both to be ripped
-            for _ in range(100):
-                job1 = await mock_database.get_job(job1_id)
-                job2 = await mock_database.get_job(job2_id)
-                if (
-                    job1
-                    and job2
-                    and job1.status == JobStatus.RIPPED
-                    and job2.status == JobStatus.RIPPED
-                ):
-                    break
-                await asyncio.sleep(0.01)
+            await mock_database.wait_for(
+                lambda: mock_database.jobs[job1_id].status == JobStatus.RIPPED
+                and mock_database.jobs[job2_id].status == JobStatus.RIPPED
+            )
 
             # Both jobs should be ripped
             job1 = await mock_database.get_job(job1_id)
@@ -870,15 +1007,13 @@ class TestJobStateTransitions:
         finally:
             await rip_queue.stop()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_custom_identification_result(
-        self, test_config: Config, mock_database: MockDatabase
+        self, mock_database: MockDatabase, pipeline: PipelineServices
     ) -> None:
         """Test with custom identification result preset."""
-        identifier = MockIdentifierService(mock_database, test_config)
-
         # Set up custom identification
-        identifier.set_identification(
+        pipeline.identifier.set_identification(
             "STAR_WARS_1977",
             IdentificationResult(
                 content_type=ContentType.MOVIE,
@@ -891,37 +1026,17 @@ class TestJobStateTransitions:
             ),
         )
 
-        rip_queue = MockRipQueue(mock_database, test_config)
-        encode_queue = MockEncodeQueue(mock_database, test_config)
-        file_mover = MockFileMover(mock_database, test_config)
-
-        await rip_queue.start()
-        await encode_queue.start()
-        await identifier.start()
-        await file_mover.start()
-
-        try:
-            job_id = await mock_database.create_job("disk0", "STAR_WARS_1977")
+        job_id = await mock_database.create_job("disk0", "STAR_WARS_1977")
 
-            # Wait for completion
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.COMPLETE:
-                    break
-                await asyncio.sleep(0.01)
+        # Wait for completion
+        await mock_database.wait_for_status(job_id, JobStatus.COMPLETE)
 
-            job = await mock_database.get_job(job_id)
-            assert job is not None
-            assert job.status == JobStatus.COMPLETE
-            assert job.identified_title == "Star Wars: Episode IV - A New Hope"
-            assert job.identified_year == 1977
-            assert job.tmdb_id == 11
-
-        finally:
-            await file_mover.stop()
-            await identifier.stop()
-            await encode_queue.stop()
-            await rip_queue.stop()
+        job = await mock_database.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.COMPLETE
+        assert job.identified_title == "Star Wars: Episode IV - A New Hope"
+        assert job.identified_year == 1977
+        assert job.tmdb_id == 11
 
 
 class TestConfigFixture:
@@ -947,7 +1062,7 @@ class TestConfigFixture:
 class TestDatabaseFixture:
     """Test the database fixture."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_and_retrieve_job(self, mock_database: MockDatabase) -> None:
         """Test creating and retrieving a job."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -959,7 +1074,7 @@ class TestDatabaseFixture:
         assert job.disc_label == "TEST_DISC"
         assert job.status == JobStatus.PENDING
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_update_job_status(self, mock_database: MockDatabase) -> None:
         """Test updating job status."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -969,7 +1084,7 @@ class TestDatabaseFixture:
         assert job is not None
         assert job.status == JobStatus.RIPPING
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_jobs_by_status(self, mock_database: MockDatabase) -> None:
         """Test getting jobs by status."""
         job1_id = await mock_database.create_job("disk0", "DISC_1")
@@ -984,11 +1099,64 @@ class TestDatabaseFixture:
         assert len(ripping_jobs) == 1
         assert ripping_jobs[0].disc_label == "DISC_1"
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_jobs_by_status_after_transitions(
+        self, mock_database: MockDatabase
+    ) -> None:
+        """Test that jobs leave their previous status when they transition."""
+        job_id = await mock_database.create_job("disk0", "DISC_1")
+        await mock_database.update_job_status(job_id, JobStatus.RIPPING)
+        await mock_database.update_job_status(job_id, JobStatus.RIPPED)
+
+        assert await mock_database.get_jobs_by_status(JobStatus.PENDING) == []
+        assert await mock_database.get_jobs_by_status(JobStatus.RIPPING) == []
+        ripped_jobs = await mock_database.get_jobs_by_status(JobStatus.RIPPED)
+        assert [job.id for job in ripped_jobs] == [job_id]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_wait_for_status(self, mock_database: MockDatabase) -> None:
+        """Test waiting for a status change, and giving up after the timeout."""
+        job_id = await mock_database.create_job("disk0", "DISC_1")
+
+        async def advance() -> None:
+            await asyncio.sleep(0)
+            await mock_database.update_job_status(job_id, JobStatus.RIPPING)
+
+        task = asyncio.create_task(advance())
+        job = await mock_database.wait_for_status(job_id, JobStatus.RIPPING)
+        await task
+        assert job is not None
+        assert job.status == JobStatus.RIPPING
+
+        job = await mock_database.wait_for_status(
+            job_id, JobStatus.RIPPED, timeout=0.01
+        )
+        assert job is not None
+        assert job.status == JobStatus.RIPPING
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_timestamps_refresh_between_ticks(
+        self, mock_database: MockDatabase
+    ) -> None:
+        """Test that the cached timestamp is reused within a tick but not across ticks."""
+        job_id = await mock_database.create_job("disk0", "DISC_1")
+        job = await mock_database.get_job(job_id)
+        assert job is not None
+        assert job.created_at == job.updated_at
+
+        created_at = job.created_at
+        await asyncio.sleep(0.001)
+        await mock_database.update_job_status(job_id, JobStatus.RIPPING)
+
+        assert job.updated_at is not None
+        assert created_at is not None
+        assert job.updated_at > created_at
+
 
 class TestErrorHandling:
     """Test error handling in the pipeline."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_failed_job_status(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -1003,7 +1171,7 @@ class TestErrorHandling:
         assert job.status == JobStatus.FAILED
         assert job.error_message == "Disc read error"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_file_mover_missing_identification(
         self, test_config: Config, mock_database: MockDatabase
     ) -> None:
@@ -1017,11 +1185,7 @@ class TestErrorHandling:
             await mock_database.update_job_status(job_id, JobStatus.MOVING)
 
             # Wait for file mover to process
-            for _ in range(50):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.FAILED:
-                    break
-                await asyncio.sleep(0.01)
+            await mock_database.wait_for_status(job_id, JobStatus.FAILED, timeout=0.5)
 
             job = await mock_database.get_job(job_id)
             assert job is not None
@@ -1031,11 +1195,47 @@ class TestErrorHandling:
         finally:
             await file_mover.stop()
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_service_error_fails_only_that_job(
+        self,
+        test_config: Config,
+        mock_database: MockDatabase,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a job raising in a service fails while its batch-mates go on."""
+        rip_queue = MockRipQueue(mock_database, test_config)
+        process_job = rip_queue._process_job
+
+        async def flaky_process_job(job: Job) -> None:
+            if job.disc_label == "BAD_DISC":
+                raise RuntimeError("Drive read error")
+            await process_job(job)
+
+        monkeypatch.setattr(rip_queue, "_process_job", flaky_process_job)
+
+        # Queue both jobs before starting so they are processed in one batch
+        bad_id = await mock_database.create_job("disk0", "BAD_DISC")
+        good_id = await mock_database.create_job("disk1", "GOOD_DISC")
+        await rip_queue.start()
+
+        try:
+            bad_job = await mock_database.wait_for_status(bad_id, JobStatus.FAILED)
+            good_job = await mock_database.wait_for_status(good_id, JobStatus.RIPPED)
+
+            assert bad_job is not None
+            assert bad_job.status == JobStatus.FAILED
+            assert bad_job.error_message == "Drive read error"
+            assert good_job is not None
+            assert good_job.status == JobStatus.RIPPED
+
+        finally:
+            await rip_queue.stop()
+
 
 class TestNotifications:
     """Test notification integration."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_notification_on_disc_complete(
         self, test_config: Config
     ) -> None:
@@ -1044,20 +1244,20 @@ class TestNotifications:
         await notifier.notify_disc_complete("THE_MATRIX", "The Matrix (1999)")
 
         assert len(notifier.notifications) == 1
-        assert "Disc Complete" in notifier.notifications[0]["title"]
-        assert "The Matrix" in notifier.notifications[0]["message"]
+        assert "Disc Complete" in notifier.notifications[0].title
+        assert "The Matrix" in notifier.notifications[0].message
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_notification_on_error(self, test_config: Config) -> None:
         """Test notification sent on error."""
         notifier = MockNotifier(test_config)
         await notifier.notify_error("BAD_DISC", "Unreadable disc")
 
         assert len(notifier.notifications) == 1
-        assert "Error" in notifier.notifications[0]["title"]
-        assert notifier.notifications[0]["priority"] == 1
+        assert "Error" in notifier.notifications[0].title
+        assert notifier.notifications[0].priority == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_notification_on_review_needed(
         self, test_config: Config
     ) -> None:
@@ -1066,47 +1266,26 @@ class TestNotifications:
         await notifier.notify_review_needed("UNKNOWN_DISC", "Possible Match (2020)")
 
         assert len(notifier.notifications) == 1
-        assert "Review" in notifier.notifications[0]["title"]
-        assert notifier.notifications[0]["url"] is not None
+        assert "Review" in notifier.notifications[0].title
+        assert notifier.notifications[0].url is not None
 
 
 class TestCollectionTracking:
     """Test collection tracking functionality."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_add_to_collection_on_complete(
-        self, test_config: Config, mock_database: MockDatabase
+        self, mock_database: MockDatabase, pipeline: PipelineServices
     ) -> None:
         """Test that completed jobs are added to collection."""
-        rip_queue = MockRipQueue(mock_database, test_config)
-        encode_queue = MockEncodeQueue(mock_database, test_config)
-        identifier = MockIdentifierService(mock_database, test_config, default_confidence=0.95)
-        file_mover = MockFileMover(mock_database, test_config)
+        job_id = await mock_database.create_job("disk0", "INCEPTION_2010")
 
-        await rip_queue.start()
-        await encode_queue.start()
-        await identifier.start()
-        await file_mover.start()
-
-        try:
-            job_id = await mock_database.create_job("disk0", "INCEPTION_2010")
-
-            # Wait for completion
-            for _ in range(100):
-                job = await mock_database.get_job(job_id)
-                if job and job.status == JobStatus.COMPLETE:
-                    break
-                await asyncio.sleep(0.01)
+        # Wait for completion
+        await mock_database.wait_for_status(job_id, JobStatus.COMPLETE)
 
-            # Verify collection was updated
-            assert len(mock_database.collection) == 1
-            assert mock_database.collection[0]["title"] is not None
-
-        finally:
-            await file_mover.stop()
-            await identifier.stop()
-            await encode_queue.stop()
-            await rip_queue.stop()
+        # Verify collection was updated
+        assert len(mock_database.collection) == 1
+        assert mock_database.collection[0]["title"] is not None
 
 
 # ============================================================================
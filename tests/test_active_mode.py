@@ -1,5 +1,7 @@
 """Tests for active mode toggle functionality."""
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -7,20 +9,47 @@ from dvdtoplex.config import Config
 from dvdtoplex.web.app import create_app
 
 
+# The apps and their clients are built once per module. Entering the
+# TestClient context keeps one event-loop portal alive for every request,
+# and the client fixtures reset the only state these tests mutate
+# (active_mode) before each test.
+
+
+@pytest.fixture(scope="module")
+def _default_client() -> Iterator[TestClient]:
+    """Create a client for an app with default config, shared by the module."""
+    with TestClient(create_app(config=Config())) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def _active_client() -> Iterator[TestClient]:
+    """Create a client for an app with active mode enabled, shared by the module."""
+    with TestClient(create_app(config=Config(active_mode=True))) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client() -> TestClient:
+def client(_default_client: TestClient) -> TestClient:
     """Create a test client with default config."""
-    config = Config()
-    app = create_app(config=config)
-    return TestClient(app)
+    _default_client.app.state.active_mode = False
+    return _default_client
 
 
 @pytest.fixture
-def client_active() -> TestClient:
+def client_active(_active_client: TestClient) -> TestClient:
     """Create a test client with active mode enabled."""
-    config = Config(active_mode=True)
-    app = create_app(config=config)
-    return TestClient(app)
+    _active_client.app.state.active_mode = True
+    return _active_client
+
+
+@pytest.fixture(scope="module")
+def dashboard_html(_default_client: TestClient) -> str:
+    """Render the default dashboard once for read-only assertions."""
+    _default_client.app.state.active_mode = False
+    response = _default_client.get("/")
+    assert response.status_code == 200
+    return response.text
 
 
 class TestActiveModeToggle:
@@ -79,40 +108,30 @@ class TestActiveModeToggle:
         response2 = client.post("/api/active-mode")
         assert response2.json()["active_mode"] is False
 
-    def test_dashboard_renders_toggle_button(self, client: TestClient) -> None:
+    def test_dashboard_renders_toggle_button(self, dashboard_html: str) -> None:
         """Test that the dashboard contains the toggle button."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert 'id="active-mode-toggle"' in response.text
-        assert "btn-toggle" in response.text
+        assert 'id="active-mode-toggle"' in dashboard_html
+        assert "btn-toggle" in dashboard_html
 
-    def test_dashboard_includes_javascript(self, client: TestClient) -> None:
+    def test_dashboard_includes_javascript(self, dashboard_html: str) -> None:
         """Test that the dashboard includes the JavaScript for toggle functionality."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "fetch('/api/active-mode'" in response.text
-        assert "method: 'POST'" in response.text
-        assert "window.location.reload()" in response.text
+        assert "fetch('/api/active-mode'" in dashboard_html
+        assert "method: 'POST'" in dashboard_html
+        assert "window.location.reload()" in dashboard_html
 
 
 class TestDashboardRoutes:
     """Tests for dashboard page rendering."""
 
-    def test_dashboard_loads(self, client: TestClient) -> None:
+    def test_dashboard_loads(self, dashboard_html: str) -> None:
         """Test that the dashboard page loads successfully."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "Dashboard" in response.text
-        assert "DVD to Plex" in response.text
+        assert "Dashboard" in dashboard_html
+        assert "DVD to Plex" in dashboard_html
 
-    def test_dashboard_shows_drive_status_section(self, client: TestClient) -> None:
+    def test_dashboard_shows_drive_status_section(self, dashboard_html: str) -> None:
         """Test that the dashboard shows the drive status section."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "Drive Status" in response.text
+        assert "Drive Status" in dashboard_html
 
-    def test_dashboard_shows_recent_jobs_section(self, client: TestClient) -> None:
+    def test_dashboard_shows_recent_jobs_section(self, dashboard_html: str) -> None:
         """Test that the dashboard shows the recent jobs section."""
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "Recent Jobs" in response.text
+        assert "Recent Jobs" in dashboard_html
@@ -5,6 +5,7 @@ Verifies the Application can initialize and shutdown cleanly.
 
 import pytest
 import pytest_asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -20,44 +21,50 @@ async def temp_config() -> Config:
         yield config
 
 
-@pytest.mark.asyncio
-async def test_application_initialize_creates_directories(temp_config: Config) -> None:
-    """Test that initialize() creates workspace and staging directories."""
-    app = Application(temp_config)
-
-    # Directories should not exist yet
-    assert not temp_config.workspace_dir.exists() or not any(temp_config.workspace_dir.iterdir())
-
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def initialized_app(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncIterator[Application]:
+    """Create an Application initialized once and shared by a test class."""
+    # A path that does not exist yet, so initialize() has to create it
+    config = Config(workspace_dir=tmp_path_factory.mktemp("lifecycle") / "workspace")
+    app = Application(config)
     await app.initialize()
-
-    # Verify directories exist
-    assert temp_config.workspace_dir.exists(), "workspace_dir should exist"
-    assert temp_config.staging_dir.exists(), "staging_dir should exist"
-    assert temp_config.encoding_dir.exists(), "encoding_dir should exist"
-
-    # Cleanup
+    yield app
     await app.shutdown()
 
 
-@pytest.mark.asyncio
-async def test_application_initialize_creates_database(temp_config: Config) -> None:
-    """Test that initialize() creates and initializes the database."""
+async def test_application_not_initialized_before_initialize(temp_config: Config) -> None:
+    """Test that constructing an Application creates no directories or connection."""
     app = Application(temp_config)
 
+    # Directories should not exist yet
+    assert not temp_config.workspace_dir.exists() or not any(temp_config.workspace_dir.iterdir())
+
     # Database should be closed before initialize
     assert app.database.is_closed, "database should be closed before initialize"
 
-    await app.initialize()
 
-    # Verify database is initialized and open
-    assert app.database is not None, "database should be initialized"
-    assert not app.database.is_closed, "database should be open after initialize"
+class TestApplicationInitialize:
+    """Test the state left by initialize(), sharing one initialized Application."""
 
-    # Cleanup
-    await app.shutdown()
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_initialize_creates_directories(self, initialized_app: Application) -> None:
+        """Test that initialize() creates workspace and staging directories."""
+        config = initialized_app.config
+
+        assert config.workspace_dir.exists(), "workspace_dir should exist"
+        assert config.staging_dir.exists(), "staging_dir should exist"
+        assert config.encoding_dir.exists(), "encoding_dir should exist"
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_initialize_creates_database(self, initialized_app: Application) -> None:
+        """Test that initialize() creates and initializes the database."""
+        assert initialized_app.database is not None, "database should be initialized"
+        assert not initialized_app.database.is_closed, "database should be open after initialize"
+        assert (initialized_app.config.workspace_dir / "dvdtoplex.db").exists()
 
 
-@pytest.mark.asyncio
 async def test_application_shutdown_closes_database(temp_config: Config) -> None:
     """Test that shutdown() closes the database connection."""
     app = Application(temp_config)
@@ -73,7 +80,6 @@ async def test_application_shutdown_closes_database(temp_config: Config) -> None
     assert app.database.is_closed, "database should be closed after shutdown"
 
 
-@pytest.mark.asyncio
 async def test_application_full_lifecycle(temp_config: Config) -> None:
     """Test complete Application lifecycle: init -> shutdown."""
     app = Application(temp_config)
@@ -96,7 +102,6 @@ async def test_application_full_lifecycle(temp_config: Config) -> None:
     print("Application shutdown OK")
 
 
-@pytest.mark.asyncio
 async def test_application_shutdown_idempotent(temp_config: Config) -> None:
     """Test that calling shutdown multiple times is safe."""
     app = Application(temp_config)
@@ -114,7 +119,6 @@ async def test_application_shutdown_idempotent(temp_config: Config) -> None:
 class TestApplicationLifecycleWithRealTempDir:
     """Test Application lifecycle using a real temporary directory context manager."""
 
-    @pytest.mark.asyncio
     async def test_initialize_shutdown_cycle(self) -> None:
         """Test Application can be initialized and shut down cleanly."""
         with TemporaryDirectory() as tmpdir:
@@ -1,31 +1,77 @@
 """Tests for collection functionality including database and web routes."""
 
+import asyncio
+import sqlite3
 from collections.abc import AsyncGenerator
-from pathlib import Path
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
 
 from dvdtoplex.database import ContentType, Database
 from dvdtoplex.web.app import create_app
 
 
 @pytest_asyncio.fixture
-async def db(tmp_path: Path) -> AsyncGenerator[Database, None]:
-    """Create a temporary database for testing."""
-    db_path = tmp_path / "test.db"
-    database = Database(str(db_path))
+async def db() -> AsyncGenerator[Database, None]:
+    """Create an in-memory database for testing."""
+    database = Database(":memory:")
     await database.connect()
     yield database
     await database.close()
 
 
-@pytest.fixture
-def client(db: Database) -> TestClient:
-    """Create a test client with the database."""
-    app = create_app(database=db)
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Build the app once; routes read the database from app state per request."""
+    return create_app()
+
+
+@pytest_asyncio.fixture
+async def client(app: FastAPI, db: Database) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client bound to this test's database."""
+    app.state.database = db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as test_client:
+        yield test_client
+
+
+async def _render_collection(
+    app: FastAPI,
+    items: list[tuple[str | ContentType, str, int | None, int | None, str]],
+) -> str:
+    """Render /collection against a throwaway database holding items."""
+    database = Database(":memory:")
+    await database.connect()
+    previous_database = app.state.database
+    try:
+        await database.add_many_to_collection(items)
+        app.state.database = database
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as test_client:
+            response = await test_client.get("/collection")
+    finally:
+        app.state.database = previous_database
+        await database.close()
+    assert response.status_code == 200
+    return response.text
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def collection_html_empty(app: FastAPI) -> str:
+    """Render the empty collection page once for static markup assertions."""
+    return await _render_collection(app, [])
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def collection_html_with_item(app: FastAPI) -> str:
+    """Render the collection page with one movie once for static markup assertions."""
+    return await _render_collection(
+        app, [("movie", "Test Movie", 2023, 1, "/path")]
+    )
 
 
 class TestContentType:
@@ -41,7 +87,6 @@ class TestContentType:
 class TestDatabaseCollection:
     """Tests for database collection operations."""
 
-    @pytest.mark.asyncio
     async def test_add_movie_to_collection(self, db: Database) -> None:
         """Should add a movie to the collection."""
         item_id = await db.add_to_collection(
@@ -61,7 +106,6 @@ class TestDatabaseCollection:
         assert items[0]["content_type"] == "movie"
         assert items[0]["tmdb_id"] == 603
 
-    @pytest.mark.asyncio
     async def test_add_tv_season_to_collection(self, db: Database) -> None:
         """Should add a TV season to the collection."""
         item_id = await db.add_to_collection(
@@ -79,7 +123,6 @@ class TestDatabaseCollection:
         assert items[0]["title"] == "Breaking Bad"
         assert items[0]["content_type"] == "tv_season"
 
-    @pytest.mark.asyncio
     async def test_add_item_with_unknown_year(self, db: Database) -> None:
         """Should add an item with no year to the collection."""
         item_id = await db.add_to_collection(
@@ -96,12 +139,15 @@ class TestDatabaseCollection:
         assert len(items) == 1
         assert items[0]["year"] is None
 
-    @pytest.mark.asyncio
     async def test_get_collection_ordered_by_date(self, db: Database) -> None:
         """Collection should be ordered by added_at descending."""
-        await db.add_to_collection("movie", "First Movie", 2000, 1, "/path1")
-        await db.add_to_collection("movie", "Second Movie", 2001, 2, "/path2")
-        await db.add_to_collection("movie", "Third Movie", 2002, 3, "/path3")
+        await db.add_many_to_collection(
+            [
+                ("movie", "First Movie", 2000, 1, "/path1"),
+                ("movie", "Second Movie", 2001, 2, "/path2"),
+                ("movie", "Third Movie", 2002, 3, "/path3"),
+            ]
+        )
 
         items = await db.get_collection()
         assert len(items) == 3
@@ -109,7 +155,73 @@ class TestDatabaseCollection:
         assert items[0]["title"] == "Third Movie"
         assert items[2]["title"] == "First Movie"
 
-    @pytest.mark.asyncio
+    async def test_add_many_to_collection(self, db: Database) -> None:
+        """Should insert several items at once and return their IDs in order."""
+        first_id = await db.add_to_collection("movie", "Existing", 1999, 1, "/p0")
+
+        item_ids = await db.add_many_to_collection(
+            [
+                ("movie", "Alien", 1979, 348, "/p1"),
+                (ContentType.TV_SEASON, "Firefly", 2002, 1437, "/p2"),
+            ]
+        )
+
+        assert item_ids == [first_id + 1, first_id + 2]
+        items = {item["id"]: item for item in await db.get_collection()}
+        assert items[item_ids[0]]["title"] == "Alien"
+        assert items[item_ids[1]]["content_type"] == "tv_season"
+        assert await db.add_many_to_collection([]) == []
+        assert await db.count_collection() == 3
+
+    @pytest.mark.parametrize("batch_first", [True, False])
+    async def test_add_many_to_collection_with_concurrent_add(
+        self, db: Database, batch_first: bool
+    ) -> None:
+        """Should return the batch's own IDs when another insert interleaves."""
+        batch = db.add_many_to_collection(
+            [
+                ("movie", "Alien", 1979, 348, "/p1"),
+                ("movie", "Aliens", 1986, 679, "/p2"),
+            ]
+        )
+        single = db.add_to_collection("movie", "Heat", 1995, 949, "/p3")
+
+        if batch_first:
+            item_ids, single_id = await asyncio.gather(batch, single)
+        else:
+            single_id, item_ids = await asyncio.gather(single, batch)
+
+        titles = {item["id"]: item["title"] for item in await db.get_collection()}
+        assert [titles[item_id] for item_id in item_ids] == ["Alien", "Aliens"]
+        assert titles[single_id] == "Heat"
+
+    @pytest.mark.parametrize("batch_first", [True, False])
+    async def test_add_many_to_collection_failure_is_atomic(
+        self, db: Database, batch_first: bool
+    ) -> None:
+        """A bad row should undo the whole batch but not a concurrent add."""
+        batch = db.add_many_to_collection(
+            [
+                ("movie", "A", 2001, 1, "/a"),
+                ("movie", "B", 2002, 2, "/b"),
+                ("movie", None, 2003, 3, "/c"),  # title is NOT NULL
+            ]
+        )
+        single = db.add_to_collection("movie", "Heat", 1995, 949, "/heat")
+
+        if batch_first:
+            batch_result, single_id = await asyncio.gather(
+                batch, single, return_exceptions=True
+            )
+        else:
+            single_id, batch_result = await asyncio.gather(
+                single, batch, return_exceptions=True
+            )
+
+        assert isinstance(batch_result, sqlite3.IntegrityError)
+        items = await db.get_collection()
+        assert [(item["id"], item["title"]) for item in items] == [(single_id, "Heat")]
+
     async def test_remove_from_collection(self, db: Database) -> None:
         """Should remove an item from the collection."""
         item_id = await db.add_to_collection(
@@ -122,11 +234,8 @@ class TestDatabaseCollection:
 
         result = await db.remove_from_collection(item_id)
         assert result is True
+        assert await db.count_collection() == 0
 
-        items = await db.get_collection()
-        assert len(items) == 0
-
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_item(self, db: Database) -> None:
         """Should return False when removing nonexistent item."""
         result = await db.remove_from_collection(9999)
@@ -136,26 +245,24 @@ class TestDatabaseCollection:
 class TestCollectionWebRoute:
     """Tests for the /collection web route."""
 
-    @pytest.mark.asyncio
-    async def test_collection_page_empty(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_collection_page_empty(self, collection_html_empty: str) -> None:
         """Collection page should render with empty state."""
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert "Your collection is empty" in response.text
-        assert "Collection" in response.text
+        assert "Your collection is empty" in collection_html_empty
+        assert "Collection" in collection_html_empty
 
-    @pytest.mark.asyncio
     async def test_collection_page_with_items(
-        self, db: Database, client: TestClient
+        self, db: Database, client: AsyncClient
     ) -> None:
         """Collection page should display items with title, year, and badge."""
         # Add test items
-        await db.add_to_collection("movie", "Inception", 2010, 27205, "/path1")
-        await db.add_to_collection("tv_season", "The Office", 2005, 2316, "/path2")
+        await db.add_many_to_collection(
+            [
+                ("movie", "Inception", 2010, 27205, "/path1"),
+                ("tv_season", "The Office", 2005, 2316, "/path2"),
+            ]
+        )
 
-        response = client.get("/collection")
+        response = await client.get("/collection")
         assert response.status_code == 200
 
         # Check title is displayed
@@ -173,54 +280,46 @@ class TestCollectionWebRoute:
         # Jinja2 title filter produces "Tv_season" (first letter of each word capitalized)
         assert "Tv_season" in response.text
 
-    @pytest.mark.asyncio
     async def test_collection_page_with_unknown_year(
-        self, db: Database, client: TestClient
+        self, db: Database, client: AsyncClient
     ) -> None:
         """Collection page should handle items with unknown year."""
         await db.add_to_collection("movie", "Mystery Film", None, None, "/path")
 
-        response = client.get("/collection")
+        response = await client.get("/collection")
         assert response.status_code == 200
         assert "Mystery Film" in response.text
         assert "Unknown Year" in response.text
 
-    @pytest.mark.asyncio
-    async def test_collection_has_search_input(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_collection_has_search_input(self, collection_html_empty: str) -> None:
         """Collection page should have search input for filtering."""
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert 'id="search-input"' in response.text
-        assert "Search collection" in response.text
+        assert 'id="search-input"' in collection_html_empty
+        assert "Search collection" in collection_html_empty
 
-    @pytest.mark.asyncio
-    async def test_collection_items_have_data_attributes(
-        self, db: Database, client: TestClient
+    def test_collection_items_have_data_attributes(
+        self, collection_html_with_item: str
     ) -> None:
         """Collection items should have data attributes for search filtering."""
-        await db.add_to_collection("movie", "Test Movie", 2023, 1, "/path")
-
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert 'data-title="test movie"' in response.text
-        assert 'data-year="2023"' in response.text
+        assert 'data-title="test movie"' in collection_html_with_item
+        assert 'data-year="2023"' in collection_html_with_item
 
 
 class TestCollectionBadgeStyling:
     """Tests for badge CSS classes in templates."""
 
-    @pytest.mark.asyncio
     async def test_badge_classes_exist_in_base(
-        self, db: Database, client: TestClient
+        self, db: Database, client: AsyncClient
     ) -> None:
         """Base template should include badge CSS classes."""
         # Add items with different content types to render badge classes
-        await db.add_to_collection("movie", "Test Movie", 2023, 1, "/path1")
-        await db.add_to_collection("tv_season", "Test Show", 2022, 2, "/path2")
+        await db.add_many_to_collection(
+            [
+                ("movie", "Test Movie", 2023, 1, "/path1"),
+                ("tv_season", "Test Show", 2022, 2, "/path2"),
+            ]
+        )
 
-        response = client.get("/collection")
+        response = await client.get("/collection")
         assert response.status_code == 200
 
         # Badge classes are rendered dynamically based on content type
@@ -231,97 +330,59 @@ class TestCollectionBadgeStyling:
 class TestCollectionClientSideFiltering:
     """Tests for client-side search filtering functionality."""
 
-    @pytest.mark.asyncio
-    async def test_search_input_has_correct_attributes(
-        self, db: Database, client: TestClient
+    def test_search_input_has_correct_attributes(
+        self, collection_html_empty: str
     ) -> None:
         """Search input should have required attributes for filtering."""
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert 'id="search-input"' in response.text
-        assert 'class="form-input"' in response.text  # Template uses form-input class
-        assert 'placeholder="Search collection' in response.text
+        assert 'id="search-input"' in collection_html_empty
+        assert 'class="form-input"' in collection_html_empty  # Template uses form-input class
+        assert 'placeholder="Search collection' in collection_html_empty
 
-    @pytest.mark.asyncio
-    async def test_javascript_filter_event_listener(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_javascript_filter_event_listener(self, collection_html_empty: str) -> None:
         """Template should include event listener for search input."""
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert "addEventListener" in response.text
-        assert "'input'" in response.text
+        assert "addEventListener" in collection_html_empty
+        assert "'input'" in collection_html_empty
 
-    @pytest.mark.asyncio
-    async def test_javascript_filter_logic(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_javascript_filter_logic(self, collection_html_empty: str) -> None:
         """Template should include filter logic for title and year matching."""
-        response = client.get("/collection")
-        assert response.status_code == 200
         # Check for core filtering logic
-        assert "toLowerCase()" in response.text
-        assert "includes(query)" in response.text
-        assert "dataset.title" in response.text
-        assert "dataset.year" in response.text
-
-    @pytest.mark.asyncio
-    async def test_javascript_display_toggle(
-        self, db: Database, client: TestClient
-    ) -> None:
+        assert "toLowerCase()" in collection_html_empty
+        assert "includes(query)" in collection_html_empty
+        assert "dataset.title" in collection_html_empty
+        assert "dataset.year" in collection_html_empty
+
+    def test_javascript_display_toggle(self, collection_html_empty: str) -> None:
         """Template should toggle item visibility based on search."""
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert "style.display" in response.text
+        assert "style.display" in collection_html_empty
 
-    @pytest.mark.asyncio
-    async def test_javascript_no_results_handling(
-        self, db: Database, client: TestClient
+    def test_javascript_no_results_handling(
+        self, collection_html_with_item: str
     ) -> None:
         """Template should show/hide no-results message."""
-        # Add an item so the no-results element is rendered
-        await db.add_to_collection("movie", "Test Movie", 2023, 1, "/path")
-
-        response = client.get("/collection")
-        assert response.status_code == 200
-        assert 'id="no-results"' in response.text
+        assert 'id="no-results"' in collection_html_with_item
         # Template uses style.display instead of classList.toggle
-        assert "noResults.style.display" in response.text
-        assert "No items match your search" in response.text
+        assert "noResults.style.display" in collection_html_with_item
+        assert "No items match your search" in collection_html_with_item
 
-    @pytest.mark.asyncio
-    async def test_javascript_visible_count_update(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_javascript_visible_count_update(self, collection_html_empty: str) -> None:
         """Template should track visible item count during filtering."""
-        response = client.get("/collection")
-        assert response.status_code == 200
         # Template tracks visible count internally (not displayed in element)
-        assert "visibleCount" in response.text
-        assert "visibleCount++" in response.text
+        assert "visibleCount" in collection_html_empty
+        assert "visibleCount++" in collection_html_empty
 
-    @pytest.mark.asyncio
     async def test_collection_items_have_lowercase_data_title(
-        self, db: Database, client: TestClient
+        self, db: Database, client: AsyncClient
     ) -> None:
         """Collection items should have lowercase data-title for case-insensitive search."""
         await db.add_to_collection("movie", "The MATRIX", 1999, 603, "/path")
 
-        response = client.get("/collection")
+        response = await client.get("/collection")
         assert response.status_code == 200
         # Title should be lowercased in data-title attribute
         assert 'data-title="the matrix"' in response.text
 
-    @pytest.mark.asyncio
-    async def test_no_results_hidden_by_default(
-        self, db: Database, client: TestClient
-    ) -> None:
+    def test_no_results_hidden_by_default(self, collection_html_with_item: str) -> None:
         """No-results message should be hidden by default."""
-        # Add an item so the no-results element is rendered
-        await db.add_to_collection("movie", "Test Movie", 2023, 1, "/path")
-
-        response = client.get("/collection")
-        assert response.status_code == 200
         # No-results is hidden by inline style, not CSS class
-        assert 'id="no-results"' in response.text
-        assert 'style="display: none' in response.text
+        assert 'id="no-results"' in collection_html_with_item
+        assert 'style="display: none' in collection_html_with_item
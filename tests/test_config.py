@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from dvdtoplex.config import Config, DEFAULT_AUTO_APPROVE_THRESHOLD, load_config
 
+_WORKSPACE = Path("/test/workspace")
+_HOME_MOVIES = Path("/test/home/movies")
+_OTHER = Path("/test/other")
+
 
 class TestConfig:
     """Tests for Config dataclass."""
@@ -29,40 +34,27 @@ class TestConfig:
         config = Config()
         assert config.auto_approve_threshold == 0.85
 
-    def test_auto_approve_threshold_custom(self) -> None:
-        """Auto-approve threshold should be customizable."""
-        config = Config(auto_approve_threshold=0.90)
-        assert config.auto_approve_threshold == 0.90
+    @pytest.mark.parametrize("threshold", [0.90, 0.0, 1.0])
+    def test_auto_approve_threshold_valid(self, threshold: float) -> None:
+        """Auto-approve threshold should accept values from 0.0 to 1.0."""
+        config = Config(auto_approve_threshold=threshold)
+        assert config.auto_approve_threshold == threshold
 
-    def test_auto_approve_threshold_minimum(self) -> None:
-        """Auto-approve threshold can be set to 0.0."""
-        config = Config(auto_approve_threshold=0.0)
-        assert config.auto_approve_threshold == 0.0
-
-    def test_auto_approve_threshold_maximum(self) -> None:
-        """Auto-approve threshold can be set to 1.0."""
-        config = Config(auto_approve_threshold=1.0)
-        assert config.auto_approve_threshold == 1.0
-
-    def test_auto_approve_threshold_invalid_high(self) -> None:
-        """Auto-approve threshold above 1.0 should raise ValueError."""
-        with pytest.raises(ValueError, match="auto_approve_threshold must be between"):
-            Config(auto_approve_threshold=1.1)
-
-    def test_auto_approve_threshold_invalid_low(self) -> None:
-        """Auto-approve threshold below 0.0 should raise ValueError."""
+    @pytest.mark.parametrize("threshold", [1.1, -0.1])
+    def test_auto_approve_threshold_invalid(self, threshold: float) -> None:
+        """Auto-approve threshold outside 0.0 to 1.0 should raise ValueError."""
         with pytest.raises(ValueError, match="auto_approve_threshold must be between"):
-            Config(auto_approve_threshold=-0.1)
+            Config(auto_approve_threshold=threshold)
 
     def test_staging_dir_property(self) -> None:
         """staging_dir should be workspace_dir / staging."""
-        config = Config(workspace_dir=Path("/test/workspace"))
-        assert config.staging_dir == Path("/test/workspace/staging")
+        config = Config(workspace_dir=_WORKSPACE)
+        assert config.staging_dir == _WORKSPACE / "staging"
 
     def test_encoding_dir_property(self) -> None:
         """encoding_dir should be workspace_dir / encoding."""
-        config = Config(workspace_dir=Path("/test/workspace"))
-        assert config.encoding_dir == Path("/test/workspace/encoding")
+        config = Config(workspace_dir=_WORKSPACE)
+        assert config.encoding_dir == _WORKSPACE / "encoding"
 
     def test_config_has_home_movies_dir(self) -> None:
         """Test config has plex_home_movies_dir."""
@@ -77,26 +69,46 @@ class TestConfig:
         assert isinstance(config.plex_other_dir, Path)
 
 
+# Everything load_config reads; cleared once so a developer's shell or .env
+# cannot leak into tests that expect defaults.
+CONFIG_ENV_VARS = (
+    "PUSHOVER_USER_KEY",
+    "PUSHOVER_API_TOKEN",
+    "TMDB_API_TOKEN",
+    "ANTHROPIC_API_KEY",
+    "WORKSPACE_DIR",
+    "PLEX_MOVIES_DIR",
+    "PLEX_TV_DIR",
+    "PLEX_HOME_MOVIES_DIR",
+    "PLEX_OTHER_DIR",
+    "WEB_HOST",
+    "WEB_PORT",
+    "ACTIVE_MODE",
+    "DRIVE_POLL_INTERVAL",
+    "DRIVE_IDS",
+    "AUTO_APPROVE_THRESHOLD",
+    "GOOGLE_SHEETS_CREDENTIALS_FILE",
+    "GOOGLE_SHEETS_SPREADSHEET_ID",
+    "SHEETS_SYNC_INTERVAL",
+    "ENABLE_TEST_ENDPOINTS",
+)
+
+
+@pytest.fixture(scope="class")
+def clean_env() -> Iterator[None]:
+    """Remove config env vars for the duration of a test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key in CONFIG_ENV_VARS:
+            mp.delenv(key, raising=False)
+        yield
+
+
+@pytest.mark.usefixtures("clean_env")
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_config_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_load_config_defaults(self) -> None:
         """load_config should use defaults when env vars not set."""
-        # Clear relevant env vars
-        for key in [
-            "PUSHOVER_USER_KEY",
-            "PUSHOVER_API_TOKEN",
-            "TMDB_API_TOKEN",
-            "WORKSPACE_DIR",
-            "PLEX_MOVIES_DIR",
-            "PLEX_TV_DIR",
-            "WEB_HOST",
-            "WEB_PORT",
-            "DRIVE_POLL_INTERVAL",
-            "AUTO_APPROVE_THRESHOLD",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
         config = load_config()
 
         assert config.auto_approve_threshold == DEFAULT_AUTO_APPROVE_THRESHOLD
@@ -104,9 +116,6 @@ class TestLoadConfig:
     def test_load_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """load_config should read AUTO_APPROVE_THRESHOLD from environment."""
         monkeypatch.setenv("AUTO_APPROVE_THRESHOLD", "0.90")
-        monkeypatch.delenv("PUSHOVER_USER_KEY", raising=False)
-        monkeypatch.delenv("PUSHOVER_API_TOKEN", raising=False)
-        monkeypatch.delenv("TMDB_API_TOKEN", raising=False)
 
         config = load_config()
 
@@ -126,15 +135,15 @@ class TestLoadConfig:
 
     def test_load_config_home_movies_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test load_config loads plex_home_movies_dir from env."""
-        monkeypatch.setenv("PLEX_HOME_MOVIES_DIR", "/test/home/movies")
+        monkeypatch.setenv("PLEX_HOME_MOVIES_DIR", str(_HOME_MOVIES))
         config = load_config()
-        assert config.plex_home_movies_dir == Path("/test/home/movies")
+        assert config.plex_home_movies_dir == _HOME_MOVIES
 
     def test_load_config_other_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test load_config loads plex_other_dir from env."""
-        monkeypatch.setenv("PLEX_OTHER_DIR", "/test/other")
+        monkeypatch.setenv("PLEX_OTHER_DIR", str(_OTHER))
         config = load_config()
-        assert config.plex_other_dir == Path("/test/other")
+        assert config.plex_other_dir == _OTHER
 
     def test_google_sheets_config_from_env(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
@@ -153,11 +162,8 @@ class TestLoadConfig:
         assert config.google_sheets_spreadsheet_id == "test_spreadsheet_id"
         assert config.sheets_sync_interval == 12
 
-    def test_google_sheets_config_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_google_sheets_config_defaults(self) -> None:
         """Test Google Sheets config has sensible defaults."""
-        monkeypatch.delenv("GOOGLE_SHEETS_CREDENTIALS_FILE", raising=False)
-        monkeypatch.delenv("GOOGLE_SHEETS_SPREADSHEET_ID", raising=False)
-        monkeypatch.delenv("SHEETS_SYNC_INTERVAL", raising=False)
 
         config = load_config()
 
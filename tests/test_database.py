@@ -1,10 +1,14 @@
 """Tests for the database module."""
 
-import pytest
-import pytest_asyncio
+import asyncio
+import sqlite3
+from enum import Enum
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+import pytest_asyncio
+
 from dvdtoplex.database import (
     ContentType,
     Database,
@@ -15,58 +19,79 @@ from dvdtoplex.database import (
 
 @pytest_asyncio.fixture
 async def db() -> Database:
-    """Create a temporary database for testing."""
-    with TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
+    """Create an in-memory database for testing."""
+    database = Database(":memory:")
+    await database.connect()
+    yield database
+    await database.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def schema_objects() -> dict[str, set[str]]:
+    """Names of the schema objects a fresh connect() creates, keyed by type."""
+    database = Database(":memory:")
+    await database.connect()
+    try:
+        cursor = await database.connection.execute(
+            "SELECT type, name FROM sqlite_master"
+        )
+        rows = await cursor.fetchall()
+    finally:
         await database.close()
 
+    objects: dict[str, set[str]] = {"table": set(), "index": set()}
+    for row in rows:
+        objects.setdefault(row["type"], set()).add(row["name"])
+    return objects
+
 
 class TestEnums:
-    """Tests for JobStatus and ContentType enums."""
-
-    def test_job_status_values(self) -> None:
-        """JobStatus has all required values."""
-        assert JobStatus.PENDING.value == "pending"
-        assert JobStatus.RIPPING.value == "ripping"
-        assert JobStatus.RIPPED.value == "ripped"
-        assert JobStatus.ENCODING.value == "encoding"
-        assert JobStatus.ENCODED.value == "encoded"
-        assert JobStatus.IDENTIFYING.value == "identifying"
-        assert JobStatus.REVIEW.value == "review"
-        assert JobStatus.MOVING.value == "moving"
-        assert JobStatus.COMPLETE.value == "complete"
-        assert JobStatus.FAILED.value == "failed"
-
-    def test_job_status_has_archived(self) -> None:
-        """Test that ARCHIVED status exists in JobStatus enum."""
-        assert hasattr(JobStatus, "ARCHIVED")
-        assert JobStatus.ARCHIVED.value == "archived"
-
-    def test_content_type_values(self) -> None:
-        """ContentType has all required values."""
-        assert ContentType.UNKNOWN.value == "unknown"
-        assert ContentType.MOVIE.value == "movie"
-        assert ContentType.TV_SEASON.value == "tv_season"
-
-    def test_rip_mode_enum_exists(self) -> None:
-        """Test that RipMode enum exists with all modes."""
-        assert hasattr(RipMode, "MOVIE")
-        assert hasattr(RipMode, "TV")
-        assert hasattr(RipMode, "HOME_MOVIES")
-        assert hasattr(RipMode, "OTHER")
-        assert RipMode.MOVIE.value == "movie"
-        assert RipMode.TV.value == "tv"
-        assert RipMode.HOME_MOVIES.value == "home_movies"
-        assert RipMode.OTHER.value == "other"
+    """Tests for JobStatus, ContentType and RipMode enums."""
+
+    @pytest.mark.parametrize(
+        ("enum_cls", "expected"),
+        [
+            (
+                JobStatus,
+                {
+                    "PENDING": "pending",
+                    "RIPPING": "ripping",
+                    "RIPPED": "ripped",
+                    "ENCODING": "encoding",
+                    "ENCODED": "encoded",
+                    "IDENTIFYING": "identifying",
+                    "REVIEW": "review",
+                    "MOVING": "moving",
+                    "COMPLETE": "complete",
+                    "FAILED": "failed",
+                    "ARCHIVED": "archived",
+                },
+            ),
+            (
+                ContentType,
+                {"UNKNOWN": "unknown", "MOVIE": "movie", "TV_SEASON": "tv_season"},
+            ),
+            (
+                RipMode,
+                {
+                    "MOVIE": "movie",
+                    "TV": "tv",
+                    "HOME_MOVIES": "home_movies",
+                    "OTHER": "other",
+                },
+            ),
+        ],
+        ids=["JobStatus", "ContentType", "RipMode"],
+    )
+    def test_enum_values(self, enum_cls: type[Enum], expected: dict[str, str]) -> None:
+        """Each enum has all required members with their stored values."""
+        values = {member.name: member.value for member in enum_cls}
+        assert expected.items() <= values.items()
 
 
 class TestJobRipMode:
     """Tests for job rip_mode field."""
 
-    @pytest.mark.asyncio
     async def test_job_has_rip_mode_field(self, db: Database) -> None:
         """Test that Job model has rip_mode field."""
         # Create job with explicit mode
@@ -76,7 +101,6 @@ class TestJobRipMode:
         assert retrieved_job is not None
         assert retrieved_job.rip_mode == RipMode.HOME_MOVIES
 
-    @pytest.mark.asyncio
     async def test_job_default_rip_mode_is_movie(self, db: Database) -> None:
         """Test that default rip_mode is MOVIE."""
         job = await db.create_job("drive0", "TEST_DISC")
@@ -89,7 +113,6 @@ class TestJobRipMode:
 class TestDatabaseConnection:
     """Tests for database connection and initialization."""
 
-    @pytest.mark.asyncio
     async def test_connect_creates_database_file(self) -> None:
         """connect() creates the database file."""
         with TemporaryDirectory() as tmpdir:
@@ -99,22 +122,17 @@ class TestDatabaseConnection:
             assert db_path.exists()
             await database.close()
 
-    @pytest.mark.asyncio
     async def test_connection_property_raises_when_not_connected(self) -> None:
         """connection property raises RuntimeError when not connected."""
-        with TemporaryDirectory() as tmpdir:
-            database = Database(Path(tmpdir) / "test.db")
-            with pytest.raises(RuntimeError, match="Database not connected"):
-                _ = database.connection
+        database = Database(":memory:")
+        with pytest.raises(RuntimeError, match="Database not connected"):
+            _ = database.connection
 
-    @pytest.mark.asyncio
-    async def test_tables_created_on_connect(self, db: Database) -> None:
+    def test_tables_created_on_connect(
+        self, schema_objects: dict[str, set[str]]
+    ) -> None:
         """All tables are created on connect."""
-        cursor = await db.connection.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        rows = await cursor.fetchall()
-        table_names = {row["name"] for row in rows}
+        table_names = schema_objects["table"]
 
         assert "jobs" in table_names
         assert "tv_seasons" in table_names
@@ -123,19 +141,46 @@ class TestDatabaseConnection:
         assert "wanted" in table_names
         assert "settings" in table_names
 
-    @pytest.mark.asyncio
-    async def test_indexes_created_on_connect(self, db: Database) -> None:
+    def test_indexes_created_on_connect(
+        self, schema_objects: dict[str, set[str]]
+    ) -> None:
         """Required indexes are created on connect."""
-        cursor = await db.connection.execute(
-            "SELECT name FROM sqlite_master WHERE type='index'"
-        )
-        rows = await cursor.fetchall()
-        index_names = {row["name"] for row in rows}
+        index_names = schema_objects["index"]
 
         assert "idx_jobs_status" in index_names
         assert "idx_jobs_drive_id" in index_names
+        assert "idx_jobs_drive_status" in index_names
+
+    async def test_connect_enables_wal_mode(self) -> None:
+        """connect() switches file-backed databases to WAL journaling."""
+        with TemporaryDirectory() as tmpdir:
+            database = Database(Path(tmpdir) / "test.db")
+            await database.connect()
+            cursor = await database.connection.execute("PRAGMA journal_mode")
+            row = await cursor.fetchone()
+            assert row[0] == "wal"
+            cursor = await database.connection.execute("PRAGMA synchronous")
+            row = await cursor.fetchone()
+            assert row[0] == 1  # NORMAL
+            await database.close()
+
+    async def test_connect_rolls_back_failed_schema(self) -> None:
+        """A failing schema statement does not leave a transaction open."""
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "legacy.db"
+            # A legacy jobs table without drive_id makes the index creation fail
+            with sqlite3.connect(db_path) as legacy:
+                legacy.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY)")
+            legacy.close()
+
+            database = Database(db_path)
+            try:
+                with pytest.raises(sqlite3.OperationalError):
+                    await database.connect()
+                assert not database.connection.in_transaction
+            finally:
+                await database.close()
 
-    @pytest.mark.asyncio
     async def test_initialize_creates_database_file(self) -> None:
         """initialize() creates the database file (alias for connect)."""
         with TemporaryDirectory() as tmpdir:
@@ -145,56 +190,54 @@ class TestDatabaseConnection:
             assert db_path.exists()
             await database.close()
 
-    @pytest.mark.asyncio
     async def test_is_closed_true_before_connect(self) -> None:
         """is_closed returns True before connect is called."""
-        with TemporaryDirectory() as tmpdir:
-            database = Database(Path(tmpdir) / "test.db")
-            assert database.is_closed is True
+        database = Database(":memory:")
+        assert database.is_closed is True
 
-    @pytest.mark.asyncio
     async def test_is_closed_false_after_connect(self) -> None:
         """is_closed returns False after connect is called."""
-        with TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            database = Database(db_path)
-            await database.connect()
-            assert database.is_closed is False
-            await database.close()
+        database = Database(":memory:")
+        await database.connect()
+        assert database.is_closed is False
+        await database.close()
 
-    @pytest.mark.asyncio
     async def test_is_closed_true_after_close(self) -> None:
         """is_closed returns True after close is called."""
-        with TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            database = Database(db_path)
-            await database.connect()
-            await database.close()
-            assert database.is_closed is True
+        database = Database(":memory:")
+        await database.connect()
+        await database.close()
+        assert database.is_closed is True
+
+    async def test_connect_twice_reuses_connection(self) -> None:
+        """A second connect() keeps the existing connection open."""
+        database = Database(":memory:")
+        await database.connect()
+        connection = database.connection
+        await database.connect()
+        assert database.connection is connection
+        await database.close()
+        assert database.is_closed is True
 
-    @pytest.mark.asyncio
     async def test_initialize_is_alias_for_connect(self) -> None:
         """initialize() behaves the same as connect()."""
-        with TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            database = Database(db_path)
-            await database.initialize()
-            # Verify connection is established
-            assert database.is_closed is False
-            # Verify tables were created
-            cursor = await database.connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            )
-            rows = await cursor.fetchall()
-            table_names = {row["name"] for row in rows}
-            assert "jobs" in table_names
-            await database.close()
+        database = Database(":memory:")
+        await database.initialize()
+        # Verify connection is established
+        assert database.is_closed is False
+        # Verify tables were created
+        cursor = await database.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )
+        rows = await cursor.fetchall()
+        table_names = {row["name"] for row in rows}
+        assert "jobs" in table_names
+        await database.close()
 
 
 class TestJobOperations:
     """Tests for job CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_job(self, db: Database) -> None:
         """create_job creates a job with pending status."""
         created_job = await db.create_job("drive0", "MY_MOVIE_DISC")
@@ -207,13 +250,11 @@ class TestJobOperations:
         assert job.status == JobStatus.PENDING
         assert job.content_type == ContentType.UNKNOWN
 
-    @pytest.mark.asyncio
     async def test_get_job_returns_none_for_missing(self, db: Database) -> None:
         """get_job returns None for non-existent job."""
         job = await db.get_job(9999)
         assert job is None
 
-    @pytest.mark.asyncio
     async def test_get_jobs_by_status(self, db: Database) -> None:
         """get_jobs_by_status filters by status."""
         job1 = await db.create_job("drive0", "DISC1")
@@ -228,7 +269,6 @@ class TestJobOperations:
         assert len(ripping_jobs) == 1
         assert ripping_jobs[0].id == job2.id
 
-    @pytest.mark.asyncio
     async def test_get_jobs_by_drive(self, db: Database) -> None:
         """get_jobs_by_drive filters by drive_id."""
         await db.create_job("drive0", "DISC1")
@@ -241,7 +281,6 @@ class TestJobOperations:
         assert len(drive0_jobs) == 2
         assert len(drive1_jobs) == 1
 
-    @pytest.mark.asyncio
     async def test_get_recent_jobs(self, db: Database) -> None:
         """get_recent_jobs returns jobs in descending order."""
         await db.create_job("drive0", "DISC1")
@@ -253,7 +292,6 @@ class TestJobOperations:
         assert recent[0].disc_label == "DISC3"
         assert recent[1].disc_label == "DISC2"
 
-    @pytest.mark.asyncio
     async def test_update_job_status(self, db: Database) -> None:
         """update_job_status changes the job status."""
         created_job = await db.create_job("drive0", "DISC1")
@@ -263,7 +301,6 @@ class TestJobOperations:
         assert job is not None
         assert job.status == JobStatus.RIPPING
 
-    @pytest.mark.asyncio
     async def test_update_job_status_with_error(self, db: Database) -> None:
         """update_job_status can set error message."""
         created_job = await db.create_job("drive0", "DISC1")
@@ -274,7 +311,6 @@ class TestJobOperations:
         assert job.status == JobStatus.FAILED
         assert job.error_message == "Drive error"
 
-    @pytest.mark.asyncio
     async def test_update_job_identification(self, db: Database) -> None:
         """update_job_identification updates all identification fields."""
         created_job = await db.create_job("drive0", "DISC1")
@@ -295,7 +331,6 @@ class TestJobOperations:
         assert job.tmdb_id == 603
         assert job.confidence == 0.95
 
-    @pytest.mark.asyncio
     async def test_update_job_identification_with_poster_path(self, db: Database) -> None:
         """update_job_identification stores poster_path when provided."""
         created_job = await db.create_job("drive0", "DISC1")
@@ -313,7 +348,6 @@ class TestJobOperations:
         assert job is not None
         assert job.poster_path == "/abc123.jpg"
 
-    @pytest.mark.asyncio
     async def test_update_job_paths(self, db: Database) -> None:
         """update_job_*_path methods update the respective paths."""
         created_job = await db.create_job("drive0", "DISC1")
@@ -333,11 +367,25 @@ class TestJobOperations:
         assert job is not None
         assert job.final_path == "/plex/path.mkv"
 
+    async def test_update_job_paths_in_one_call(self, db: Database) -> None:
+        """update_job_paths sets the given paths and keeps the others."""
+        created_job = await db.create_job("drive0", "DISC1")
+        await db.update_job_rip_path(created_job.id, "/rip/path.mkv")
+
+        await db.update_job_paths(
+            created_job.id, encode_path="/encode/path.mkv", final_path="/plex/path.mkv"
+        )
+
+        job = await db.get_job(created_job.id)
+        assert job is not None
+        assert job.rip_path == "/rip/path.mkv"
+        assert job.encode_path == "/encode/path.mkv"
+        assert job.final_path == "/plex/path.mkv"
+
 
 class TestTVSeasonOperations:
     """Tests for TV season CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_tv_season(self, db: Database) -> None:
         """create_tv_season creates a TV season record."""
         created_job = await db.create_job("drive0", "TV_DISC")
@@ -353,13 +401,11 @@ class TestTVSeasonOperations:
         assert season.season_number == 1
         assert season.tmdb_show_id == 1396
 
-    @pytest.mark.asyncio
     async def test_get_tv_season_returns_none_for_missing(self, db: Database) -> None:
         """get_tv_season returns None for non-existent season."""
         season = await db.get_tv_season(9999)
         assert season is None
 
-    @pytest.mark.asyncio
     async def test_get_tv_seasons_by_job(self, db: Database) -> None:
         """get_tv_seasons_by_job returns seasons for a job."""
         created_job = await db.create_job("drive0", "TV_DISC")
@@ -375,7 +421,6 @@ class TestTVSeasonOperations:
 class TestEpisodeOperations:
     """Tests for episode CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_episode(self, db: Database) -> None:
         """create_episode creates an episode record."""
         created_job = await db.create_job("drive0", "TV_DISC")
@@ -388,14 +433,13 @@ class TestEpisodeOperations:
         assert episodes[0].episode_number == 1
         assert episodes[0].title == "Pilot"
 
-    @pytest.mark.asyncio
     async def test_get_episodes_by_season_ordered(self, db: Database) -> None:
         """get_episodes_by_season returns episodes in order."""
         created_job = await db.create_job("drive0", "TV_DISC")
         season_id = await db.create_tv_season(created_job.id, "Show", 1)
-        await db.create_episode(season_id, 3, "Episode 3")
-        await db.create_episode(season_id, 1, "Episode 1")
-        await db.create_episode(season_id, 2, "Episode 2")
+        await db.create_many_episodes(
+            season_id, [(3, "Episode 3"), (1, "Episode 1"), (2, "Episode 2")]
+        )
 
         episodes = await db.get_episodes_by_season(season_id)
         assert len(episodes) == 3
@@ -403,7 +447,59 @@ class TestEpisodeOperations:
         assert episodes[1].episode_number == 2
         assert episodes[2].episode_number == 3
 
-    @pytest.mark.asyncio
+    async def test_create_many_episodes(self, db: Database) -> None:
+        """create_many_episodes returns the new episode IDs in order."""
+        created_job = await db.create_job("drive0", "TV_DISC")
+        season_id = await db.create_tv_season(created_job.id, "Show", 1)
+        first_id = await db.create_episode(season_id, 1, "Pilot")
+
+        episode_ids = await db.create_many_episodes(season_id, [(2, "Two"), (3, None)])
+
+        assert episode_ids == [first_id + 1, first_id + 2]
+        episodes = await db.get_episodes_by_season(season_id)
+        assert [episode.id for episode in episodes] == [first_id, *episode_ids]
+        assert episodes[2].title is None
+        assert await db.create_many_episodes(season_id, []) == []
+
+    async def test_create_many_episodes_with_concurrent_insert(
+        self, db: Database
+    ) -> None:
+        """create_many_episodes returns its own IDs when an insert interleaves."""
+        created_job = await db.create_job("drive0", "TV_DISC")
+        season_id = await db.create_tv_season(created_job.id, "Show", 1)
+
+        episode_ids, single_id = await asyncio.gather(
+            db.create_many_episodes(season_id, [(1, "Pilot"), (2, "Two")]),
+            db.create_episode(season_id, 3, "Three"),
+        )
+
+        titles = {
+            episode.id: episode.title
+            for episode in await db.get_episodes_by_season(season_id)
+        }
+        assert [titles[episode_id] for episode_id in episode_ids] == ["Pilot", "Two"]
+        assert titles[single_id] == "Three"
+
+    async def test_create_many_episodes_failure_leaves_no_rows(
+        self, db: Database
+    ) -> None:
+        """A bad row undoes the whole batch but not a concurrent insert."""
+        created_job = await db.create_job("drive0", "TV_DISC")
+        season_id = await db.create_tv_season(created_job.id, "Show", 1)
+
+        batch_result, single_id = await asyncio.gather(
+            # episode_number is NOT NULL, so the last row fails
+            db.create_many_episodes(season_id, [(1, "Pilot"), (None, "Bad")]),
+            db.create_episode(season_id, 3, "Three"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(batch_result, sqlite3.IntegrityError)
+        episodes = await db.get_episodes_by_season(season_id)
+        assert [(episode.id, episode.title) for episode in episodes] == [
+            (single_id, "Three")
+        ]
+
     async def test_update_episode_paths(self, db: Database) -> None:
         """update_episode_paths updates episode paths."""
         created_job = await db.create_job("drive0", "TV_DISC")
@@ -426,7 +522,6 @@ class TestEpisodeOperations:
 class TestCollectionOperations:
     """Tests for collection CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_add_to_collection(self, db: Database) -> None:
         """add_to_collection adds an item to the collection."""
         item_id = await db.add_to_collection(
@@ -445,17 +540,14 @@ class TestCollectionOperations:
         assert item.content_type == ContentType.MOVIE
         assert item.tmdb_id == 603
 
-    @pytest.mark.asyncio
     async def test_get_collection_ordered_by_id_desc(self, db: Database) -> None:
         """get_collection returns items ordered by id descending (most recent first)."""
-        await db.add_to_collection(
-            ContentType.MOVIE, "First Movie", None, None, "/path/first.mkv"
-        )
-        await db.add_to_collection(
-            ContentType.MOVIE, "Second Movie", None, None, "/path/second.mkv"
-        )
-        await db.add_to_collection(
-            ContentType.MOVIE, "Third Movie", None, None, "/path/third.mkv"
+        await db.add_many_to_collection(
+            [
+                (ContentType.MOVIE, "First Movie", None, None, "/path/first.mkv"),
+                (ContentType.MOVIE, "Second Movie", None, None, "/path/second.mkv"),
+                (ContentType.MOVIE, "Third Movie", None, None, "/path/third.mkv"),
+            ]
         )
 
         collection = await db.get_collection()
@@ -465,7 +557,6 @@ class TestCollectionOperations:
         assert collection[1]["title"] == "Second Movie"
         assert collection[2]["title"] == "First Movie"
 
-    @pytest.mark.asyncio
     async def test_get_collection_item_returns_none_for_missing(
         self, db: Database
     ) -> None:
@@ -477,7 +568,6 @@ class TestCollectionOperations:
 class TestWantedOperations:
     """Tests for wanted list CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_add_to_wanted(self, db: Database) -> None:
         """add_to_wanted adds an item to the wanted list."""
         item_id = await db.add_to_wanted(
@@ -495,7 +585,6 @@ class TestWantedOperations:
         assert item.year == 2010
         assert item.notes == "Looking for director's cut"
 
-    @pytest.mark.asyncio
     async def test_get_wanted_ordered_by_added_at_desc(self, db: Database) -> None:
         """get_wanted returns items in reverse chronological order."""
         await db.add_to_wanted("First Movie")
@@ -508,13 +597,11 @@ class TestWantedOperations:
         assert wanted[1].title == "Second Movie"
         assert wanted[2].title == "First Movie"
 
-    @pytest.mark.asyncio
     async def test_get_wanted_item_returns_none_for_missing(self, db: Database) -> None:
         """get_wanted_item returns None for non-existent item."""
         item = await db.get_wanted_item(9999)
         assert item is None
 
-    @pytest.mark.asyncio
     async def test_remove_from_wanted(self, db: Database) -> None:
         """remove_from_wanted removes an item from the wanted list."""
         item_id = await db.add_to_wanted("Movie to Remove")
@@ -524,7 +611,6 @@ class TestWantedOperations:
         assert result is True
         assert await db.get_wanted_item(item_id) is None
 
-    @pytest.mark.asyncio
     async def test_remove_from_wanted_returns_false_for_missing(
         self, db: Database
     ) -> None:
@@ -532,16 +618,8 @@ class TestWantedOperations:
         result = await db.remove_from_wanted(9999)
         assert result is False
 
-
-@pytest.mark.asyncio
-async def test_wanted_item_stores_poster_path(tmp_path):
-    """Test wanted items can store poster_path."""
-    from dvdtoplex.database import Database, ContentType
-
-    db = Database(tmp_path / "test.db")
-    await db.connect()
-
-    try:
+    async def test_wanted_item_stores_poster_path(self, db: Database) -> None:
+        """Wanted items can store poster_path."""
         item_id = await db.add_to_wanted(
             title="Dune",
             year=2021,
@@ -554,20 +632,16 @@ async def test_wanted_item_stores_poster_path(tmp_path):
 
         assert item is not None
         assert item.poster_path == "/abc123.jpg"
-    finally:
-        await db.close()
 
 
 class TestSettingsOperations:
     """Tests for settings CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_get_setting_returns_default_when_not_set(self, db: Database) -> None:
         """get_setting returns default when setting doesn't exist."""
         value = await db.get_setting("nonexistent", "default_value")
         assert value == "default_value"
 
-    @pytest.mark.asyncio
     async def test_get_setting_returns_none_when_not_set_no_default(
         self, db: Database
     ) -> None:
@@ -575,14 +649,12 @@ class TestSettingsOperations:
         value = await db.get_setting("nonexistent")
         assert value is None
 
-    @pytest.mark.asyncio
     async def test_set_setting(self, db: Database) -> None:
         """set_setting stores a setting value."""
         await db.set_setting("active_mode", "true")
         value = await db.get_setting("active_mode")
         assert value == "true"
 
-    @pytest.mark.asyncio
     async def test_set_setting_overwrites_existing(self, db: Database) -> None:
         """set_setting overwrites existing value."""
         await db.set_setting("key", "value1")
@@ -590,7 +662,6 @@ class TestSettingsOperations:
         value = await db.get_setting("key")
         assert value == "value2"
 
-    @pytest.mark.asyncio
     async def test_get_all_settings(self, db: Database) -> None:
         """get_all_settings returns all settings as dict."""
         await db.set_setting("key1", "value1")
@@ -599,7 +670,6 @@ class TestSettingsOperations:
         settings = await db.get_all_settings()
         assert settings == {"key1": "value1", "key2": "value2"}
 
-    @pytest.mark.asyncio
     async def test_get_all_settings_empty(self, db: Database) -> None:
         """get_all_settings returns empty dict when no settings."""
         settings = await db.get_all_settings()
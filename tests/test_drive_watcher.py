@@ -1,6 +1,5 @@
 """Tests for the drive watcher service."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -13,34 +12,35 @@ from dvdtoplex.drives import DriveStatus
 from dvdtoplex.services.drive_watcher import DriveWatcher
 
 
-class TestDriveWatcher:
-    """Tests for DriveWatcher service."""
+@pytest.fixture(scope="module")
+def temp_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary workspace directory shared by the module."""
+    return tmp_path_factory.mktemp("workspace")
 
-    @pytest.fixture
-    def temp_workspace(self) -> Path:
-        """Create a temporary workspace directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
 
-    @pytest.fixture
-    def config(self, temp_workspace: Path) -> Config:
-        """Create a test configuration."""
-        return Config(
-            pushover_user_key="",
-            pushover_api_token="",
-            tmdb_api_token="",
-            workspace_dir=temp_workspace,
-            plex_movies_dir=temp_workspace / "movies",
-            plex_tv_dir=temp_workspace / "tv",
-            web_host="127.0.0.1",
-            web_port=8080,
-            drive_poll_interval=0.1,  # Fast polling for tests
-        )
+@pytest.fixture(scope="module")
+def config(temp_workspace: Path) -> Config:
+    """Create a test configuration."""
+    return Config(
+        pushover_user_key="",
+        pushover_api_token="",
+        tmdb_api_token="",
+        workspace_dir=temp_workspace,
+        plex_movies_dir=temp_workspace / "movies",
+        plex_tv_dir=temp_workspace / "tv",
+        web_host="127.0.0.1",
+        web_port=8080,
+        drive_poll_interval=0.1,  # Fast polling for tests
+    )
+
+
+class TestDriveWatcher:
+    """Tests for DriveWatcher service."""
 
     @pytest_asyncio.fixture
-    async def database(self, temp_workspace: Path) -> Database:
-        """Create a test database."""
-        db = Database(temp_workspace / "test.db")
+    async def database(self) -> Database:
+        """Create an in-memory test database."""
+        db = Database(":memory:")
         await db.connect()
         yield db
         await db.close()
@@ -50,7 +50,6 @@ class TestDriveWatcher:
         """Create a DriveWatcher instance."""
         return DriveWatcher(config, database, drive_ids=["/dev/disk2"])
 
-    @pytest.mark.asyncio
     async def test_on_disc_inserted_creates_job(
         self, drive_watcher: DriveWatcher, database: Database
     ) -> None:
@@ -69,7 +68,6 @@ class TestDriveWatcher:
         assert jobs[0].drive_id == "/dev/disk2"
         assert jobs[0].disc_label == "TEST_MOVIE"
 
-    @pytest.mark.asyncio
     async def test_on_disc_inserted_skips_if_active_job(
         self, drive_watcher: DriveWatcher, database: Database
     ) -> None:
@@ -91,7 +89,6 @@ class TestDriveWatcher:
         assert len(jobs) == 1
         assert jobs[0].disc_label == "EXISTING_DVD"
 
-    @pytest.mark.asyncio
     async def test_on_disc_inserted_unknown_label(
         self, drive_watcher: DriveWatcher, database: Database
     ) -> None:
@@ -109,7 +106,6 @@ class TestDriveWatcher:
         assert len(jobs) == 1
         assert jobs[0].disc_label == "UNKNOWN_DISC"
 
-    @pytest.mark.asyncio
     async def test_on_disc_inserted_uses_current_mode(
         self, drive_watcher: DriveWatcher, database: Database
     ) -> None:
@@ -132,7 +128,6 @@ class TestDriveWatcher:
         assert len(jobs) == 1
         assert jobs[0].rip_mode == RipMode.HOME_MOVIES
 
-    @pytest.mark.asyncio
     async def test_on_disc_inserted_default_mode_is_movie(
         self, drive_watcher: DriveWatcher, database: Database
     ) -> None:
@@ -152,7 +147,6 @@ class TestDriveWatcher:
         assert len(jobs) == 1
         assert jobs[0].rip_mode == RipMode.MOVIE
 
-    @pytest.mark.asyncio
     async def test_start_stop(self, drive_watcher: DriveWatcher) -> None:
         """Should start and stop cleanly."""
         with patch("dvdtoplex.services.drive_watcher.get_drive_status", new_callable=AsyncMock) as mock_status:
@@ -2,15 +2,12 @@
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from dvdtoplex.drives import get_drive_status
 
 
 class TestGetDriveStatusMakeMKV:
     """Tests for MakeMKV-based get_drive_status function."""
 
-    @pytest.mark.asyncio
     async def test_returns_status_with_disc(self) -> None:
         """Should return DriveStatus with disc info from MakeMKV."""
         with patch("dvdtoplex.drives.check_disc_present") as mock_check:
@@ -23,7 +20,6 @@ class TestGetDriveStatusMakeMKV:
             assert status.disc_label == "MOVIE_TITLE"
             mock_check.assert_called_once_with("0")
 
-    @pytest.mark.asyncio
     async def test_returns_status_without_disc(self) -> None:
         """Should return DriveStatus without disc."""
         with patch("dvdtoplex.drives.check_disc_present") as mock_check:
@@ -35,7 +31,6 @@ class TestGetDriveStatusMakeMKV:
             assert status.has_disc is False
             assert status.disc_label is None
 
-    @pytest.mark.asyncio
     async def test_handles_device_path(self) -> None:
         """Should handle device path format."""
         with patch("dvdtoplex.drives.check_disc_present") as mock_check:
@@ -1,5 +1,6 @@
 """Tests for the encode queue service."""
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -10,6 +11,7 @@ import pytest_asyncio
 from dvdtoplex.config import Config
 from dvdtoplex.database import Database, JobStatus
 from dvdtoplex.services.encode_queue import EncodeQueue
+from tests.conftest import SQLITE_TEST_PRAGMAS
 
 
 @pytest.fixture
@@ -42,6 +44,7 @@ async def database(tmp_path: Path) -> Database:
     """Create and initialize a test database."""
     db = Database(tmp_path / "test.db")
     await db.connect()
+    await db.connection.executescript(SQLITE_TEST_PRAGMAS)
     yield db
     await db.close()
 
@@ -49,7 +52,6 @@ async def database(tmp_path: Path) -> Database:
 class TestEncodeQueue:
     """Tests for the EncodeQueue class."""
 
-    @pytest.mark.asyncio
     async def test_start_stop(self, config: Config, database: Database) -> None:
         """Test starting and stopping the encode queue."""
         queue = EncodeQueue(config, database)
@@ -62,7 +64,6 @@ class TestEncodeQueue:
         assert queue._running is False
         assert queue._task is None
 
-    @pytest.mark.asyncio
     async def test_start_twice_is_idempotent(
         self, config: Config, database: Database
     ) -> None:
@@ -79,7 +80,6 @@ class TestEncodeQueue:
 
         await queue.stop()
 
-    @pytest.mark.asyncio
     async def test_process_job_no_rip_path(
         self, config: Config, database: Database
     ) -> None:
@@ -97,7 +97,6 @@ class TestEncodeQueue:
         assert job.status == JobStatus.FAILED
         assert "No rip path found" in job.error_message
 
-    @pytest.mark.asyncio
     async def test_process_job_missing_rip_file(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -118,7 +117,6 @@ class TestEncodeQueue:
         assert job.status == JobStatus.FAILED
         assert "not found" in job.error_message
 
-    @pytest.mark.asyncio
     async def test_process_job_encode_success(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -151,7 +149,6 @@ class TestEncodeQueue:
         assert job.status == JobStatus.ENCODED
         assert job.encode_path is not None
 
-    @pytest.mark.asyncio
     async def test_process_job_encode_failure(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -188,7 +185,6 @@ class TestEncodeQueue:
         assert job.status == JobStatus.FAILED
         assert "Encoding failed" in str(job.error_message)
 
-    @pytest.mark.asyncio
     async def test_process_job_encode_exception(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -216,7 +212,6 @@ class TestEncodeQueue:
         assert job.status == JobStatus.FAILED
         assert "HandBrake crashed" in job.error_message
 
-    @pytest.mark.asyncio
     async def test_no_jobs_to_process(self, config: Config, database: Database) -> None:
         """Test that nothing happens when there are no jobs to process."""
         queue = EncodeQueue(config, database)
@@ -228,7 +223,6 @@ class TestEncodeQueue:
         jobs = await database.get_jobs_by_status(JobStatus.RIPPED)
         assert len(jobs) == 0
 
-    @pytest.mark.asyncio
     async def test_jobs_processed_in_order(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -264,7 +258,6 @@ class TestEncodeQueue:
         # Jobs should be processed in FIFO order
         assert processed_order == [j.id for j in created_jobs]
 
-    @pytest.mark.asyncio
     async def test_encoding_status_transition(
         self, config: Config, database: Database, temp_workspace: Path
     ) -> None:
@@ -302,3 +295,37 @@ class TestEncodeQueue:
         job = await database.get_job(created_job.id)
         assert job is not None
         assert job.status == JobStatus.ENCODED
+
+    async def test_loop_encodes_queued_jobs_back_to_back(
+        self, config: Config, database: Database, temp_workspace: Path
+    ) -> None:
+        """Test that the loop picks up the next job without a poll-interval gap."""
+        queue = EncodeQueue(config, database)
+
+        job_ids = []
+        for i in range(2):
+            rip_dir = temp_workspace / "staging" / f"job_{i}"
+            rip_dir.mkdir(parents=True)
+            rip_file = rip_dir / "movie.mkv"
+            rip_file.write_text(f"fake video content {i}")
+
+            created_job = await database.create_job(f"drive{i}", f"DISC_{i}")
+            await database.update_job_status(
+                created_job.id, JobStatus.RIPPED, rip_path=str(rip_file)
+            )
+            job_ids.append(created_job.id)
+
+        with patch("dvdtoplex.services.encode_queue.encode_file") as mock_encode:
+            mock_encode.return_value = True
+            await queue.start()
+            try:
+                # Well under the 15s default poll interval
+                async with asyncio.timeout(1.0):
+                    while len(
+                        encoded := await database.get_jobs_by_status(JobStatus.ENCODED)
+                    ) < len(job_ids):
+                        await asyncio.sleep(0.01)
+            finally:
+                await queue.stop()
+
+        assert sorted(job.id for job in encoded) == job_ids
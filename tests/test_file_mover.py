@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from dvdtoplex.database import RipMode
 from dvdtoplex.services.file_mover import (
     FileMover,
     format_movie_filename,
@@ -19,82 +22,78 @@ from dvdtoplex.services.file_mover import (
 class TestSanitizeFilename:
     """Tests for sanitize_filename function."""
 
-    def test_removes_invalid_chars(self) -> None:
-        """Should remove characters invalid on common filesystems."""
-        assert sanitize_filename('Movie: The "Sequel"') == "Movie The Sequel"
-        assert sanitize_filename("What/If?") == "WhatIf"
-        assert sanitize_filename("File<>Name") == "FileName"
-        assert sanitize_filename("Path\\To\\File") == "PathToFile"
-        assert sanitize_filename("Pipe|Line") == "PipeLine"
-        assert sanitize_filename("Star*Wars") == "StarWars"
-
-    def test_preserves_valid_chars(self) -> None:
-        """Should preserve valid filename characters."""
-        assert sanitize_filename("Movie Name (2024)") == "Movie Name (2024)"
-        assert sanitize_filename("The Movie - Part 1") == "The Movie - Part 1"
-        assert sanitize_filename("Film's Title") == "Film's Title"
-
-    def test_collapses_multiple_spaces(self) -> None:
-        """Should collapse multiple spaces into single space."""
-        assert sanitize_filename("Movie    Name") == "Movie Name"
-        assert sanitize_filename("  Spaced   Out  ") == "Spaced Out"
-
-    def test_strips_leading_trailing_whitespace_and_dots(self) -> None:
-        """Should strip leading/trailing whitespace and dots."""
-        assert sanitize_filename("  Movie Name  ") == "Movie Name"
-        assert sanitize_filename("...Movie Name...") == "Movie Name"
-        assert sanitize_filename(" . Movie . ") == "Movie"
-
-    def test_empty_string(self) -> None:
-        """Should handle empty strings."""
-        assert sanitize_filename("") == ""
-        assert sanitize_filename("   ") == ""
-
-    def test_control_characters(self) -> None:
-        """Should remove control characters."""
-        assert sanitize_filename("Movie\x00Name") == "MovieName"
-        assert sanitize_filename("Test\x1fFile") == "TestFile"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            # Removes characters invalid on common filesystems
+            ('Movie: The "Sequel"', "Movie The Sequel"),
+            ("What/If?", "WhatIf"),
+            ("File<>Name", "FileName"),
+            ("Path\\To\\File", "PathToFile"),
+            ("Pipe|Line", "PipeLine"),
+            ("Star*Wars", "StarWars"),
+            # Preserves valid filename characters
+            ("Movie Name (2024)", "Movie Name (2024)"),
+            ("The Movie - Part 1", "The Movie - Part 1"),
+            ("Film's Title", "Film's Title"),
+            # Collapses multiple spaces into a single space
+            ("Movie    Name", "Movie Name"),
+            ("  Spaced   Out  ", "Spaced Out"),
+            # Strips leading/trailing whitespace and dots
+            ("  Movie Name  ", "Movie Name"),
+            ("...Movie Name...", "Movie Name"),
+            (" . Movie . ", "Movie"),
+            # Handles empty strings
+            ("", ""),
+            ("   ", ""),
+            # Removes control characters
+            ("Movie\x00Name", "MovieName"),
+            ("Test\x1fFile", "TestFile"),
+        ],
+    )
+    def test_sanitize_filename(self, raw: str, expected: str) -> None:
+        """Should produce a filesystem-safe name."""
+        assert sanitize_filename(raw) == expected
 
 
 class TestFormatMovieFilename:
     """Tests for format_movie_filename function."""
 
-    def test_with_year(self) -> None:
-        """Should format as 'Title (Year).mkv'."""
-        assert format_movie_filename("Inception", 2010) == "Inception (2010).mkv"
-        assert format_movie_filename("The Matrix", 1999) == "The Matrix (1999).mkv"
-
-    def test_without_year(self) -> None:
-        """Should format as 'Title.mkv' when year is None."""
-        assert format_movie_filename("Unknown Movie", None) == "Unknown Movie.mkv"
-
-    def test_sanitizes_title(self) -> None:
-        """Should sanitize the title."""
-        assert (
-            format_movie_filename('Movie: The "Sequel"', 2024)
-            == "Movie The Sequel (2024).mkv"
-        )
-
-    def test_year_zero(self) -> None:
-        """Should include year even if zero."""
-        assert format_movie_filename("Movie", 0) == "Movie.mkv"
+    @pytest.mark.parametrize(
+        ("title", "year", "expected"),
+        [
+            ("Inception", 2010, "Inception (2010).mkv"),
+            ("The Matrix", 1999, "The Matrix (1999).mkv"),
+            ("Unknown Movie", None, "Unknown Movie.mkv"),
+            ('Movie: The "Sequel"', 2024, "Movie The Sequel (2024).mkv"),
+            # A falsy year is treated as missing
+            ("Movie", 0, "Movie.mkv"),
+        ],
+    )
+    def test_format_movie_filename(
+        self, title: str, year: int | None, expected: str
+    ) -> None:
+        """Should format as 'Title (Year).mkv', or 'Title.mkv' without a year."""
+        assert format_movie_filename(title, year) == expected
 
 
 class TestFormatMovieFolder:
     """Tests for format_movie_folder function."""
 
-    def test_with_year(self) -> None:
-        """Should format as 'Title (Year)'."""
-        assert format_movie_folder("Inception", 2010) == "Inception (2010)"
-        assert format_movie_folder("The Matrix", 1999) == "The Matrix (1999)"
-
-    def test_without_year(self) -> None:
-        """Should format as 'Title' when year is None."""
-        assert format_movie_folder("Unknown Movie", None) == "Unknown Movie"
-
-    def test_sanitizes_title(self) -> None:
-        """Should sanitize the title."""
-        assert format_movie_folder('Movie: The "Sequel"', 2024) == "Movie The Sequel (2024)"
+    @pytest.mark.parametrize(
+        ("title", "year", "expected"),
+        [
+            ("Inception", 2010, "Inception (2010)"),
+            ("The Matrix", 1999, "The Matrix (1999)"),
+            ("Unknown Movie", None, "Unknown Movie"),
+            ('Movie: The "Sequel"', 2024, "Movie The Sequel (2024)"),
+        ],
+    )
+    def test_format_movie_folder(
+        self, title: str, year: int | None, expected: str
+    ) -> None:
+        """Should format as 'Title (Year)', or 'Title' without a year."""
+        assert format_movie_folder(title, year) == expected
 
 
 @dataclass
@@ -121,6 +120,22 @@ class MockDatabase:
     updated_jobs: list[dict[str, Any]] = field(default_factory=list)
     collection: list[dict[str, Any]] = field(default_factory=list)
 
+    def add_job(self, encode_path: str, **fields: Any) -> dict[str, Any]:
+        """Add a movie job waiting to be moved, overriding any default fields."""
+        job: dict[str, Any] = {
+            "id": 1,
+            "encode_path": encode_path,
+            "content_type": "movie",
+            "identified_title": "Movie",
+            "identified_year": 2024,
+            "tmdb_id": None,
+            "rip_path": None,
+            "status": "moving",
+            **fields,
+        }
+        self.jobs.append(job)
+        return job
+
     async def get_jobs_by_status(self, status: str) -> list[dict[str, Any]]:
         """Return jobs matching the given status."""
         return [j for j in self.jobs if j.get("status") == status]
@@ -179,6 +194,16 @@ def config(temp_workspace: Path) -> MockConfig:
     )
 
 
+@pytest.fixture(scope="module")
+def missing_plex_config(tmp_path_factory: pytest.TempPathFactory) -> MockConfig:
+    """Create a mock configuration whose Plex directories do not exist."""
+    base = tmp_path_factory.mktemp("missing_plex")
+    return MockConfig(
+        plex_movies_dir=base / "nonexistent",
+        plex_tv_dir=base / "nonexistent_tv",
+    )
+
+
 @pytest.fixture
 def database() -> MockDatabase:
     """Create a mock database."""
@@ -200,7 +225,6 @@ class TestFileMoverInit:
 class TestFileMoverStartStop:
     """Tests for FileMover start/stop lifecycle."""
 
-    @pytest.mark.asyncio
     async def test_start_sets_running_and_creates_task(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
@@ -214,7 +238,6 @@ class TestFileMoverStartStop:
 
         await mover.stop()
 
-    @pytest.mark.asyncio
     async def test_start_idempotent(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
@@ -228,7 +251,6 @@ class TestFileMoverStartStop:
 
         await mover.stop()
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_task(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
@@ -244,7 +266,6 @@ class TestFileMoverStartStop:
 class TestFileMoverMoveMovie:
     """Tests for movie file moving to Plex directory in Title (Year) folder."""
 
-    @pytest.mark.asyncio
     async def test_moves_movie_to_title_year_folder(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -256,17 +277,11 @@ class TestFileMoverMoveMovie:
         encode_file.write_text("fake movie content")
 
         # Set up the job
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Inception",
-                "identified_year": 2010,
-                "tmdb_id": 27205,
-                "rip_path": None,
-                "status": "moving",
-            }
+        database.add_job(
+            str(encode_file),
+            identified_title="Inception",
+            identified_year=2010,
+            tmdb_id=27205,
         )
 
         mover = FileMover(config, database)
@@ -287,14 +302,13 @@ class TestFileMoverMoveMovie:
         assert database.collection[0]["title"] == "Inception"
         assert database.collection[0]["year"] == 2010
 
-    @pytest.mark.asyncio
     async def test_movie_folder_structure(
         self, config: MockConfig, temp_workspace: Path
     ) -> None:
         """Should create proper folder structure: plex_movies/Title (Year)/Title (Year).mkv."""
         # Create a fake encoded file
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(encode_file, "The Matrix", 1999)
@@ -310,7 +324,6 @@ class TestFileMoverMoveMovie:
         assert expected_file.exists(), "Movie file should exist in folder"
         assert result.final_path == expected_file
 
-    @pytest.mark.asyncio
     async def test_movie_without_year_uses_title_only(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -318,19 +331,12 @@ class TestFileMoverMoveMovie:
         encode_dir = temp_workspace / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Unknown Movie",
-                "identified_year": None,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-            }
+        database.add_job(
+            str(encode_file),
+            identified_title="Unknown Movie",
+            identified_year=None,
         )
 
         mover = FileMover(config, database)
@@ -340,13 +346,12 @@ class TestFileMoverMoveMovie:
         expected_path = config.plex_movies_dir / "Unknown Movie" / "Unknown Movie.mkv"
         assert expected_path.exists()
 
-    @pytest.mark.asyncio
     async def test_sanitizes_movie_folder_name(
         self, config: MockConfig, temp_workspace: Path
     ) -> None:
         """Should sanitize invalid characters from folder name."""
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(encode_file, 'Movie: The "Sequel"', 2024)
@@ -356,7 +361,6 @@ class TestFileMoverMoveMovie:
         expected_folder = config.plex_movies_dir / "Movie The Sequel (2024)"
         assert expected_folder.is_dir()
 
-    @pytest.mark.asyncio
     async def test_move_movie_direct_call(
         self, config: MockConfig, temp_workspace: Path
     ) -> None:
@@ -378,23 +382,11 @@ class TestFileMoverMoveMovie:
 class TestFileMoverErrorHandling:
     """Tests for error handling."""
 
-    @pytest.mark.asyncio
     async def test_missing_encode_file(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
         """Should fail job if encoded file doesn't exist."""
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": "/nonexistent/file.mkv",
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-            }
-        )
+        database.add_job("/nonexistent/file.mkv")
 
         mover = FileMover(config, database)
         await mover._process_jobs()
@@ -402,7 +394,6 @@ class TestFileMoverErrorHandling:
         assert database.updated_jobs[0]["status"] == "failed"
         assert "not found" in database.updated_jobs[0]["error_message"]
 
-    @pytest.mark.asyncio
     async def test_missing_title(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -410,20 +401,9 @@ class TestFileMoverErrorHandling:
         encode_dir = temp_workspace / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": None,
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-            }
-        )
+        database.add_job(str(encode_file), identified_title=None)
 
         mover = FileMover(config, database)
         await mover._process_jobs()
@@ -431,21 +411,17 @@ class TestFileMoverErrorHandling:
         assert database.updated_jobs[0]["status"] == "failed"
         assert "identified_title" in database.updated_jobs[0]["error_message"]
 
-    @pytest.mark.asyncio
     async def test_missing_plex_directory(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should fail gracefully if Plex directory doesn't exist."""
-        # Config points to non-existent directory
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_file = tmp_path / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        mover = FileMover(config, database)
+        mover = FileMover(missing_plex_config, database)
         result = await mover.move_movie(encode_file, "Movie", 2024)
 
         assert not result.success
@@ -456,19 +432,15 @@ class TestFileMoverErrorHandling:
 class TestFileMoverCleanup:
     """Tests for cleanup after successful move."""
 
-    @pytest.mark.asyncio
     async def test_cleanup_failure_logs_at_error_level(
         self, config: MockConfig, database: MockDatabase, tmp_path: Path, caplog: pytest.LogCaptureFixture
     ) -> None:
         """Should log cleanup failures at ERROR level for visibility."""
-        import logging
-        from unittest.mock import patch, AsyncMock
-
         # Create encode directory with file
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, database)
 
@@ -487,7 +459,6 @@ class TestFileMoverCleanup:
         cleanup_errors = [r for r in error_logs if "clean up" in r.message.lower()]
         assert len(cleanup_errors) > 0, f"Expected ERROR log for cleanup failure. Records: {[(r.levelname, r.message) for r in caplog.records]}"
 
-    @pytest.mark.asyncio
     async def test_cleans_up_encode_directory(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -495,27 +466,15 @@ class TestFileMoverCleanup:
         encode_dir = temp_workspace / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-            }
-        )
+        database.add_job(str(encode_file))
 
         mover = FileMover(config, database)
         await mover._process_jobs()
 
         assert not encode_dir.exists()
 
-    @pytest.mark.asyncio
     async def test_cleans_up_rip_directory(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -523,24 +482,13 @@ class TestFileMoverCleanup:
         encode_dir = temp_workspace / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         rip_dir = temp_workspace / "staging" / "job_1"
         rip_dir.mkdir(parents=True)
-        (rip_dir / "ripped_file.mkv").write_text("ripped content")
+        (rip_dir / "ripped_file.mkv").touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": str(rip_dir),
-                "status": "moving",
-            }
-        )
+        database.add_job(str(encode_file), rip_path=str(rip_dir))
 
         mover = FileMover(config, database)
         await mover._process_jobs()
@@ -551,7 +499,6 @@ class TestFileMoverCleanup:
 class TestFileMoverAddToCollection:
     """Tests for collection tracking after successful move."""
 
-    @pytest.mark.asyncio
     async def test_adds_movie_to_collection(
         self, config: MockConfig, database: MockDatabase, temp_workspace: Path
     ) -> None:
@@ -559,19 +506,13 @@ class TestFileMoverAddToCollection:
         encode_dir = temp_workspace / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Test Movie",
-                "identified_year": 2020,
-                "tmdb_id": 12345,
-                "rip_path": None,
-                "status": "moving",
-            }
+        database.add_job(
+            str(encode_file),
+            identified_title="Test Movie",
+            identified_year=2020,
+            tmdb_id=12345,
         )
 
         mover = FileMover(config, database)
@@ -588,20 +529,17 @@ class TestFileMoverAddToCollection:
 class TestFileMoverRetry:
     """Tests for retry behavior when Plex directory is missing."""
 
-    @pytest.mark.asyncio
     async def test_missing_plex_directory_returns_retryable_error(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should return retryable=True when Plex directory doesn't exist."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_file = tmp_path / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        mover = FileMover(config, database)
+        mover = FileMover(missing_plex_config, database)
         result = await mover.move_movie(encode_file, "Movie", 2024)
 
         assert not result.success
@@ -609,7 +547,6 @@ class TestFileMoverRetry:
         assert result.error is not None
         assert "not found" in result.error
 
-    @pytest.mark.asyncio
     async def test_missing_plex_tv_directory_returns_retryable_error(
         self, database: MockDatabase, tmp_path: Path
     ) -> None:
@@ -620,7 +557,7 @@ class TestFileMoverRetry:
         )
 
         encode_file = tmp_path / "episode.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, database)
         result = await mover._move_tv_episode(encode_file, "Show", 1, 1, "Episode")
@@ -630,36 +567,21 @@ class TestFileMoverRetry:
         assert result.error is not None
         assert "not found" in result.error
 
-    @pytest.mark.asyncio
     async def test_increments_retry_count_on_missing_directory(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should increment retry count and keep job in MOVING status."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                "move_retry_count": 0,
-            }
-        )
+        database.add_job(str(encode_file), move_retry_count=0)
 
-        mover = FileMover(config, database, max_retries=3)
+        mover = FileMover(missing_plex_config, database, max_retries=3)
         await mover._process_jobs()
 
         # Job should stay in moving status (not failed)
@@ -669,36 +591,24 @@ class TestFileMoverRetry:
         # Error message should indicate retry
         assert "Retry 1/3" in database.updated_jobs[0]["error_message"]
 
-    @pytest.mark.asyncio
     async def test_continues_retrying_until_max(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should continue incrementing retry count on subsequent failures."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                "move_retry_count": 2,  # Already retried twice
-            }
+        database.add_job(
+            str(encode_file),
+            move_retry_count=2,  # Already retried twice
         )
 
-        mover = FileMover(config, database, max_retries=3)
+        mover = FileMover(missing_plex_config, database, max_retries=3)
         await mover._process_jobs()
 
         # Job still in moving status with retry count incremented to 3
@@ -706,43 +616,30 @@ class TestFileMoverRetry:
         assert database.updated_jobs[0]["move_retry_count"] == 3
         assert "Retry 3/3" in database.updated_jobs[0]["error_message"]
 
-    @pytest.mark.asyncio
     async def test_fails_after_max_retries_exceeded(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should fail job after max retries exceeded."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                "move_retry_count": 3,  # Already at max
-            }
+        database.add_job(
+            str(encode_file),
+            move_retry_count=3,  # Already at max
         )
 
-        mover = FileMover(config, database, max_retries=3)
+        mover = FileMover(missing_plex_config, database, max_retries=3)
         await mover._process_jobs()
 
         # Job should now be failed
         assert database.updated_jobs[0]["status"] == "failed"
         assert "Max retries exceeded" in database.updated_jobs[0]["error_message"]
 
-    @pytest.mark.asyncio
     async def test_succeeds_on_retry_when_directory_appears(
         self, database: MockDatabase, tmp_path: Path
     ) -> None:
@@ -759,20 +656,11 @@ class TestFileMoverRetry:
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                "move_retry_count": 2,  # Previously failed twice
-            }
+        database.add_job(
+            str(encode_file),
+            move_retry_count=2,  # Previously failed twice
         )
 
         mover = FileMover(config, database, max_retries=3)
@@ -782,80 +670,52 @@ class TestFileMoverRetry:
         assert database.updated_jobs[0]["status"] == "complete"
         assert "Movie (2024)" in database.updated_jobs[0]["final_path"]
 
-    @pytest.mark.asyncio
     async def test_handles_null_retry_count(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should handle jobs with null/missing move_retry_count."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         # Job without move_retry_count field
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                # No move_retry_count field
-            }
-        )
+        database.add_job(str(encode_file))
 
-        mover = FileMover(config, database, max_retries=3)
+        mover = FileMover(missing_plex_config, database, max_retries=3)
         await mover._process_jobs()
 
         # Should start from 0 and increment to 1
         assert database.updated_jobs[0]["move_retry_count"] == 1
 
-    @pytest.mark.asyncio
     async def test_custom_max_retries(
-        self, database: MockDatabase, tmp_path: Path
+        self,
+        missing_plex_config: MockConfig,
+        database: MockDatabase,
+        tmp_path: Path,
     ) -> None:
         """Should respect custom max_retries setting."""
-        config = MockConfig(
-            plex_movies_dir=tmp_path / "nonexistent",
-            plex_tv_dir=tmp_path / "nonexistent_tv",
-        )
-
         encode_dir = tmp_path / "encoding" / "job_1"
         encode_dir.mkdir(parents=True)
         encode_file = encode_dir / "movie.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
-        database.jobs.append(
-            {
-                "id": 1,
-                "encode_path": str(encode_file),
-                "content_type": "movie",
-                "identified_title": "Movie",
-                "identified_year": 2024,
-                "tmdb_id": None,
-                "rip_path": None,
-                "status": "moving",
-                "move_retry_count": 4,  # At custom max
-            }
+        database.add_job(
+            str(encode_file),
+            move_retry_count=4,  # At custom max
         )
 
         # Custom max_retries of 5
-        mover = FileMover(config, database, max_retries=5)
+        mover = FileMover(missing_plex_config, database, max_retries=5)
         await mover._process_jobs()
 
         # Should still retry (count at 4, max is 5)
         assert "status" not in database.updated_jobs[0]
         assert database.updated_jobs[0]["move_retry_count"] == 5
 
-    @pytest.mark.asyncio
     async def test_init_with_retry_settings(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
@@ -864,7 +724,6 @@ class TestFileMoverRetry:
         assert mover.max_retries == 20
         assert mover.retry_delay == 600
 
-    @pytest.mark.asyncio
     async def test_default_retry_settings(
         self, config: MockConfig, database: MockDatabase
     ) -> None:
@@ -877,13 +736,10 @@ class TestFileMoverRetry:
 class TestFileMoverModeBasedDirectory:
     """Tests for mode-based output directory selection."""
 
-    @pytest.mark.asyncio
     async def test_home_movies_mode_uses_home_movies_dir(
         self, temp_workspace: Path
     ) -> None:
         """HOME_MOVIES mode should use plex_home_movies_dir."""
-        from dvdtoplex.database import RipMode
-
         # Create directories
         plex_home_movies = temp_workspace / "plex_home_movies"
         plex_home_movies.mkdir(exist_ok=True)
@@ -898,7 +754,7 @@ class TestFileMoverModeBasedDirectory:
 
         # Create test file
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(
@@ -910,13 +766,10 @@ class TestFileMoverModeBasedDirectory:
         assert str(plex_home_movies) in str(result.final_path)
         assert str(temp_workspace / "plex_movies") not in str(result.final_path)
 
-    @pytest.mark.asyncio
     async def test_other_mode_uses_other_dir(
         self, temp_workspace: Path
     ) -> None:
         """OTHER mode should use plex_other_dir."""
-        from dvdtoplex.database import RipMode
-
         # Create directories
         plex_other = temp_workspace / "plex_other"
         plex_other.mkdir(exist_ok=True)
@@ -931,7 +784,7 @@ class TestFileMoverModeBasedDirectory:
 
         # Create test file
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(
@@ -942,13 +795,10 @@ class TestFileMoverModeBasedDirectory:
         assert result.final_path is not None
         assert str(plex_other) in str(result.final_path)
 
-    @pytest.mark.asyncio
     async def test_movie_mode_uses_movies_dir(
         self, temp_workspace: Path
     ) -> None:
         """MOVIE mode should use plex_movies_dir."""
-        from dvdtoplex.database import RipMode
-
         plex_movies = temp_workspace / "plex_movies"
         plex_movies.mkdir(exist_ok=True)
 
@@ -960,7 +810,7 @@ class TestFileMoverModeBasedDirectory:
         )
 
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(
@@ -971,13 +821,12 @@ class TestFileMoverModeBasedDirectory:
         assert result.final_path is not None
         assert str(plex_movies) in str(result.final_path)
 
-    @pytest.mark.asyncio
     async def test_default_mode_is_movie(
         self, config: MockConfig, temp_workspace: Path
     ) -> None:
         """Default (no mode specified) should use plex_movies_dir."""
         encode_file = temp_workspace / "source.mkv"
-        encode_file.write_text("content")
+        encode_file.touch()
 
         mover = FileMover(config, MockDatabase())
         result = await mover.move_movie(encode_file, "Test Movie", 2024)
@@ -3,7 +3,6 @@
 This module verifies that the fixtures in conftest.py work correctly.
 """
 
-import pytest
 from pathlib import Path
 
 from tests.conftest import (
@@ -54,7 +53,6 @@ class TestConfigFixture:
 class TestMockDatabaseFixture:
     """Tests for the mock database fixture."""
 
-    @pytest.mark.asyncio
     async def test_create_and_retrieve_job(self, mock_database: MockDatabase) -> None:
         """Test creating and retrieving a job."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -67,7 +65,6 @@ class TestMockDatabaseFixture:
         assert job.status == JobStatus.PENDING
         assert job.content_type == ContentType.UNKNOWN
 
-    @pytest.mark.asyncio
     async def test_update_job_status(self, mock_database: MockDatabase) -> None:
         """Test updating job status."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -77,7 +74,6 @@ class TestMockDatabaseFixture:
         assert job is not None
         assert job.status == JobStatus.RIPPING
 
-    @pytest.mark.asyncio
     async def test_update_job_status_with_error(self, mock_database: MockDatabase) -> None:
         """Test updating job status with error message."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -88,7 +84,6 @@ class TestMockDatabaseFixture:
         assert job.status == JobStatus.FAILED
         assert job.error_message == "Test error"
 
-    @pytest.mark.asyncio
     async def test_get_jobs_by_status(self, mock_database: MockDatabase) -> None:
         """Test getting jobs by status."""
         job1_id = await mock_database.create_job("disk0", "DISC_1")
@@ -103,7 +98,20 @@ class TestMockDatabaseFixture:
         assert len(ripping_jobs) == 1
         assert ripping_jobs[0].disc_label == "DISC_1"
 
-    @pytest.mark.asyncio
+    async def test_get_jobs_by_status_after_transitions(
+        self, mock_database: MockDatabase
+    ) -> None:
+        """Test that jobs leave their previous status when they transition."""
+        job_id = await mock_database.create_job("disk0", "DISC_1")
+        await mock_database.update_job_status(job_id, JobStatus.RIPPING)
+        await mock_database.update_job_status(job_id, JobStatus.RIPPED)
+
+        assert await mock_database.get_jobs_by_status(JobStatus.PENDING) == []
+        assert await mock_database.get_jobs_by_status(JobStatus.RIPPING) == []
+        assert await mock_database.get_pending_job_for_drive("disk0") is None
+        ripped_jobs = await mock_database.get_jobs_by_status(JobStatus.RIPPED)
+        assert [job.id for job in ripped_jobs] == [job_id]
+
     async def test_get_pending_job_for_drive(self, mock_database: MockDatabase) -> None:
         """Test getting pending job for a specific drive."""
         await mock_database.create_job("disk0", "DISC_1")
@@ -116,7 +124,6 @@ class TestMockDatabaseFixture:
         job = await mock_database.get_pending_job_for_drive("disk2")
         assert job is None
 
-    @pytest.mark.asyncio
     async def test_update_job_paths(self, mock_database: MockDatabase) -> None:
         """Test updating job paths."""
         job_id = await mock_database.create_job("disk0", "TEST_DISC")
@@ -131,7 +138,6 @@ class TestMockDatabaseFixture:
         assert job.encode_path == "/encoding/test.mkv"
         assert job.final_path == "/movies/test.mkv"
 
-    @pytest.mark.asyncio
     async def test_update_job_identification(self, mock_database: MockDatabase) -> None:
         """Test updating job identification."""
         job_id = await mock_database.create_job("disk0", "THE_MATRIX")
@@ -153,7 +159,6 @@ class TestMockDatabaseFixture:
         assert job.tmdb_id == 603
         assert job.confidence == 0.95
 
-    @pytest.mark.asyncio
     async def test_get_recent_jobs(self, mock_database: MockDatabase) -> None:
         """Test getting recent jobs."""
         for i in range(15):
@@ -169,7 +174,6 @@ class TestMockDatabaseFixture:
 class TestTVSeasonOperations:
     """Tests for TV season database operations."""
 
-    @pytest.mark.asyncio
     async def test_create_tv_season(self, mock_database: MockDatabase) -> None:
         """Test creating a TV season."""
         job_id = await mock_database.create_job("disk0", "FRIENDS_S01")
@@ -182,7 +186,6 @@ class TestTVSeasonOperations:
         assert season["season_number"] == 1
         assert season["tmdb_show_id"] == 1668
 
-    @pytest.mark.asyncio
     async def test_get_tv_seasons_by_job(self, mock_database: MockDatabase) -> None:
         """Test getting TV seasons for a job."""
         job_id = await mock_database.create_job("disk0", "MULTI_SEASON")
@@ -196,7 +199,6 @@ class TestTVSeasonOperations:
 class TestEpisodeOperations:
     """Tests for episode database operations."""
 
-    @pytest.mark.asyncio
     async def test_create_episode(self, mock_database: MockDatabase) -> None:
         """Test creating an episode."""
         job_id = await mock_database.create_job("disk0", "FRIENDS_S01")
@@ -208,7 +210,6 @@ class TestEpisodeOperations:
         assert episodes[0]["title"] == "The Pilot"
         assert episodes[0]["episode_number"] == 1
 
-    @pytest.mark.asyncio
     async def test_update_episode_paths(self, mock_database: MockDatabase) -> None:
         """Test updating episode paths."""
         job_id = await mock_database.create_job("disk0", "FRIENDS_S01")
@@ -231,7 +232,6 @@ class TestEpisodeOperations:
 class TestCollectionOperations:
     """Tests for collection database operations."""
 
-    @pytest.mark.asyncio
     async def test_add_to_collection(self, mock_database: MockDatabase) -> None:
         """Test adding to collection."""
         _item_id = await mock_database.add_to_collection(
@@ -247,7 +247,6 @@ class TestCollectionOperations:
         assert collection[0]["title"] == "The Matrix"
         assert collection[0]["year"] == 1999
 
-    @pytest.mark.asyncio
     async def test_get_collection_item(self, mock_database: MockDatabase) -> None:
         """Test getting a collection item."""
         item_id = await mock_database.add_to_collection(
@@ -258,7 +257,6 @@ class TestCollectionOperations:
         assert item is not None
         assert item["title"] == "Inception"
 
-    @pytest.mark.asyncio
     async def test_collection_sorted_by_title(self, mock_database: MockDatabase) -> None:
         """Test that collection is sorted by title."""
         await mock_database.add_to_collection("Zulu", "/movies/zulu.mkv")
@@ -272,7 +270,6 @@ class TestCollectionOperations:
 class TestWantedOperations:
     """Tests for wanted list database operations."""
 
-    @pytest.mark.asyncio
     async def test_add_to_wanted(self, mock_database: MockDatabase) -> None:
         """Test adding to wanted list."""
         _item_id = await mock_database.add_to_wanted(
@@ -288,7 +285,6 @@ class TestWantedOperations:
         assert wanted[0]["title"] == "Blade Runner"
         assert wanted[0]["notes"] == "Director's cut"
 
-    @pytest.mark.asyncio
     async def test_remove_from_wanted(self, mock_database: MockDatabase) -> None:
         """Test removing from wanted list."""
         item_id = await mock_database.add_to_wanted("Test Movie")
@@ -299,30 +295,41 @@ class TestWantedOperations:
         wanted = await mock_database.get_wanted()
         assert len(wanted) == 0
 
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_from_wanted(self, mock_database: MockDatabase) -> None:
         """Test removing nonexistent item from wanted list."""
         result = await mock_database.remove_from_wanted(999)
         assert result is False
 
+    async def test_wanted_ids_not_reused_after_remove(
+        self, mock_database: MockDatabase
+    ) -> None:
+        """Test that removing an item does not cause ID reuse on the next add."""
+        first_id = await mock_database.add_to_wanted("First")
+        second_id = await mock_database.add_to_wanted("Second")
+        await mock_database.remove_from_wanted(first_id)
+
+        third_id = await mock_database.add_to_wanted("Third")
+
+        assert third_id not in (first_id, second_id)
+        second = await mock_database.get_wanted_item(second_id)
+        assert second is not None
+        assert second["title"] == "Second"
+
 
 class TestSettingsOperations:
     """Tests for settings database operations."""
 
-    @pytest.mark.asyncio
     async def test_set_and_get_setting(self, mock_database: MockDatabase) -> None:
         """Test setting and getting a setting."""
         await mock_database.set_setting("test_key", "test_value")
         value = await mock_database.get_setting("test_key")
         assert value == "test_value"
 
-    @pytest.mark.asyncio
     async def test_get_setting_default(self, mock_database: MockDatabase) -> None:
         """Test getting a setting with default value."""
         value = await mock_database.get_setting("nonexistent", "default")
         assert value == "default"
 
-    @pytest.mark.asyncio
     async def test_get_all_settings(self, mock_database: MockDatabase) -> None:
         """Test getting all settings."""
         await mock_database.set_setting("key1", "value1")
@@ -374,7 +381,6 @@ class TestSampleDataFixture:
 class TestPrePopulatedDatabaseFixtures:
     """Tests for pre-populated database fixtures."""
 
-    @pytest.mark.asyncio
     async def test_database_with_jobs(self, mock_database_with_jobs: MockDatabase) -> None:
         """Test that database is pre-populated with jobs in various states."""
         pending = await mock_database_with_jobs.get_jobs_by_status(JobStatus.PENDING)
@@ -391,7 +397,6 @@ class TestPrePopulatedDatabaseFixtures:
         assert len(complete) >= 1
         assert len(failed) >= 1
 
-    @pytest.mark.asyncio
     async def test_database_with_collection(
         self, mock_database_with_collection: MockDatabase
     ) -> None:
@@ -403,7 +408,6 @@ class TestPrePopulatedDatabaseFixtures:
         assert "The Matrix" in titles
         assert "Inception" in titles
 
-    @pytest.mark.asyncio
     async def test_database_with_wanted(
         self, mock_database_with_wanted: MockDatabase
     ) -> None:
@@ -414,3 +418,21 @@ class TestPrePopulatedDatabaseFixtures:
         titles = [item["title"] for item in wanted]
         assert "Blade Runner 2049" in titles
         assert "The Shawshank Redemption" in titles
+
+    async def test_database_with_jobs_is_isolated_copy(
+        self,
+        mock_database_with_jobs: MockDatabase,
+        _mock_database_with_jobs_template: MockDatabase,
+    ) -> None:
+        """Test that mutating the per-test copy leaves the session template intact."""
+        assert mock_database_with_jobs is not _mock_database_with_jobs_template
+
+        await mock_database_with_jobs.update_job_status(1, JobStatus.FAILED)
+        await mock_database_with_jobs.create_job("disk0", "EXTRA_DISC")
+
+        template_job = await _mock_database_with_jobs_template.get_job(1)
+        assert template_job is not None
+        assert template_job.status == JobStatus.PENDING
+        assert len(_mock_database_with_jobs_template.jobs) == len(
+            mock_database_with_jobs.jobs
+        ) - 1
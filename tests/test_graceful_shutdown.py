@@ -32,7 +32,6 @@ class TestGracefulShutdown:
 
         assert exc_info.value.code == 1
 
-    @pytest.mark.asyncio
     async def test_wait_for_shutdown_blocks_until_signal(self) -> None:
         """wait_for_shutdown should block until shutdown is requested."""
         shutdown = GracefulShutdown()
@@ -51,7 +50,6 @@ class TestGracefulShutdown:
         await asyncio.wait_for(wait_task, timeout=1.0)
         assert wait_task.done()
 
-    @pytest.mark.asyncio
     async def test_wait_for_shutdown_returns_immediately_if_already_shutdown(
         self,
     ) -> None:
@@ -78,7 +76,6 @@ class TestApplicationShutdown:
         config.web_port = 8080
         return config
 
-    @pytest.mark.asyncio
     async def test_stop_services_order(self, mock_config: MagicMock) -> None:
         """Services should be stopped in reverse order."""
         # Track stop order
@@ -127,7 +124,6 @@ class TestApplicationShutdown:
                 "drive_watcher",
             ]
 
-    @pytest.mark.asyncio
     async def test_stop_services_handles_timeout(self, mock_config: MagicMock) -> None:
         """Stop should handle services that timeout."""
         mock_drive_watcher = AsyncMock()
@@ -156,7 +152,6 @@ class TestApplicationShutdown:
             # Should complete without hanging (timeout should work)
             await asyncio.wait_for(app.stop_services(), timeout=10.0)
 
-    @pytest.mark.asyncio
     async def test_cleanup_closes_database(self, mock_config: MagicMock) -> None:
         """Cleanup should close database connection."""
         mock_database = AsyncMock()
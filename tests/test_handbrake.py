@@ -119,7 +119,6 @@ class TestParseProgressLine:
 class TestEncodeFile:
     """Tests for encode_file function."""
 
-    @pytest.mark.asyncio
     async def test_input_file_not_found(self, tmp_path: Path) -> None:
         """Test error when input file doesn't exist."""
         input_path = tmp_path / "nonexistent.mkv"
@@ -131,7 +130,6 @@ class TestEncodeFile:
         assert exc_info.value.input_path == input_path
         assert "does not exist" in exc_info.value.details
 
-    @pytest.mark.asyncio
     async def test_input_path_is_directory(self, tmp_path: Path) -> None:
         """Test error when input path is a directory."""
         input_path = tmp_path / "somedir"
@@ -143,7 +141,6 @@ class TestEncodeFile:
 
         assert "not a file" in exc_info.value.details
 
-    @pytest.mark.asyncio
     async def test_handbrake_not_found(self, tmp_path: Path) -> None:
         """Test error when HandBrakeCLI is not found."""
         input_path = tmp_path / "input.mkv"
@@ -159,7 +156,6 @@ class TestEncodeFile:
 
         assert exc_info.value.path == "/nonexistent/HandBrakeCLI"
 
-    @pytest.mark.asyncio
     async def test_encode_failure(self, tmp_path: Path) -> None:
         """Test error when encoding fails with non-zero exit code."""
         input_path = tmp_path / "input.mkv"
@@ -188,7 +184,6 @@ class TestEncodeFile:
             assert exc_info.value.input_path == input_path
             assert exc_info.value.output_path == output_path
 
-    @pytest.mark.asyncio
     async def test_output_file_not_created(self, tmp_path: Path) -> None:
         """Test error when output file is not created after encoding."""
         input_path = tmp_path / "input.mkv"
@@ -211,7 +206,6 @@ class TestEncodeFile:
             assert exc_info.value.output_path == output_path
             assert "not created" in exc_info.value.details
 
-    @pytest.mark.asyncio
     async def test_output_file_empty(self, tmp_path: Path) -> None:
         """Test error when output file is empty."""
         input_path = tmp_path / "input.mkv"
@@ -238,7 +232,6 @@ class TestEncodeFile:
 
             assert "empty" in exc_info.value.details
 
-    @pytest.mark.asyncio
     async def test_successful_encode(self, tmp_path: Path) -> None:
         """Test successful encoding."""
         input_path = tmp_path / "input.mkv"
@@ -202,7 +202,6 @@ class TestIdentifierService:
             tmdb_client=mock_tmdb,
         )
 
-    @pytest.mark.asyncio
     async def test_identify_movie_high_confidence(
         self, service: IdentifierService, mock_tmdb: MagicMock
     ) -> None:
@@ -227,7 +226,6 @@ class TestIdentifierService:
         assert result.confidence > 0.85
         assert not result.needs_review
 
-    @pytest.mark.asyncio
     async def test_identify_movie_low_confidence(
         self, service: IdentifierService, mock_tmdb: MagicMock
     ) -> None:
@@ -249,7 +247,6 @@ class TestIdentifierService:
         assert result.needs_review
         assert result.confidence < 0.85
 
-    @pytest.mark.asyncio
     async def test_identify_no_results(
         self, service: IdentifierService, mock_tmdb: MagicMock
     ) -> None:
@@ -264,7 +261,6 @@ class TestIdentifierService:
         assert result.confidence == 0.0
         assert result.needs_review
 
-    @pytest.mark.asyncio
     async def test_identify_tv_show(
         self, service: IdentifierService, mock_tmdb: MagicMock
     ) -> None:
@@ -296,7 +292,6 @@ class TestIdentifierService:
         assert result.title == "Breaking Bad"
         assert result.tmdb_id == 1396
 
-    @pytest.mark.asyncio
     async def test_identify_includes_alternatives(
         self, service: IdentifierService, mock_tmdb: MagicMock
     ) -> None:
@@ -335,7 +330,6 @@ class TestIdentifierService:
         assert result.alternatives[0].tmdb_id == 604
         assert result.alternatives[1].tmdb_id == 605
 
-    @pytest.mark.asyncio
     async def test_identify_and_update_job(
         self, service: IdentifierService, mock_db: MagicMock, mock_tmdb: MagicMock
     ) -> None:
@@ -371,7 +365,6 @@ class TestIdentifierService:
         )
         mock_db.update_job_status.assert_called_once_with(1, JobStatus.MOVING)
 
-    @pytest.mark.asyncio
     async def test_start_stop_service(self, service: IdentifierService) -> None:
         """Service should start and stop cleanly."""
         await service.start()
@@ -417,7 +410,6 @@ class TestIdentifierServiceJobProcessing:
             updated_at=datetime.now(),
         )
 
-    @pytest.mark.asyncio
     async def test_process_encoded_job_auto_approve(
         self, mock_db: MagicMock, sample_job: Job
     ) -> None:
@@ -451,7 +443,6 @@ class TestIdentifierServiceJobProcessing:
         # Should end up as MOVING (auto-approved)
         assert any(call[0][1] == JobStatus.MOVING for call in calls)
 
-    @pytest.mark.asyncio
     async def test_process_encoded_job_needs_review(
         self, mock_db: MagicMock, sample_job: Job
     ) -> None:
@@ -483,7 +474,6 @@ class TestIdentifierServiceJobProcessing:
         calls = mock_db.update_job_status.call_args_list
         assert any(call[0][1] == JobStatus.REVIEW for call in calls)
 
-    @pytest.mark.asyncio
     async def test_process_job_error_handling(
         self, mock_db: MagicMock, sample_job: Job
     ) -> None:
@@ -508,7 +498,6 @@ class TestIdentifierServiceJobProcessing:
         assert failed_call is not None
         assert "API Error" in failed_call[1].get("error_message", "")
 
-    @pytest.mark.asyncio
     async def test_identifier_skips_preidentified_jobs(
         self, mock_db: MagicMock, sample_job: Job
     ) -> None:
@@ -536,7 +525,6 @@ class TestIdentifierServiceJobProcessing:
         calls = mock_db.update_job_status.call_args_list
         assert any(call[0][1] == JobStatus.MOVING for call in calls)
 
-    @pytest.mark.asyncio
     async def test_identifier_skips_tmdb_for_home_movies_mode(
         self, mock_db: MagicMock
     ) -> None:
@@ -586,7 +574,6 @@ class TestIdentifierServiceJobProcessing:
         calls = mock_db.update_job_status.call_args_list
         assert any(call[0][1] == JobStatus.MOVING for call in calls)
 
-    @pytest.mark.asyncio
     async def test_identifier_skips_tmdb_for_other_mode(
         self, mock_db: MagicMock
     ) -> None:
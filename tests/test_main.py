@@ -20,7 +20,6 @@ def config(tmp_path: Path) -> Config:
     )
 
 
-@pytest.mark.asyncio
 async def test_application_creates_directories(config: Config) -> None:
     """Test that the application creates workspace directories."""
     app = Application(config)
@@ -31,7 +30,6 @@ async def test_application_creates_directories(config: Config) -> None:
     assert config.encoding_dir.exists()
 
 
-@pytest.mark.asyncio
 async def test_application_stop_logs_shutdown(
     config: Config, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -46,7 +44,6 @@ async def test_application_stop_logs_shutdown(
     assert "Application stopped" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_shutdown_event_is_set_on_signal(config: Config) -> None:
     """Test that shutdown event is set when signal handler is called."""
     app = Application(config)
@@ -61,7 +58,6 @@ async def test_shutdown_event_is_set_on_signal(config: Config) -> None:
     assert app._shutdown_event.is_set()
 
 
-@pytest.mark.asyncio
 async def test_application_includes_sheets_sync_service(tmp_path, monkeypatch):
     """Test Application includes SheetsSyncService when configured."""
     monkeypatch.setenv("GOOGLE_SHEETS_CREDENTIALS_FILE", str(tmp_path / "creds.json"))
@@ -47,7 +47,6 @@ class TestNotifier:
 class TestNotifierSend:
     """Tests for the send method."""
 
-    @pytest.mark.asyncio
     async def test_send_without_credentials(self) -> None:
         """Test send returns failure when credentials are missing."""
         notifier = Notifier()
@@ -56,7 +55,6 @@ class TestNotifierSend:
         assert result.success is False
         assert "not configured" in result.message
 
-    @pytest.mark.asyncio
     async def test_send_success(self) -> None:
         """Test successful notification send."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -83,7 +81,6 @@ class TestNotifierSend:
             assert call_args[1]["data"]["message"] == "Test message"
             assert call_args[1]["data"]["priority"] == 0
 
-    @pytest.mark.asyncio
     async def test_send_with_priority(self) -> None:
         """Test send with custom priority."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -102,7 +99,6 @@ class TestNotifierSend:
             call_args = mock_instance.post.call_args
             assert call_args[1]["data"]["priority"] == 1
 
-    @pytest.mark.asyncio
     async def test_send_with_url(self) -> None:
         """Test send with optional URL."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -123,7 +119,6 @@ class TestNotifierSend:
             call_args = mock_instance.post.call_args
             assert call_args[1]["data"]["url"] == "http://example.com/review"
 
-    @pytest.mark.asyncio
     async def test_send_http_error(self) -> None:
         """Test send handles HTTP errors gracefully."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -146,7 +141,6 @@ class TestNotifierSend:
             assert result.success is False
             assert "HTTP error" in result.message
 
-    @pytest.mark.asyncio
     async def test_send_request_error(self) -> None:
         """Test send handles request errors gracefully."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -167,7 +161,6 @@ class TestNotifierSend:
 class TestNotifyDiscComplete:
     """Tests for the notify_disc_complete helper."""
 
-    @pytest.mark.asyncio
     async def test_disc_complete_with_title_and_year(self) -> None:
         """Test notification with identified title and year."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -188,7 +181,6 @@ class TestNotifyDiscComplete:
                 priority=0,
             )
 
-    @pytest.mark.asyncio
     async def test_disc_complete_with_title_only(self) -> None:
         """Test notification with title but no year."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -208,7 +200,6 @@ class TestNotifyDiscComplete:
                 priority=0,
             )
 
-    @pytest.mark.asyncio
     async def test_disc_complete_without_identification(self) -> None:
         """Test notification without identification."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -229,7 +220,6 @@ class TestNotifyDiscComplete:
 class TestNotifyError:
     """Tests for the notify_error helper."""
 
-    @pytest.mark.asyncio
     async def test_notify_error(self) -> None:
         """Test error notification."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -253,7 +243,6 @@ class TestNotifyError:
 class TestNotifyReviewNeeded:
     """Tests for the notify_review_needed helper."""
 
-    @pytest.mark.asyncio
     async def test_notify_review_needed(self) -> None:
         """Test review needed notification."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -275,7 +264,6 @@ class TestNotifyReviewNeeded:
                 url="http://localhost:8080/review",
             )
 
-    @pytest.mark.asyncio
     async def test_notify_review_needed_low_confidence(self) -> None:
         """Test review notification with low confidence."""
         notifier = Notifier(user_key="test_user", api_token="test_token")
@@ -317,7 +305,6 @@ class TestNotificationResult:
 class TestMissingCredentialsLogging:
     """Tests for logging behavior with missing credentials."""
 
-    @pytest.mark.asyncio
     async def test_missing_credentials_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that missing credentials logs a warning."""
         import logging
@@ -1,6 +1,5 @@
 """Tests for the oversight service."""
 
-import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,6 +15,7 @@ from dvdtoplex.services.oversight import (
     fix_stuck_encoding_jobs,
     startup_cleanup,
 )
+from tests.conftest import SQLITE_TEST_PRAGMAS
 
 
 @pytest_asyncio.fixture
@@ -25,6 +25,7 @@ async def db() -> Database:
         db_path = Path(tmpdir) / "test.db"
         database = Database(db_path)
         await database.connect()
+        await database.connection.executescript(SQLITE_TEST_PRAGMAS)
         yield database
         await database.close()
 
@@ -42,7 +43,6 @@ async def set_job_updated_at(db: Database, job_id: int, hours_ago: float) -> Non
 class TestCheckMultipleEncodingJobs:
     """Tests for detecting multiple ENCODING jobs."""
 
-    @pytest.mark.asyncio
     async def test_check_multiple_encoding_jobs(self, db: Database) -> None:
         """Detects when 2+ jobs are in ENCODING status."""
         # Create two jobs and set both to ENCODING
@@ -57,7 +57,6 @@ class TestCheckMultipleEncodingJobs:
         assert "Multiple jobs in ENCODING status" in issues[0]
         assert "2" in issues[0]  # Should mention count
 
-    @pytest.mark.asyncio
     async def test_single_encoding_job_is_ok(self, db: Database) -> None:
         """Single ENCODING job should not be flagged."""
         job = await db.create_job("drive0", "DISC1")
@@ -72,7 +71,6 @@ class TestCheckMultipleEncodingJobs:
 class TestCheckMultipleRippingOnSameDrive:
     """Tests for detecting multiple RIPPING jobs on same drive."""
 
-    @pytest.mark.asyncio
     async def test_check_multiple_ripping_same_drive(self, db: Database) -> None:
         """Detects when 2+ jobs are RIPPING on the same drive."""
         job1 = await db.create_job("drive0", "DISC1")
@@ -86,7 +84,6 @@ class TestCheckMultipleRippingOnSameDrive:
         assert "Multiple jobs RIPPING on drive" in issues[0]
         assert "drive0" in issues[0]
 
-    @pytest.mark.asyncio
     async def test_ripping_on_different_drives_is_ok(self, db: Database) -> None:
         """RIPPING on different drives should not be flagged."""
         job1 = await db.create_job("drive0", "DISC1")
@@ -103,7 +100,6 @@ class TestCheckMultipleRippingOnSameDrive:
 class TestCheckStuckJobs:
     """Tests for detecting jobs stuck in transient states."""
 
-    @pytest.mark.asyncio
     async def test_check_stuck_encoding_job(self, db: Database) -> None:
         """Detects job stuck in ENCODING for >8 hours."""
         job = await db.create_job("drive0", "DISC1")
@@ -118,7 +114,6 @@ class TestCheckStuckJobs:
         assert "ENCODING" in issues[0]
         assert str(job.id) in issues[0]
 
-    @pytest.mark.asyncio
     async def test_check_stuck_ripping_job(self, db: Database) -> None:
         """Detects job stuck in RIPPING for >4 hours."""
         job = await db.create_job("drive0", "DISC1")
@@ -132,7 +127,6 @@ class TestCheckStuckJobs:
         assert "stuck" in issues[0].lower()
         assert "RIPPING" in issues[0]
 
-    @pytest.mark.asyncio
     async def test_check_stuck_identifying_job(self, db: Database) -> None:
         """Detects job stuck in IDENTIFYING for >1 hour."""
         job = await db.create_job("drive0", "DISC1")
@@ -146,7 +140,6 @@ class TestCheckStuckJobs:
         assert "stuck" in issues[0].lower()
         assert "IDENTIFYING" in issues[0]
 
-    @pytest.mark.asyncio
     async def test_recent_encoding_job_is_ok(self, db: Database) -> None:
         """ENCODING job that started recently should not be flagged."""
         job = await db.create_job("drive0", "DISC1")
@@ -162,7 +155,6 @@ class TestCheckStuckJobs:
 class TestNoIssuesNormalState:
     """Tests for normal/valid states."""
 
-    @pytest.mark.asyncio
     async def test_no_issues_normal_state(self, db: Database) -> None:
         """Returns empty list for valid state."""
         # Create various jobs in valid states
@@ -178,13 +170,11 @@ class TestNoIssuesNormalState:
 
         assert issues == []
 
-    @pytest.mark.asyncio
     async def test_no_issues_empty_database(self, db: Database) -> None:
         """Returns empty list when no jobs exist."""
         issues = await check_state_consistency(db)
         assert issues == []
 
-    @pytest.mark.asyncio
     async def test_completed_jobs_not_checked(self, db: Database) -> None:
         """COMPLETE/FAILED/ARCHIVED jobs should not be checked for issues."""
         job1 = await db.create_job("drive0", "DISC1")
@@ -208,7 +198,6 @@ class TestNoIssuesNormalState:
 class TestFixStuckEncodingJobs:
     """Tests for fix_stuck_encoding_jobs function."""
 
-    @pytest.mark.asyncio
     async def test_fix_resets_all_but_most_recent(self, db: Database) -> None:
         """Resets all but the most recent ENCODING job to RIPPED."""
         job1 = await db.create_job("drive0", "DISC1")
@@ -241,7 +230,6 @@ class TestFixStuckEncodingJobs:
         assert updated_job2.status == JobStatus.RIPPED
         assert updated_job3.status == JobStatus.ENCODING  # Most recent kept
 
-    @pytest.mark.asyncio
     async def test_fix_single_encoding_job_no_change(self, db: Database) -> None:
         """Single ENCODING job should not be changed."""
         job = await db.create_job("drive0", "DISC1")
@@ -255,7 +243,6 @@ class TestFixStuckEncodingJobs:
         assert updated_job is not None
         assert updated_job.status == JobStatus.ENCODING
 
-    @pytest.mark.asyncio
     async def test_fix_no_encoding_jobs(self, db: Database) -> None:
         """No ENCODING jobs should return 0."""
         job = await db.create_job("drive0", "DISC1")
@@ -285,7 +272,6 @@ class TestTimeoutConstants:
 class TestStartupCleanup:
     """Tests for startup_cleanup function."""
 
-    @pytest.mark.asyncio
     async def test_startup_cleanup_resets_ripping(self) -> None:
         """Startup should reset RIPPING jobs to FAILED."""
         from dvdtoplex.database import Job
@@ -308,7 +294,6 @@ class TestStartupCleanup:
         assert call_args[0][0] == 1
         assert call_args[0][1] == JobStatus.FAILED
 
-    @pytest.mark.asyncio
     async def test_startup_cleanup_resets_encoding(self) -> None:
         """Startup should reset ENCODING jobs to RIPPED."""
         from dvdtoplex.database import Job
@@ -328,7 +313,6 @@ class TestStartupCleanup:
         assert results["reset_encoding"] == 1
         mock_db.update_job_status.assert_called_once_with(1, JobStatus.RIPPED)
 
-    @pytest.mark.asyncio
     async def test_startup_cleanup_resets_identifying(self) -> None:
         """Startup should reset IDENTIFYING jobs to ENCODED."""
         from dvdtoplex.database import Job
@@ -348,7 +332,6 @@ class TestStartupCleanup:
         assert results["reset_identifying"] == 1
         mock_db.update_job_status.assert_called_once_with(1, JobStatus.ENCODED)
 
-    @pytest.mark.asyncio
     async def test_startup_cleanup_ignores_other_statuses(self) -> None:
         """Startup should not touch jobs in other statuses."""
         from dvdtoplex.database import Job
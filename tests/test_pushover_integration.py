@@ -37,7 +37,6 @@ class TestPushoverIntegration:
         notifier = Notifier(user_key="test_user", api_token="test_token")
         assert notifier.is_configured is True
 
-    @pytest.mark.asyncio
     async def test_send_skips_when_not_configured(self) -> None:
         """Verify send() returns NotificationResult with success=False when not configured."""
         notifier = Notifier()
@@ -56,7 +55,6 @@ class TestPushoverIntegration:
             # Credentials are configured, test passes
             pass
 
-    @pytest.mark.asyncio
     async def test_send_notification_with_real_credentials(self) -> None:
         """Test sending a real notification when credentials are configured.
 
@@ -82,7 +80,6 @@ class TestPushoverIntegration:
         print(f"Notification sent: {result}")
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_notify_disc_complete_with_real_credentials(self) -> None:
         """Test notify_disc_complete with real credentials."""
         user_key = os.getenv("PUSHOVER_USER_KEY", "")
@@ -103,7 +100,6 @@ class TestPushoverIntegration:
         print(f"Notification sent: {result}")
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_send_with_url_and_real_credentials(self) -> None:
         """Test sending notification with URL when credentials are configured."""
         user_key = os.getenv("PUSHOVER_USER_KEY", "")
@@ -128,7 +124,6 @@ class TestPushoverIntegration:
 class TestNotifierMockedCredentials:
     """Test Notifier behavior without making real API calls."""
 
-    @pytest.mark.asyncio
     async def test_send_handles_invalid_credentials_gracefully(self) -> None:
         """Verify send() handles invalid credentials without crashing."""
         notifier = Notifier(user_key="invalid_user", api_token="invalid_token")
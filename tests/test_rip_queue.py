@@ -104,7 +104,6 @@ class TestRipQueue:
         """Create a RipQueue instance."""
         return RipQueue(config, database, drive_ids=["0", "1"])
 
-    @pytest.mark.asyncio
     async def test_start_and_stop(self, rip_queue: RipQueue) -> None:
         """Should start and stop cleanly."""
         await rip_queue.start()
@@ -114,7 +113,6 @@ class TestRipQueue:
         await rip_queue.stop()
         assert rip_queue._running is False
 
-    @pytest.mark.asyncio
     async def test_start_is_idempotent(self, rip_queue: RipQueue) -> None:
         """Starting twice should not create multiple tasks."""
         await rip_queue.start()
@@ -126,7 +124,6 @@ class TestRipQueue:
         assert task1 is task2
         await rip_queue.stop()
 
-    @pytest.mark.asyncio
     @patch("dvdtoplex.services.rip_queue.get_disc_info")
     @patch("dvdtoplex.services.rip_queue.rip_title")
     @patch("dvdtoplex.services.rip_queue.eject_drive")
@@ -166,7 +163,6 @@ class TestRipQueue:
         # Verify eject was called
         mock_eject.assert_called_once_with("0")
 
-    @pytest.mark.asyncio
     @patch("dvdtoplex.services.rip_queue.get_disc_info")
     async def test_handles_no_titles_error(
         self,
@@ -195,7 +191,6 @@ class TestRipQueue:
         # Check that details are included
         assert "minimum" in (updated_job.error_message or "")
 
-    @pytest.mark.asyncio
     @patch("dvdtoplex.services.rip_queue.get_disc_info")
     @patch("dvdtoplex.services.rip_queue.rip_title")
     async def test_handles_rip_error(
@@ -220,7 +215,6 @@ class TestRipQueue:
         assert updated_job.status == JobStatus.FAILED
         assert "Disc read error" in (updated_job.error_message or "")
 
-    @pytest.mark.asyncio
     async def test_processes_jobs_by_drive(
         self,
         rip_queue: RipQueue,
@@ -248,7 +242,6 @@ class TestRipQueue:
         assert len(jobs_by_drive["0"]) == 2
         assert len(jobs_by_drive["1"]) == 1
 
-    @pytest.mark.asyncio
     @patch("dvdtoplex.services.rip_queue.get_disc_info")
     @patch("dvdtoplex.services.rip_queue.rip_title")
     @patch("dvdtoplex.services.rip_queue.eject_drive")
@@ -292,7 +285,6 @@ class TestRipQueue:
         assert updated_job2 is not None
         assert updated_job2.status == JobStatus.RIPPED
 
-    @pytest.mark.asyncio
     async def test_skips_drive_with_active_rip(
         self,
         rip_queue: RipQueue,
@@ -320,7 +312,6 @@ class TestRipQueue:
             except asyncio.CancelledError:
                 pass
 
-    @pytest.mark.asyncio
     async def test_handles_missing_job(
         self,
         rip_queue: RipQueue,
@@ -332,7 +323,6 @@ class TestRipQueue:
 
         # Should not crash - just log and return
 
-    @pytest.mark.asyncio
     @patch("dvdtoplex.services.rip_queue.get_disc_info")
     @patch("dvdtoplex.services.rip_queue.rip_title")
     @patch("dvdtoplex.services.rip_queue.eject_drive")
@@ -35,7 +35,6 @@ def mock_database():
     return db
 
 
-@pytest.mark.asyncio
 async def test_sheets_sync_service_disabled_without_config():
     """Test service is disabled when credentials not configured."""
     config = Mock()
@@ -49,7 +48,6 @@ async def test_sheets_sync_service_disabled_without_config():
     assert not service.is_enabled
 
 
-@pytest.mark.asyncio
 async def test_sheets_sync_service_enabled_with_config(mock_config, mock_database):
     """Test service is enabled when credentials configured."""
     from dvdtoplex.services.sheets_sync import SheetsSyncService
@@ -59,7 +57,6 @@ async def test_sheets_sync_service_enabled_with_config(mock_config, mock_databas
     assert service.is_enabled
 
 
-@pytest.mark.asyncio
 async def test_sheets_sync_performs_sync(mock_config, mock_database, tmp_path):
     """Test sync collects data and updates sheets."""
     # Create test movie folder
@@ -95,7 +92,6 @@ async def test_sheets_sync_performs_sync(mock_config, mock_database, tmp_path):
         assert wishlist_call[0]["title"] == "Dune"
 
 
-@pytest.mark.asyncio
 async def test_sheets_sync_handles_missing_poster_path(mock_config, mock_database):
     """Test sync handles wanted items without poster_path."""
     mock_database.get_wanted.return_value = [
@@ -18,7 +18,6 @@ from dvdtoplex.main import Application
 class TestBaseService:
     """Tests for BaseService stop functionality."""
 
-    @pytest.mark.asyncio
     async def test_service_starts_and_stops(self) -> None:
         """Test that a service can be started and stopped."""
 
@@ -39,14 +38,15 @@ class TestBaseService:
         await service.start()
         assert service.is_running
 
-        # Let it run briefly
-        await asyncio.sleep(0.2)
+        # Let it run at least one iteration
+        async with asyncio.timeout(1.0):
+            while service.run_count == 0:
+                await asyncio.sleep(0)
 
         await service.stop()
         assert not service.is_running
         assert service.run_count > 0
 
-    @pytest.mark.asyncio
     async def test_stop_idempotent(self) -> None:
         """Test that calling stop multiple times is safe."""
 
@@ -61,7 +61,6 @@ class TestBaseService:
         await service.stop()
         assert not service.is_running
 
-    @pytest.mark.asyncio
     async def test_stop_unstarted_service(self) -> None:
         """Test that stopping an unstarted service is safe."""
 
@@ -78,7 +77,6 @@ class TestBaseService:
 class TestDatabase:
     """Tests for Database close functionality."""
 
-    @pytest.mark.asyncio
     async def test_database_close(self) -> None:
         """Test that database can be closed."""
         with TemporaryDirectory() as tmpdir:
@@ -91,7 +89,6 @@ class TestDatabase:
             await db.close()
             assert db.is_closed
 
-    @pytest.mark.asyncio
     async def test_database_close_idempotent(self) -> None:
         """Test that closing database multiple times is safe."""
         with TemporaryDirectory() as tmpdir:
@@ -104,7 +101,6 @@ class TestDatabase:
             await db.close()
             assert db.is_closed
 
-    @pytest.mark.asyncio
     async def test_database_operations_fail_after_close(self) -> None:
         """Test that database operations fail after close."""
         with TemporaryDirectory() as tmpdir:
@@ -121,7 +117,6 @@ class TestDatabase:
 class TestDriveWatcher:
     """Tests for DriveWatcher stop functionality."""
 
-    @pytest.mark.asyncio
     async def test_drive_watcher_stop(self) -> None:
         """Test DriveWatcher stops gracefully."""
         with TemporaryDirectory() as tmpdir:
@@ -143,7 +138,6 @@ class TestDriveWatcher:
 class TestRipQueue:
     """Tests for RipQueue stop functionality."""
 
-    @pytest.mark.asyncio
     async def test_rip_queue_stop(self) -> None:
         """Test RipQueue stops gracefully."""
         with TemporaryDirectory() as tmpdir:
@@ -165,7 +159,6 @@ class TestRipQueue:
 class TestEncodeQueue:
     """Tests for EncodeQueue stop functionality."""
 
-    @pytest.mark.asyncio
     async def test_encode_queue_stop(self) -> None:
         """Test EncodeQueue stops gracefully."""
         with TemporaryDirectory() as tmpdir:
@@ -187,7 +180,6 @@ class TestEncodeQueue:
 class TestIdentifierService:
     """Tests for IdentifierService stop functionality."""
 
-    @pytest.mark.asyncio
     async def test_identifier_service_stop(self) -> None:
         """Test IdentifierService stops gracefully."""
         with TemporaryDirectory() as tmpdir:
@@ -209,7 +201,6 @@ class TestIdentifierService:
 class TestApplication:
     """Tests for Application shutdown functionality."""
 
-    @pytest.mark.asyncio
     async def test_application_shutdown(self) -> None:
         """Test full application shutdown."""
         with TemporaryDirectory() as tmpdir:
@@ -234,7 +225,6 @@ class TestApplication:
             assert len(app.services) == 0
             assert app.database.is_closed
 
-    @pytest.mark.asyncio
     async def test_application_shutdown_stops_services_in_reverse_order(self) -> None:
         """Test that services are stopped in reverse start order."""
         stop_order: list[str] = []
@@ -274,7 +264,6 @@ class TestApplication:
 
             await app.close_database()
 
-    @pytest.mark.asyncio
     async def test_application_shutdown_idempotent(self) -> None:
         """Test that shutdown can be called multiple times safely."""
         with TemporaryDirectory() as tmpdir:
@@ -291,7 +280,6 @@ class TestApplication:
             # Second shutdown should not raise
             await app.shutdown()
 
-    @pytest.mark.asyncio
     async def test_application_initializes_directories(self) -> None:
         """Test that workspace directories are created on initialize."""
         with TemporaryDirectory() as tmpdir:
@@ -152,7 +152,6 @@ class TestSkipEndpoint:
 class TestSkipEndpointWithDatabase:
     """Tests for skip endpoint with database."""
 
-    @pytest.mark.asyncio
     async def test_skip_job_with_database(self):
         """Test skip endpoint uses database when available."""
         # Create mock database
@@ -177,7 +176,6 @@ class TestSkipEndpointWithDatabase:
         mock_db.get_job.assert_called_once_with(1)
         mock_db.update_job_status.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_skip_job_not_found_with_database(self):
         """Test skip returns 404 when job not in database."""
         mock_db = AsyncMock()
@@ -192,7 +190,6 @@ class TestSkipEndpointWithDatabase:
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_skip_job_wrong_status_with_database(self):
         """Test skip returns 400 when job not in REVIEW status."""
         mock_db = AsyncMock()
@@ -310,7 +310,6 @@ class TestTMDbClient:
         assert client._extract_year("") is None
         assert client._extract_year("abc") is None
 
-    @pytest.mark.asyncio
     async def test_search_movie(self, client: TMDbClient) -> None:
         """Test movie search returns MovieMatch results."""
         mock_response = MagicMock()
@@ -349,7 +348,6 @@ class TestTMDbClient:
         assert results[0].year == 1999
         assert results[1].poster_path is None
 
-    @pytest.mark.asyncio
     async def test_search_movie_with_year(self, client: TMDbClient) -> None:
         """Test movie search with year parameter."""
         mock_response = MagicMock()
@@ -366,7 +364,6 @@ class TestTMDbClient:
         call_args = mock_http_client.get.call_args
         assert call_args[1]["params"]["year"] == 2020
 
-    @pytest.mark.asyncio
     async def test_search_tv(self, client: TMDbClient) -> None:
         """Test TV search returns TVMatch results."""
         mock_response = MagicMock()
@@ -396,7 +393,6 @@ class TestTMDbClient:
         assert results[0].name == "Breaking Bad"
         assert results[0].year == 2008
 
-    @pytest.mark.asyncio
     async def test_search_tv_with_year(self, client: TMDbClient) -> None:
         """Test TV search with year parameter."""
         mock_response = MagicMock()
@@ -413,7 +409,6 @@ class TestTMDbClient:
         call_args = mock_http_client.get.call_args
         assert call_args[1]["params"]["first_air_date_year"] == 2015
 
-    @pytest.mark.asyncio
     async def test_get_movie_details(self, client: TMDbClient) -> None:
         """Test getting movie details returns MovieDetails."""
         mock_response = MagicMock()
@@ -443,7 +438,6 @@ class TestTMDbClient:
         assert details.genres == ["Drama", "Thriller"]
         assert details.tagline == "Mischief. Mayhem. Soap."
 
-    @pytest.mark.asyncio
     async def test_get_tv_season(self, client: TMDbClient) -> None:
         """Test getting TV season details returns TVSeasonDetails."""
         mock_show_response = MagicMock()
@@ -484,7 +478,6 @@ class TestTMDbClient:
         assert len(details.episodes) == 1
         assert details.episodes[0]["name"] == "Pilot"
 
-    @pytest.mark.asyncio
     async def test_search_movie_limits_to_10_results(self, client: TMDbClient) -> None:
         """Test that search_movie returns at most 10 results."""
         mock_response = MagicMock()
@@ -512,7 +505,6 @@ class TestTMDbClient:
 
         assert len(results) == 10
 
-    @pytest.mark.asyncio
     async def test_search_tv_limits_to_10_results(self, client: TMDbClient) -> None:
         """Test that search_tv returns at most 10 results."""
         mock_response = MagicMock()
@@ -540,7 +532,6 @@ class TestTMDbClient:
 
         assert len(results) == 10
 
-    @pytest.mark.asyncio
     async def test_close_client(self, client: TMDbClient) -> None:
         """Test closing the HTTP client."""
         mock_http_client = AsyncMock()
@@ -552,7 +543,6 @@ class TestTMDbClient:
         mock_http_client.aclose.assert_called_once()
         assert client._client is None
 
-    @pytest.mark.asyncio
     async def test_close_client_when_none(self, client: TMDbClient) -> None:
         """Test closing when client is None does nothing."""
         assert client._client is None
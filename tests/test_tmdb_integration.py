@@ -13,7 +13,6 @@ from dvdtoplex.tmdb import TMDbClient
 class TestTMDbIntegration:
     """Integration tests for TMDb API."""
 
-    @pytest.mark.asyncio
     async def test_tmdb_search_with_real_credentials(self) -> None:
         """Test TMDb API search with real credentials if configured.
 
@@ -43,7 +42,6 @@ class TestTMDbIntegration:
             assert top_result.title == "The Matrix", f"Expected 'The Matrix', got '{top_result.title}'"
             assert top_result.year == 1999, f"Expected year 1999, got {top_result.year}"
 
-    @pytest.mark.asyncio
     async def test_tmdb_client_requires_context_manager(self) -> None:
         """Test that TMDbClient raises error when not used as context manager."""
         config = load_config()
@@ -57,7 +55,6 @@ class TestTMDbIntegration:
         with pytest.raises(RuntimeError, match="must be used as async context manager"):
             _ = client.client
 
-    @pytest.mark.asyncio
     async def test_tmdb_search_with_year_filter(self) -> None:
         """Test TMDb API search with year filter."""
         config = load_config()
@@ -73,7 +70,6 @@ class TestTMDbIntegration:
             # First result should be The Matrix 1999
             assert results[0].year == 1999
 
-    @pytest.mark.asyncio
     async def test_tmdb_search_tv_show(self) -> None:
         """Test TMDb API TV show search."""
         config = load_config()
@@ -92,7 +88,6 @@ class TestTMDbIntegration:
 
             assert "Breaking Bad" in top_result.name
 
-    @pytest.mark.asyncio
     async def test_tmdb_get_movie_details(self) -> None:
         """Test TMDb API get movie details."""
         config = load_config()
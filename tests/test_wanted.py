@@ -3,10 +3,10 @@
 import tempfile
 from pathlib import Path
 
-import pytest
 import pytest_asyncio
 
 from dvdtoplex.database import Database
+from tests.conftest import SQLITE_TEST_PRAGMAS
 
 
 @pytest_asyncio.fixture
@@ -17,12 +17,12 @@ async def db() -> Database:
 
     database = Database(db_path)
     await database.connect()
+    await database.connection.executescript(SQLITE_TEST_PRAGMAS)
     yield database
     await database.close()
     Path(db_path).unlink(missing_ok=True)
 
 
-@pytest.mark.asyncio
 async def test_add_to_wanted(db: Database) -> None:
     """Test adding an item to the wanted list."""
     wanted_id = await db.add_to_wanted(
@@ -44,7 +44,6 @@ async def test_add_to_wanted(db: Database) -> None:
     assert items[0]["notes"] == "Looking for original DVD release"
 
 
-@pytest.mark.asyncio
 async def test_add_to_wanted_minimal(db: Database) -> None:
     """Test adding an item with only required fields."""
     wanted_id = await db.add_to_wanted(
@@ -61,14 +60,12 @@ async def test_add_to_wanted_minimal(db: Database) -> None:
     assert items[0]["notes"] is None
 
 
-@pytest.mark.asyncio
 async def test_get_wanted_empty(db: Database) -> None:
     """Test getting wanted items when list is empty."""
     items = await db.get_wanted()
     assert items == []
 
 
-@pytest.mark.asyncio
 async def test_get_wanted_ordered_by_added_at(db: Database) -> None:
     """Test that wanted items are ordered by added_at DESC (newest first)."""
     await db.add_to_wanted(content_type="movie", title="First Movie")
@@ -83,7 +80,6 @@ async def test_get_wanted_ordered_by_added_at(db: Database) -> None:
     assert items[2]["title"] == "First Movie"
 
 
-@pytest.mark.asyncio
 async def test_remove_from_wanted(db: Database) -> None:
     """Test removing an item from the wanted list."""
     wanted_id = await db.add_to_wanted(
@@ -101,14 +97,12 @@ async def test_remove_from_wanted(db: Database) -> None:
     assert len(items) == 0
 
 
-@pytest.mark.asyncio
 async def test_remove_from_wanted_not_found(db: Database) -> None:
     """Test removing a non-existent item returns False."""
     result = await db.remove_from_wanted(99999)
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_wanted_with_notes(db: Database) -> None:
     """Test that notes are stored and retrieved correctly."""
     notes = "Need the collector's edition with bonus features"
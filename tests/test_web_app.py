@@ -1,9 +1,12 @@
 """Tests for the web application."""
 
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi.testclient import TestClient
 
-from dvdtoplex.web.app import create_app
+from dvdtoplex.config import Config
+from dvdtoplex.web.app import ORJSONRoute, create_app
 
 
 @pytest.fixture
@@ -20,6 +23,11 @@ def test_create_app_returns_fastapi_instance() -> None:
     assert app.version == "0.1.0"
 
 
+def test_create_app_shares_templates() -> None:
+    """Test that app instances reuse one Jinja2 environment."""
+    assert create_app().state.templates is create_app().state.templates
+
+
 def test_dashboard_route(client: TestClient) -> None:
     """Test the dashboard route returns HTML."""
     response = client.get("/")
@@ -93,3 +101,56 @@ def test_static_files_404_for_missing_file(client: TestClient) -> None:
     """Test that missing static files return 404."""
     response = client.get("/static/nonexistent.css")
     assert response.status_code == 404
+
+
+def test_test_endpoints_registered_without_config(client: TestClient) -> None:
+    """Test that the in-memory demo app exposes the test endpoints."""
+    response = client.post("/api/test/add-wanted", json={"id": 1, "title": "Alien"})
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+def test_test_endpoints_not_registered_by_default_config() -> None:
+    """Test that test endpoints are absent unless enabled in config."""
+    app = create_app(config=Config())
+    paths = {route.path for route in app.routes}
+    assert "/api/test/add-job" not in paths
+    assert "/api/test/add-collection" not in paths
+    assert "/api/test/add-wanted" not in paths
+
+
+def test_test_endpoints_registered_when_enabled() -> None:
+    """Test that enable_test_endpoints registers the test endpoints."""
+    app = create_app(config=Config(enable_test_endpoints=True))
+    paths = {route.path for route in app.routes}
+    assert "/api/test/add-job" in paths
+
+
+def test_test_endpoints_not_registered_for_mock_config() -> None:
+    """Test that a mock config does not switch on the test endpoints."""
+    app = create_app(config=MagicMock())
+    paths = {route.path for route in app.routes}
+    assert "/api/test/add-job" not in paths
+
+
+def test_orjson_route_class_used_when_available() -> None:
+    """Test that API routes decode JSON bodies with orjson when installed."""
+    pytest.importorskip("orjson")
+    app = create_app()
+    api_routes = [route for route in app.routes if route.path == "/api/active-mode"]
+    assert api_routes
+    assert all(isinstance(route, ORJSONRoute) for route in api_routes)
+
+
+def test_orjson_route_parses_json_body(client: TestClient) -> None:
+    """Test that pydantic request bodies still parse through the route class."""
+    response = client.post("/api/active-mode", json={"active_mode": True})
+    assert response.status_code == 200
+    assert response.json()["active_mode"] is True
+
+    response = client.post(
+        "/api/active-mode",
+        content=b"{not json",
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422
@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from dvdtoplex.database import Database, JobStatus
 from dvdtoplex.web.app import create_app
+from tests.conftest import SQLITE_TEST_PRAGMAS
 
 
 @pytest_asyncio.fixture
@@ -16,6 +17,7 @@ async def db(tmp_path: Path) -> Database:
     """Create a test database."""
     database = Database(tmp_path / "test.db")
     await database.connect()
+    await database.connection.executescript(SQLITE_TEST_PRAGMAS)
     yield database
     await database.close()
 
@@ -60,7 +62,6 @@ def client(db: Database) -> TestClient:
 class TestApproveEndpoint:
     """Tests for POST /api/jobs/{job_id}/approve endpoint."""
 
-    @pytest.mark.asyncio
     async def test_approve_job_success(
         self, client: TestClient, job_in_review: int, db: Database
     ) -> None:
@@ -78,7 +79,6 @@ class TestApproveEndpoint:
         assert job is not None
         assert job["status"] == JobStatus.MOVING.value
 
-    @pytest.mark.asyncio
     async def test_approve_job_not_found(self, client: TestClient) -> None:
         """Test approving a non-existent job returns 404."""
         response = client.post("/api/jobs/99999/approve")
@@ -87,7 +87,6 @@ class TestApproveEndpoint:
         data = response.json()
         assert data["detail"] == "Job not found"
 
-    @pytest.mark.asyncio
     async def test_approve_job_wrong_status(
         self, client: TestClient, job_in_pending: int
     ) -> None:
@@ -99,7 +98,6 @@ class TestApproveEndpoint:
         assert "not in REVIEW status" in data["detail"]
         assert "pending" in data["detail"]
 
-    @pytest.mark.asyncio
     async def test_approve_job_preserves_identification(
         self, client: TestClient, job_in_review: int, db: Database
     ) -> None:
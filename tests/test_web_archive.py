@@ -1,6 +1,5 @@
 """Tests for archive job endpoint."""
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock
 from httpx import AsyncClient, ASGITransport
 
@@ -11,7 +10,6 @@ from dvdtoplex.database import JobStatus
 class TestArchiveEndpoint:
     """Tests for POST /api/jobs/{job_id}/archive endpoint."""
 
-    @pytest.mark.asyncio
     async def test_archive_job_success(self):
         """Test archive endpoint marks job as ARCHIVED."""
         mock_db = AsyncMock()
@@ -34,7 +32,6 @@ class TestArchiveEndpoint:
         assert data["status"] == "archived"
         mock_db.update_job_status.assert_called_once_with(1, JobStatus.ARCHIVED)
 
-    @pytest.mark.asyncio
     async def test_archive_failed_job_success(self):
         """Test archive works on failed jobs."""
         mock_db = AsyncMock()
@@ -55,7 +52,6 @@ class TestArchiveEndpoint:
         data = response.json()
         assert data["success"] is True
 
-    @pytest.mark.asyncio
     async def test_archive_job_only_complete_or_failed(self):
         """Test archive only works on COMPLETE or FAILED jobs."""
         mock_db = AsyncMock()
@@ -73,7 +69,6 @@ class TestArchiveEndpoint:
 
         assert response.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_archive_job_not_found(self):
         """Test archive returns 404 when job not found."""
         mock_db = AsyncMock()
@@ -286,3 +286,35 @@ class TestDeleteFromWanted:
         assert "Movie 1" in titles
         assert "Movie 3" in titles
         assert "Movie 2" not in titles
+
+
+class TestGetWantedETag:
+    """Tests for ETag handling on GET /api/wanted."""
+
+    def test_get_wanted_includes_etag(self, client: TestClient) -> None:
+        """Test that the wanted list response carries an ETag header."""
+        response = client.get("/api/wanted")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+
+    def test_get_wanted_not_modified(self, client: TestClient) -> None:
+        """Test that a matching If-None-Match returns 304 with no body."""
+        etag = client.get("/api/wanted").headers["etag"]
+
+        response = client.get("/api/wanted", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_wanted_etag_changes_after_add(self, client: TestClient) -> None:
+        """Test that adding an item invalidates the previous ETag."""
+        etag = client.get("/api/wanted").headers["etag"]
+        client.post("/api/wanted", json={"title": "Alien", "year": 1979})
+
+        response = client.get("/api/wanted", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["items"][0]["title"] == "Alien"